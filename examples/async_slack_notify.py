@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
-import httpx
-
-from cc_hooks import PostToolUseInput, PostToolUseOutput, hook
+from cc_hooks import PostToolUseInput, PostToolUseOutput, hook, outbox
 
 
+# The message is spooled to disk; a background flusher posts it over a kept-alive connection.
 @hook("PostToolUse")
-async def handle(input: PostToolUseInput) -> PostToolUseOutput:
-    async with httpx.AsyncClient() as client:
-        await client.post(
-            "https://hooks.slack.com/services/your/slack/webhook",
-            json={"text": f"Tool {input.tool_name} used in {input.cwd}"},
-        )
+def handle(input: PostToolUseInput) -> PostToolUseOutput:
+    outbox.send(
+        "https://hooks.slack.com/services/your/slack/webhook",
+        {"text": f"Tool {input.tool_name} used in {input.cwd}"},
+    )
     return PostToolUseOutput.ok()
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-from cc_hooks import PostToolUseInput, hook
+from cc_hooks import EventSink, PostToolUseInput, hook
+
+# One JSON line per tool call; parallel hook processes append without interleaving.
+sink = EventSink("/tmp/hook-events.jsonl", max_bytes=1024 * 1024, compress=True, redact=("tool_response",))
 
 
 @hook("PostToolUse")
 def handle(input: PostToolUseInput) -> None:
-    with open("/tmp/hook.log", "a", encoding="utf-8") as f:
-        f.write(f"{input.tool_name}\n")
+    sink.emit(input)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+from cc_hooks import (
+    PostToolUseInput,
+    PreToolUseInput,
+    PreToolUseOutput,
+    StopInput,
+    StopOutput,
+    hook,
+    run,
+)
+
+
+@hook("PreToolUse", tool="Bash")
+def guard_bash(input: PreToolUseInput) -> PreToolUseOutput:
+    bash = input.as_bash_input()
+    if bash and "rm -rf" in bash.command:
+        return PreToolUseOutput.deny(f"Dangerous command blocked: {bash.command}")
+    return PreToolUseOutput.allow()
+
+
+@hook("PreToolUse", tool="Write")
+def guard_write(input: PreToolUseInput) -> PreToolUseOutput:
+    write = input.as_write_input()
+    if write and write.file_path.endswith(".env"):
+        return PreToolUseOutput.deny("Writing .env files is not allowed")
+    return PreToolUseOutput.allow()
+
+
+@hook("PostToolUse")
+def log_tool(input: PostToolUseInput) -> None:
+    return None
+
+
+@hook("Stop")
+def stop(input: StopInput) -> StopOutput:
+    if "TODO" in (input.last_assistant_message or ""):
+        return StopOutput.block("Please resolve TODO before stopping")
+    return StopOutput.ok()
+
+
+if __name__ == "__main__":
+    run()
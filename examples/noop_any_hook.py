@@ -39,6 +39,9 @@ INPUT_MODELS = {
 }
 
 
+# Validates a payload of any event without handling it. This stays outside @hook/run():
+# run() answers events that have no handler with a silent exit 0, while this script
+# must reject unknown events.
 def main() -> int:
     raw = sys.stdin.read()
     payload = json.loads(raw) if raw else {}
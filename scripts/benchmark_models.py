@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+import argparse
+import inspect
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from measure_cold_start import PAYLOADS
+from pydantic import BaseModel
+
+from cc_hooks.models import PostToolUseOutput, PreToolUseOutput
+from cc_hooks.registry import _BUILTIN_TOOL_INPUTS, get_tool_input_model
+from cc_hooks.runner import _resolve_input_model, _resolve_output_model, _to_json, _validate_input
+
+SIZES = {"64KiB": 64 * 1024, "4MiB": 4 * 1024 * 1024}
+EXTRA_FIELDS = 200
+METRICS = ("us_per_call", "alloc_kib")
+
+TOOL_INPUTS: dict[str, dict[str, Any]] = {
+    "Bash": {"command": "echo ok", "description": "print", "timeout": 1000},
+    "Write": {"file_path": "/tmp/a.txt", "content": "x"},
+    "Edit": {"file_path": "/tmp/a.txt", "old_string": "a", "new_string": "b"},
+    "Read": {"file_path": "/tmp/a.txt", "offset": 1, "limit": 10},
+    "Glob": {"pattern": "**/*.py", "path": "/tmp"},
+    "Grep": {"pattern": "TODO", "path": "/tmp", "ignore_case": True},
+    "WebFetch": {"url": "https://example.com", "prompt": "summarize"},
+    "WebSearch": {"query": "pydantic", "recency_days": 7},
+    "Task": {"description": "research", "prompt": "look around", "subagent_type": "general"},
+    "NotebookEdit": {"notebook_path": "/tmp/a.ipynb", "cell_id": "c1", "content": "x"},
+}
+
+# Arguments for Output classmethods, keyed by parameter name.
+OUTPUT_ARGS: dict[str, Any] = {
+    "reason": "blocked by policy",
+    "context": "extra context",
+    "message": "message",
+    "updated_input": {"command": "echo safe"},
+    "updated_output": {"content": "redacted"},
+}
+
+Case = Callable[[], object]
+
+
+def _bulk(event: str, payload: dict[str, Any], size: int) -> dict[str, Any] | None:
+    blob = "x" * size
+    if event == "UserPromptSubmit":
+        return {**payload, "prompt": blob}
+    if "tool_input" not in payload:
+        return None
+    bulky = {**payload, "tool_name": "Write", "tool_input": {"file_path": "/tmp/a.txt", "content": blob}}
+    if event == "PostToolUse":
+        bulky["tool_response"] = {"content": blob}
+    return bulky
+
+
+def _by_alias(model: type[BaseModel], payload: dict[str, Any]) -> dict[str, Any]:
+    fields = model.model_fields
+    return {(fields[key].alias or key) if key in fields else key: value for key, value in payload.items()}
+
+
+def input_cases() -> dict[str, Case]:
+    cases: dict[str, Case] = {}
+    for event, payload in PAYLOADS.items():
+        model = _resolve_input_model(event)
+        alias_payload = _by_alias(model, payload)
+        extra_payload = {**payload, **{f"unknown_field_{i}": {"value": i} for i in range(EXTRA_FIELDS)}}
+        cases[f"input/{event}/name"] = partial(model, **payload)
+        cases[f"input/{event}/alias"] = partial(model, **alias_payload)
+        cases[f"input/{event}/extra"] = partial(model, **extra_payload)
+        cases[f"input/{event}/json"] = partial(_from_json, model, json.dumps(payload).encode())
+        for label, size in SIZES.items():
+            bulky = _bulk(event, payload, size)
+            if bulky is not None:
+                cases[f"input/{event}/json/{label}"] = partial(_from_json, model, json.dumps(bulky).encode())
+
+    for tool in _BUILTIN_TOOL_INPUTS:
+        tool_model = get_tool_input_model(tool)
+        assert tool_model is not None
+        cases[f"tool/{tool}"] = partial(tool_model, **TOOL_INPUTS[tool])
+    write = get_tool_input_model("Write")
+    assert write is not None
+    for label, size in SIZES.items():
+        raw = json.dumps({"file_path": "/tmp/a.txt", "content": "x" * size}).encode()
+        cases[f"tool/Write/json/{label}"] = partial(_from_json, write, raw)
+    return cases
+
+
+def _from_json(model: type[BaseModel], raw: bytes) -> BaseModel:
+    # The runner validates the stdin bytes with the model's JSON validator.
+    return _validate_input(model, raw)
+
+
+def _dump(factory: Callable[..., BaseModel], *args: Any, **kwargs: Any) -> bytes:
+    # The runner's output encoding: the model serializer's to_json.
+    return _to_json(factory(*args, **kwargs))
+
+
+def output_cases() -> dict[str, Case]:
+    cases: dict[str, Case] = {}
+    for event in PAYLOADS:
+        model = _resolve_output_model(event)
+        names = ["stop_session"] + [
+            name for name, attr in vars(model).items() if isinstance(attr, classmethod) and not name.startswith("_")
+        ]
+        for name in names:
+            factory = getattr(model, name)
+            kwargs = {param: OUTPUT_ARGS[param] for param in inspect.signature(factory).parameters}
+            cases[f"output/{model.__name__}.{name}"] = partial(_dump, factory, **kwargs)
+
+    for label, size in SIZES.items():
+        blob = {"file_path": "/tmp/a.txt", "content": "x" * size}
+        cases[f"output/PreToolUseOutput.modify/{label}"] = partial(_dump, PreToolUseOutput.modify, blob)
+        cases[f"output/PostToolUseOutput.update_tool_output/{label}"] = partial(
+            _dump, PostToolUseOutput.update_tool_output, blob
+        )
+    return cases
+
+
+def measure_case(case: Case, repeat: int) -> dict[str, float]:
+    case()
+    timer = timeit.Timer(case)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        case()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"us_per_call": round(best * 1e6, 3), "alloc_kib": round((peak - before) / 1024, 1)}
+
+
+def measure(filters: list[str], repeat: int) -> dict[str, Any]:
+    cases = {**input_cases(), **output_cases()}
+    results = {
+        name: measure_case(case, repeat)
+        for name, case in cases.items()
+        if not filters or any(text in name for text in filters)
+    }
+    return {"python": platform.python_version(), "platform": platform.platform(), "results": results}
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold_pct: float) -> list[str]:
+    regressions: list[str] = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in METRICS:
+            before, now = previous[metric], current[metric]
+            if before and (now - before) / before * 100 > threshold_pct:
+                regressions.append(f"{name} {metric}: {before} -> {now} (+{(now - before) / before * 100:.0f}%)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmark model validation and output serialization.")
+    parser.add_argument("--filter", action="append", default=[], help="Only run cases containing this text")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--save-baseline", type=Path, help="Write results to this baseline file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline file")
+    parser.add_argument("--threshold-pct", type=float, default=25.0, help="Allowed increase per metric in percent")
+    args = parser.parse_args()
+
+    report = measure(args.filter, args.repeat)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, result in report["results"].items():
+            print(f"[bench] {name:<55} {result['us_per_call']:10.2f} us/call {result['alloc_kib']:10.1f} KiB")
+
+    if args.save_baseline is not None:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is not None:
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold_pct)
+        for line in regressions:
+            print(f"[bench] REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,12 @@
 #!/usr/bin/env python3
+import argparse
+import importlib
+import inspect
 import json
+import keyword
+import pkgutil
+import re
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +17,7 @@ import cc_hooks.tools as tools_mod
 
 ROOT = Path(__file__).resolve().parent.parent
 OUT = ROOT / "schemas"
+LITE = ROOT / "src" / "cc_hooks" / "lite"
 
 
 def _iter_model_classes(module: Any):
@@ -19,9 +27,7 @@ def _iter_model_classes(module: Any):
             yield name, obj
 
 
-def main() -> int:
-    OUT.mkdir(parents=True, exist_ok=True)
-
+def write_schemas() -> int:
     model_dir = OUT / "models"
     tool_dir = OUT / "tools"
     model_dir.mkdir(parents=True, exist_ok=True)
@@ -37,10 +43,316 @@ def main() -> int:
         path = tool_dir / f"{name}.schema.json"
         path.write_text(json.dumps(cls.model_json_schema(by_alias=True), ensure_ascii=False, indent=2), encoding="utf-8")
         count += 1
+    return count
+
+
+# --- cc_hooks.lite codegen -------------------------------------------------------
+#
+# Classes come from the schemas alone. Output factories are derived by calling each
+# pydantic factory with marker arguments and mapping the dump back to constructor
+# calls, so both flavors emit the same JSON for the same call.
+
+HEADER = "# Generated by scripts/generate_schemas.py from {source}. Do not edit.\n"
+LINE_LENGTH = 120
+SCALARS = {"string": ("string", "str"), "boolean": ("boolean", "bool"), "integer": ("integer", "int")}
+MARKER = "\0"
+
+
+def _attribute(alias: str) -> str:
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", alias).lower()
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(key)}: {_literal(item)}" for key, item in value.items()) + "}"
+    if isinstance(value, list):
+        return "[" + ", ".join(_literal(item) for item in value) + "]"
+    return repr(value)
+
+
+def _sort_key(name: str) -> tuple[int, str]:
+    # isort's force-sort-by-type order: CONSTANTS, Classes, functions.
+    return (0 if name.isupper() else 1 if name[0].isupper() else 2, name)
+
+
+def _bracketed(indent: str, head: str, items: list[str], tail: str) -> list[str]:
+    flat = f"{indent}{head}{', '.join(items)}{tail}"
+    if len(flat) <= LINE_LENGTH:
+        return [flat]
+    return [f"{indent}{head}", *(f"{indent}    {item}," for item in items), f"{indent}{tail}"]
+
+
+def _import(module: str, names: list[str]) -> list[str]:
+    names = sorted(names, key=_sort_key)
+    flat = f"from {module} import {', '.join(names)}"
+    return [flat] if len(flat) <= LINE_LENGTH else _bracketed("", f"from {module} import (", names, ")")
+
+
+def _all(names: list[str], blank_lines: int = 2) -> list[str]:
+    names = sorted(names, key=_sort_key)
+    return [*[""] * blank_lines, "__all__ = [", *(f"    {_literal(name)}," for name in names), "]"]
+
+
+def _annotation(annotation: str) -> str:
+    # Annotations are evaluated at import, and Any is only imported for type checkers.
+    return _literal(annotation) if "Any" in annotation else annotation
+
+
+def _load(kind: str) -> list[dict[str, Any]]:
+    return [json.loads(path.read_text(encoding="utf-8")) for path in sorted((OUT / kind).glob("*.schema.json"))]
+
+
+class _Call:
+    def __init__(self, name: str, args: list[tuple[str, "str | _Call"]]) -> None:
+        self.name = name
+        self.args = args
+
+    def flat(self) -> str:
+        args = ", ".join(f"{key}={value.flat() if isinstance(value, _Call) else value}" for key, value in self.args)
+        return f"{self.name}({args})"
+
+    def lines(self, indent: str, head: str, tail: str) -> list[str]:
+        flat = f"{indent}{head}{self.flat()}{tail}"
+        if len(flat) <= LINE_LENGTH:
+            return [flat]
+        lines = [f"{indent}{head}{self.name}("]
+        for key, value in self.args:
+            if isinstance(value, _Call):
+                lines += value.lines(indent + "    ", f"{key}=", ",")
+            else:
+                lines.append(f"{indent}    {key}={value},")
+        return [*lines, f"{indent}){tail}"]
 
+
+class _Module:
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self.classes: dict[str, list[str]] = {}
+        self.schemas: dict[str, dict[str, Any]] = {}
+        self.runtime: set[str] = {"LiteModel"}
+        self.uses_any = False
+
+    def converter(self, prop: dict[str, Any], defs: dict[str, Any]) -> tuple[str, str]:
+        if "anyOf" in prop:
+            options = [option for option in prop["anyOf"] if option.get("type") != "null"]
+            if len(options) != 1:
+                raise ValueError(f"unsupported union: {prop}")
+            expr, annotation = self.converter(options[0], defs)
+            if len(options) == len(prop["anyOf"]):
+                return expr, annotation
+            self.runtime.add("optional")
+            return f"optional({expr})", f"{annotation} | None"
+        if "$ref" in prop:
+            name = prop["$ref"].rsplit("/", 1)[-1]
+            if "properties" not in defs[name]:
+                return self.converter(defs[name], defs)
+            self.add_class(name, defs[name], defs)
+            self.runtime.add("model")
+            return f"model({name})", name
+        if "const" in prop or "enum" in prop:
+            self.runtime.add("literal")
+            values = [prop["const"]] if "const" in prop else prop["enum"]
+            return f"literal({', '.join(_literal(value) for value in values)})", "str"
+        kind = prop.get("type")
+        if kind in SCALARS:
+            self.runtime.add(SCALARS[kind][0])
+            return SCALARS[kind]
+        if kind == "object":
+            self.runtime.add("obj")
+            return "obj", "dict[str, Any]"
+        if kind == "array":
+            expr, annotation = self.converter(prop.get("items", {}), defs)
+            self.runtime.add("array")
+            return f"array({expr})", f"list[{annotation}]"
+        if kind is None:
+            self.runtime.add("any_value")
+            return "any_value", "Any"
+        raise ValueError(f"unsupported schema: {prop}")
+
+    def add_class(self, name: str, schema: dict[str, Any], defs: dict[str, Any], bases: str = "LiteModel") -> None:
+        if name in self.schemas:
+            if self.schemas[name] != schema:
+                raise ValueError(f"{name} is defined differently in two schemas")
+            return
+        self.schemas[name] = schema
+        required = set(schema.get("required", ()))
+        fields: list[tuple[str, str, str, str, str]] = []
+        for alias, prop in schema["properties"].items():
+            expr, annotation = self.converter(prop, defs)
+            if alias in required:
+                self.runtime.add("REQUIRED")
+            default = "REQUIRED" if alias in required else _literal(prop.get("default"))
+            fields.append((_attribute(alias), alias, expr, default, annotation))
+
+        slots = sorted(_literal(attr) for attr, *_ in fields)
+        lines = [f"class {name}({bases}):"]
+        if len(slots) == 1:
+            lines.append(f"    __slots__ = ({slots[0]},)")
+        else:
+            lines += _bracketed("    ", "__slots__ = (", slots, ")")
+        lines.append("    _fields = (")
+        for attr, alias, expr, default, _ in fields:
+            lines += _bracketed("        ", "(", [_literal(attr), _literal(alias), expr, default], "),")
+        lines += ["    )", ""]
+        lines += [f"    {attr}: {_annotation(annotation)}" for attr, _, _, _, annotation in fields]
+        self.uses_any = self.uses_any or any("Any" in field[4] for field in fields)
+        self.classes[name] = lines
+
+    def render(self, imports: list[str], tail: list[str]) -> str:
+        lines = [HEADER.format(source=self.source), *_import("cc_hooks.lite._runtime", sorted(self.runtime)), *imports]
+        if self.uses_any:
+            lines += ["", "TYPE_CHECKING = False", "", "if TYPE_CHECKING:", "    from typing import Any"]
+        for body in self.classes.values():
+            lines += ["", "", *body]
+        return "\n".join([*lines, *tail]) + "\n"
+
+
+def _pydantic_classes(package: Any) -> dict[str, type[BaseModel]]:
+    found: dict[str, type[BaseModel]] = {}
+    for info in pkgutil.iter_modules(package.__path__):
+        module = importlib.import_module(f"{package.__name__}.{info.name}")
+        for name, obj in vars(module).items():
+            if isinstance(obj, type) and issubclass(obj, BaseModel):
+                found.setdefault(name, obj)
+    return found
+
+
+def _check_fields(lite: _Module, package: Any) -> None:
+    # Lite attribute names are derived from the aliases; they must match pydantic's.
+    classes = _pydantic_classes(package)
+    for name, schema in lite.schemas.items():
+        expected = sorted(classes[name].model_fields)
+        actual = sorted(_attribute(alias) for alias in schema["properties"])
+        if expected != actual:
+            raise ValueError(f"{name}: lite fields {actual} do not match {expected}")
+
+
+def _to_call(name: str, dumped: dict[str, Any], lite: _Module, params: set[str]) -> _Call:
+    properties = lite.schemas[name]["properties"]
+    args: list[tuple[str, str | _Call]] = []
+    for alias, value in dumped.items():
+        prop = properties[alias]
+        if value == prop.get("default"):
+            continue
+        refs = [ref for ref in re.findall(r"#/\$defs/(\w+)", json.dumps(prop)) if ref in lite.schemas]
+        if isinstance(value, str) and value.startswith(MARKER) and value[1:] in params:
+            source: str | _Call = value[1:]
+        elif isinstance(value, dict) and value.keys() == {MARKER} and value[MARKER] in params:
+            source = value[MARKER]
+        elif isinstance(value, dict) and refs:
+            source = _to_call(refs[0], value, lite, params)
+        elif MARKER in json.dumps(value):
+            raise ValueError(f"{name}.{alias}: factory transforms its arguments")
+        else:
+            source = _literal(value)
+        args.append((_attribute(alias), source))
+    return _Call(name, args)
+
+
+def _factories(model: type[BaseModel], lite: _Module) -> list[str]:
+    names = ["stop_session"] + [
+        name for name, attr in vars(model).items() if isinstance(attr, classmethod) and not name.startswith("_")
+    ]
+    lines: list[str] = []
+    for name in names:
+        factory = getattr(model, name)
+        parameters = inspect.signature(factory).parameters.values()
+        params = ["cls"]
+        markers: dict[str, Any] = {}
+        for param in parameters:
+            annotation = inspect.formatannotation(param.annotation).replace("typing.", "")
+            default = "" if param.default is inspect.Parameter.empty else f" = {_literal(param.default)}"
+            params.append(f"{param.name}: {_annotation(annotation)}{default}")
+            markers[param.name] = {MARKER: param.name} if annotation.startswith("dict") else MARKER + param.name
+        dumped = factory(**markers).model_dump(mode="json", by_alias=True, exclude_none=True)
+        call = _to_call(model.__name__, dumped, lite, set(markers))
+        call.name = "cls"
+        lines += ["", "    @classmethod"]
+        lines += _bracketed("    ", f"def {name}(", params, f') -> "{model.__name__}":')
+        lines += call.lines("        ", "return ", "")
+    return lines
+
+
+def generate_lite() -> dict[Path, str]:
+    tools = _Module("schemas/tools/*.schema.json")
+    tool_names: dict[str, str] = {}
+    for schema in _load("tools"):
+        tools.add_class(schema["title"], schema, schema.get("$defs", {}))
+        tool_names[schema["title"]] = schema["title"].removesuffix("Input")
+    _check_fields(tools, tools_mod)
+
+    models = _Module("schemas/models/*.schema.json")
+    mixin = ["class ToolInputParsingMixin(ToolInputMixin):", "    __slots__ = ()"]
+    for cls, tool in tool_names.items():
+        mixin += [
+            "",
+            f'    def as_{_attribute(tool)}_input(self) -> "{cls} | None":',
+            f"        return self.as_tool_input({cls}) if self.tool_name == {_literal(tool)} else None",
+        ]
+    models.classes["ToolInputParsingMixin"] = mixin
+    models.runtime.add("ToolInputMixin")
+
+    schemas = _load("models")
+    events: list[str] = []
+    for schema in schemas:
+        title = schema["title"]
+        bases = "LiteModel"
+        if title.endswith("Input"):
+            events.append(title.removesuffix("Input"))
+            if {"toolName", "toolInput"} <= schema["properties"].keys():
+                bases = "ToolInputParsingMixin, LiteModel"
+        models.add_class(title, schema, schema.get("$defs", {}), bases)
+    _check_fields(models, models_mod)
+    for schema in schemas:
+        if schema["title"].endswith("Output"):
+            models.classes[schema["title"]] += _factories(getattr(models_mod, schema["title"]), models)
+
+    model_names = sorted(models.schemas)
+    input_map = ["", "", 'INPUT_MODELS: "dict[str, type[LiteModel]]" = {']
+    input_map += [f"    {_literal(event)}: {event}Input," for event in events]
+    input_map.append("}")
+    tool_import = _import("cc_hooks.lite.tools", list(tool_names))
+    package = [
+        HEADER.format(source="schemas/"),
+        *_import("cc_hooks.lite._runtime", ["LiteModel", "ValidationError"]),
+        *_import("cc_hooks.lite.models", ["INPUT_MODELS", *model_names]),
+        *_import("cc_hooks.lite.runner", ["hook", "run"]),
+        *tool_import,
+        *_all(["hook", "run", "LiteModel", "ValidationError", "INPUT_MODELS", *model_names, *tool_names], 1),
+    ]
+    return {
+        LITE / "tools.py": tools.render([], _all(list(tools.schemas))),
+        LITE / "models.py": models.render(tool_import, input_map + _all(["INPUT_MODELS", *model_names], 1)),
+        LITE / "__init__.py": "\n".join(package) + "\n",
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate JSON schemas and the cc_hooks.lite models built from them.")
+    parser.add_argument("--check", action="store_true", help="Fail if cc_hooks.lite is out of date with schemas/")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = [path for path, source in generate_lite().items() if _read(path) != source]
+        for path in stale:
+            print(f"[schema] {path.relative_to(ROOT)} is out of date; run scripts/generate_schemas.py", file=sys.stderr)
+        return 1 if stale else 0
+
+    OUT.mkdir(parents=True, exist_ok=True)
+    count = write_schemas()
     print(f"[schema] generated {count} schema files under {OUT}")
+    for path, source in generate_lite().items():
+        path.write_text(source, encoding="utf-8")
+    print(f"[schema] generated cc_hooks.lite under {LITE}")
     return 0
 
 
+def _read(path: Path) -> str | None:
+    return path.read_text(encoding="utf-8") if path.exists() else None
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+
+PHASES = ("interpreter", "import", "parse", "handler", "serialize", "exit")
+METRICS = ("p50", "p95", "p99")
+# Packages and modules with the most import time kept in a report.
+TOP_IMPORTS = 10
+# Allowed growth of each median over the baseline, in percent. Sub-millisecond phases
+# vary more from run to run than start-up and imports do.
+TOLERANCE_PCT = {
+    "p50": 10.0,
+    "interpreter": 15.0,
+    "import": 10.0,
+    "parse": 25.0,
+    "handler": 50.0,
+    "serialize": 50.0,
+    "exit": 25.0,
+}
+# Growth below this is timer noise whatever the ratio.
+NOISE_MS = 1.0
+
+# A single-handler @hook script dispatched by the real runner, like the ones in
+# examples/. The handler marks when the runner hands it the parsed input and when it
+# returns; an atexit hook reports the marks (monotonic ns) on stderr once the runner
+# has written the output and raised SystemExit.
+HOOK_SCRIPT = """\
+import time
+marks = [time.monotonic_ns()]
+import atexit, sys
+from cc_hooks import {event}Input, {event}Output, hook, run
+atexit.register(lambda: sys.stderr.write(" ".join(map(str, [*marks, time.monotonic_ns()]))))
+
+@hook("{event}")
+def handler(input: {event}Input) -> {event}Output:
+    marks.append(time.monotonic_ns())
+    result = {event}Output()
+    marks.append(time.monotonic_ns())
+    return result
+
+marks.append(time.monotonic_ns())
+run()
+"""
+
+IMPORT_SCRIPT = "from cc_hooks import {event}Input, {event}Output, hook, run"
+
+# The same script with the generated pydantic-free models and runner (--lite).
+LITE_HOOK_SCRIPT = HOOK_SCRIPT.replace("from cc_hooks import", "from cc_hooks.lite import")
+
+LITE_IMPORT_SCRIPT = "from cc_hooks.lite import {event}Input, {event}Output, hook, run"
+
+
+def _base(event: str) -> dict[str, Any]:
+    return {
+        "session_id": f"cold_{event}",
+        "transcript_path": "/tmp/cold.jsonl",
+        "cwd": "/tmp",
+        "permission_mode": "default",
+        "hook_event_name": event,
+    }
+
+
+PAYLOADS: dict[str, dict[str, Any]] = {
+    "SessionStart": {**_base("SessionStart"), "source": "startup", "model": "sonnet"},
+    "SessionEnd": {**_base("SessionEnd"), "reason": "clear"},
+    "UserPromptSubmit": {**_base("UserPromptSubmit"), "prompt": "hello"},
+    "PreToolUse": {
+        **_base("PreToolUse"),
+        "tool_name": "Bash",
+        "tool_input": {"command": "echo ok"},
+        "tool_use_id": "toolu_pre",
+    },
+    "PostToolUse": {
+        **_base("PostToolUse"),
+        "tool_name": "Read",
+        "tool_input": {"file_path": "/tmp/a.txt"},
+        "tool_response": {"content": "x"},
+        "tool_use_id": "toolu_post",
+    },
+    "PostToolUseFailure": {
+        **_base("PostToolUseFailure"),
+        "tool_name": "Read",
+        "tool_input": {"file_path": "/tmp/a.txt"},
+        "tool_use_id": "toolu_fail",
+        "error": "boom",
+    },
+    "PermissionRequest": {
+        **_base("PermissionRequest"),
+        "tool_name": "Bash",
+        "tool_input": {"command": "echo ok"},
+    },
+    "Notification": {**_base("Notification"), "message": "hello", "notification_type": "info"},
+    "SubagentStart": {**_base("SubagentStart"), "agent_id": "a1", "agent_type": "researcher"},
+    "SubagentStop": {
+        **_base("SubagentStop"),
+        "stop_hook_active": True,
+        "agent_id": "a1",
+        "agent_type": "researcher",
+        "agent_transcript_path": "/tmp/a1.jsonl",
+    },
+    "Stop": {**_base("Stop"), "stop_hook_active": True},
+    "TeammateIdle": {**_base("TeammateIdle"), "teammate_name": "alice", "team_name": "red"},
+    "TaskCompleted": {**_base("TaskCompleted"), "task_id": "t1", "task_subject": "task"},
+    "ConfigChange": {**_base("ConfigChange"), "source": "user"},
+    "PreCompact": {**_base("PreCompact"), "trigger": "auto", "custom_instructions": "summarize"},
+}
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")]))}
+
+
+def _run_once(event: str, env: dict[str, str], lite: bool = False) -> tuple[float, dict[str, float]]:
+    script = (LITE_HOOK_SCRIPT if lite else HOOK_SCRIPT).format(event=event)
+    start = time.monotonic_ns()
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        input=json.dumps(PAYLOADS[event]),
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    end = time.monotonic_ns()
+    if result.returncode != 0:
+        raise RuntimeError(f"{event}: exit={result.returncode} stderr={result.stderr!r}")
+
+    # Script start, imports done (handler registered), handler entered, handler returned,
+    # output written.
+    marks = [start, *map(int, result.stderr.split()), end]
+    phases = {name: (marks[i + 1] - marks[i]) / 1e6 for i, name in enumerate(PHASES)}
+    return (end - start) / 1e6, phases
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    if len(samples) == 1:
+        return dict.fromkeys(METRICS, samples[0])
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+def parse_importtime(stderr: str) -> dict[str, float]:
+    self_ms: dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, _cumulative, module = line[len("import time:") :].split("|")
+        self_ms[module.strip()] = int(own) / 1000
+    return self_ms
+
+
+def import_times(event: str, env: dict[str, str], lite: bool = False) -> dict[str, float]:
+    script = (LITE_IMPORT_SCRIPT if lite else IMPORT_SCRIPT).format(event=event)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def by_package(modules: dict[str, float]) -> dict[str, float]:
+    packages: dict[str, float] = {}
+    for module, ms in modules.items():
+        package = module.split(".", 1)[0]
+        packages[package] = packages.get(package, 0.0) + ms
+    return {name: round(ms, 2) for name, ms in sorted(packages.items(), key=lambda item: -item[1])}
+
+
+def measure(events: list[str], runs: int, lite: bool = False) -> dict[str, Any]:
+    env = _env()
+    results: dict[str, Any] = {}
+    for event in events:
+        _run_once(event, env, lite)
+        samples = [_run_once(event, env, lite) for _ in range(runs)]
+        modules = import_times(event, env, lite)
+        results[event] = {
+            **{name: round(value, 2) for name, value in percentiles([total for total, _ in samples]).items()},
+            "phases": {name: round(statistics.median(phases[name] for _, phases in samples), 2) for name in PHASES},
+            "imports": dict(list(by_package(modules).items())[:TOP_IMPORTS]),
+            "slowest_modules": dict(sorted(modules.items(), key=lambda item: -item[1])[:TOP_IMPORTS]),
+        }
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "models": "lite" if lite else "pydantic",
+        "events": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance_pct: dict[str, float]) -> list[str]:
+    regressions: list[str] = []
+    for event, current in report["events"].items():
+        previous = baseline.get("events", {}).get(event)
+        if previous is None:
+            continue
+        checks = [("p50", current["p50"], previous["p50"])]
+        checks += [(name, current["phases"][name], previous["phases"].get(name, 0.0)) for name in PHASES]
+        for name, now, before in checks:
+            if now - before > max(before * tolerance_pct[name] / 100, NOISE_MS):
+                regressions.append(
+                    f"{event} {name}: {before:.1f} -> {now:.1f} ms (+{now - before:.1f}, limit {tolerance_pct[name]:g}%)"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark per-event cold start of a single @hook script.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--event", action="append", choices=sorted(PAYLOADS), help="Limit to these events")
+    parser.add_argument("--lite", action="store_true", help="Use the pydantic-free cc_hooks.lite models")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--save-baseline", type=Path, help="Write results to this baseline file")
+    parser.add_argument("--baseline", type=Path, help="Compare against this baseline file")
+    parser.add_argument(
+        "--threshold-pct", type=float, help="Allowed p50 increase in percent for every phase (default: per phase)"
+    )
+    args = parser.parse_args()
+
+    report = measure(args.event or list(PAYLOADS), args.runs, args.lite)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for event, result in report["events"].items():
+            phases = " ".join(f"{name}={ms:.1f}" for name, ms in result["phases"].items())
+            imports = " ".join(f"{name}={ms:.1f}" for name, ms in list(result["imports"].items())[:4])
+            print(
+                f"[cold-start] {event:<20} p50={result['p50']:7.1f} p95={result['p95']:7.1f} "
+                f"p99={result['p99']:7.1f} ms | {phases} | imports: {imports}"
+            )
+
+    if args.save_baseline is not None:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline is not None:
+        tolerance = TOLERANCE_PCT if args.threshold_pct is None else dict.fromkeys(TOLERANCE_PCT, args.threshold_pct)
+        regressions = compare(report, json.loads(args.baseline.read_text(encoding="utf-8")), tolerance)
+        for line in regressions:
+            print(f"[cold-start] REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
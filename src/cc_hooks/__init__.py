@@ -1,66 +1,200 @@
+from importlib import import_module
+
 from cc_hooks.__about__ import __version__
-from cc_hooks.enums import (
-    BuiltinToolName,
-    ConfigChangeSource,
-    HookEvent,
-    NotificationType,
-    PermissionMode,
-    PermissionDecision,
-    PreCompactTrigger,
-    SessionEndReason,
-    SessionStartSource,
-)
-from cc_hooks.models import (
-    ConfigChangeInput,
-    ConfigChangeOutput,
-    NotificationInput,
-    NotificationOutput,
-    PermissionRequestInput,
-    PermissionRequestOutput,
-    PostToolUseFailureInput,
-    PostToolUseFailureOutput,
-    PostToolUseInput,
-    PostToolUseOutput,
-    PreCompactInput,
-    PreCompactOutput,
-    PreToolUseInput,
-    PreToolUseOutput,
-    SessionEndInput,
-    SessionEndOutput,
-    SessionStartInput,
-    SessionStartOutput,
-    StopInput,
-    StopOutput,
-    SubagentStartInput,
-    SubagentStartOutput,
-    SubagentStopInput,
-    SubagentStopOutput,
-    TaskCompletedInput,
-    TaskCompletedOutput,
-    TeammateIdleInput,
-    TeammateIdleOutput,
-    UserPromptSubmitInput,
-    UserPromptSubmitOutput,
-)
-from cc_hooks.registry import register_tool_input
-from cc_hooks.runner import hook
-from cc_hooks.tools import (
-    BashInput,
-    EditInput,
-    GlobInput,
-    GrepInput,
-    NotebookEditInput,
-    ReadInput,
-    TaskInput,
-    WebFetchInput,
-    WebSearchInput,
-    WriteInput,
-)
+
+# Spelled out instead of imported from typing: `python -m cc_hooks.client` imports
+# this package on every hook invocation and should not pay for `typing`.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from cc_hooks.enums import (
+        BuiltinToolName,
+        ConfigChangeSource,
+        HookEvent,
+        NotificationType,
+        PermissionDecision,
+        PermissionMode,
+        PreCompactTrigger,
+        SessionEndReason,
+        SessionStartSource,
+    )
+    from cc_hooks.models import (
+        ConfigChangeInput,
+        ConfigChangeOutput,
+        NotificationInput,
+        NotificationOutput,
+        PermissionRequestInput,
+        PermissionRequestOutput,
+        PostToolUseFailureInput,
+        PostToolUseFailureOutput,
+        PostToolUseInput,
+        PostToolUseOutput,
+        PreCompactInput,
+        PreCompactOutput,
+        PreToolUseInput,
+        PreToolUseOutput,
+        SessionEndInput,
+        SessionEndOutput,
+        SessionStartInput,
+        SessionStartOutput,
+        StopInput,
+        StopOutput,
+        SubagentStartInput,
+        SubagentStartOutput,
+        SubagentStopInput,
+        SubagentStopOutput,
+        TaskCompletedInput,
+        TaskCompletedOutput,
+        TeammateIdleInput,
+        TeammateIdleOutput,
+        UserPromptSubmitInput,
+        UserPromptSubmitOutput,
+    )
+    from cc_hooks.background import HookContext, hook_context
+    from cc_hooks.breaker import enable_breaker
+    from cc_hooks.chain import chain_order, enable_chain
+    from cc_hooks.context import context_estimate, enable_context_tracker
+    from cc_hooks.deadlines import enable_deadlines
+    from cc_hooks.digest import enable_session_digest, session_digest
+    from cc_hooks.lazy import enable_lazy_fields
+    from cc_hooks.memo import cached
+    from cc_hooks.merge import merge_outputs
+    from cc_hooks.rollup import enable_subagent_rollup, subagent_summary
+    from cc_hooks.sink import EventSink
+    from cc_hooks.state import enable_session_state, session_state
+    from cc_hooks.transcript import Transcript
+    from cc_hooks.registry import register_tool_input
+    from cc_hooks.runner import hook, run
+    from cc_hooks.schema_cache import enable_schema_cache
+    from cc_hooks.tools import (
+        BashInput,
+        EditInput,
+        GlobInput,
+        GrepInput,
+        NotebookEditInput,
+        ReadInput,
+        TaskInput,
+        WebFetchInput,
+        WebSearchInput,
+        WriteInput,
+    )
+
+_LAZY_ATTRS: dict[str, str] = {
+    "hook": "cc_hooks.runner",
+    "run": "cc_hooks.runner",
+    "register_tool_input": "cc_hooks.registry",
+    "enable_schema_cache": "cc_hooks.schema_cache",
+    "enable_lazy_fields": "cc_hooks.lazy",
+    "merge_outputs": "cc_hooks.merge",
+    "enable_chain": "cc_hooks.chain",
+    "chain_order": "cc_hooks.chain",
+    "enable_deadlines": "cc_hooks.deadlines",
+    "hook_context": "cc_hooks.background",
+    "enable_breaker": "cc_hooks.breaker",
+    "EventSink": "cc_hooks.sink",
+    "cached": "cc_hooks.memo",
+    "Transcript": "cc_hooks.transcript",
+    "session_state": "cc_hooks.state",
+    "enable_session_state": "cc_hooks.state",
+    "enable_session_digest": "cc_hooks.digest",
+    "session_digest": "cc_hooks.digest",
+    "enable_context_tracker": "cc_hooks.context",
+    "context_estimate": "cc_hooks.context",
+    "enable_subagent_rollup": "cc_hooks.rollup",
+    "subagent_summary": "cc_hooks.rollup",
+    "HookContext": "cc_hooks.background",
+    "HookEvent": "cc_hooks.enums",
+    "PermissionMode": "cc_hooks.enums",
+    "PermissionDecision": "cc_hooks.enums",
+    "BuiltinToolName": "cc_hooks.enums",
+    "NotificationType": "cc_hooks.enums",
+    "ConfigChangeSource": "cc_hooks.enums",
+    "PreCompactTrigger": "cc_hooks.enums",
+    "SessionStartSource": "cc_hooks.enums",
+    "SessionEndReason": "cc_hooks.enums",
+    "SessionStartInput": "cc_hooks.models.session_start",
+    "SessionStartOutput": "cc_hooks.models.session_start",
+    "SessionEndInput": "cc_hooks.models.session_end",
+    "SessionEndOutput": "cc_hooks.models.session_end",
+    "UserPromptSubmitInput": "cc_hooks.models.user_prompt_submit",
+    "UserPromptSubmitOutput": "cc_hooks.models.user_prompt_submit",
+    "PreToolUseInput": "cc_hooks.models.pre_tool_use",
+    "PreToolUseOutput": "cc_hooks.models.pre_tool_use",
+    "PostToolUseInput": "cc_hooks.models.post_tool_use",
+    "PostToolUseOutput": "cc_hooks.models.post_tool_use",
+    "PostToolUseFailureInput": "cc_hooks.models.post_tool_use_failure",
+    "PostToolUseFailureOutput": "cc_hooks.models.post_tool_use_failure",
+    "PermissionRequestInput": "cc_hooks.models.permission_request",
+    "PermissionRequestOutput": "cc_hooks.models.permission_request",
+    "NotificationInput": "cc_hooks.models.notification",
+    "NotificationOutput": "cc_hooks.models.notification",
+    "SubagentStartInput": "cc_hooks.models.subagent_start",
+    "SubagentStartOutput": "cc_hooks.models.subagent_start",
+    "SubagentStopInput": "cc_hooks.models.subagent_stop",
+    "SubagentStopOutput": "cc_hooks.models.subagent_stop",
+    "StopInput": "cc_hooks.models.stop",
+    "StopOutput": "cc_hooks.models.stop",
+    "TeammateIdleInput": "cc_hooks.models.teammate_idle",
+    "TeammateIdleOutput": "cc_hooks.models.teammate_idle",
+    "TaskCompletedInput": "cc_hooks.models.task_completed",
+    "TaskCompletedOutput": "cc_hooks.models.task_completed",
+    "ConfigChangeInput": "cc_hooks.models.config_change",
+    "ConfigChangeOutput": "cc_hooks.models.config_change",
+    "PreCompactInput": "cc_hooks.models.pre_compact",
+    "PreCompactOutput": "cc_hooks.models.pre_compact",
+    "BashInput": "cc_hooks.tools.bash",
+    "WriteInput": "cc_hooks.tools.write",
+    "EditInput": "cc_hooks.tools.edit",
+    "ReadInput": "cc_hooks.tools.read",
+    "GlobInput": "cc_hooks.tools.glob",
+    "GrepInput": "cc_hooks.tools.grep",
+    "WebFetchInput": "cc_hooks.tools.web_fetch",
+    "WebSearchInput": "cc_hooks.tools.web_search",
+    "TaskInput": "cc_hooks.tools.task",
+    "NotebookEditInput": "cc_hooks.tools.notebook_edit",
+}
+
+
+def __getattr__(name: str) -> "Any":
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "__version__",
     "hook",
+    "run",
     "register_tool_input",
+    "enable_schema_cache",
+    "enable_lazy_fields",
+    "merge_outputs",
+    "enable_chain",
+    "chain_order",
+    "enable_deadlines",
+    "hook_context",
+    "enable_breaker",
+    "EventSink",
+    "cached",
+    "Transcript",
+    "session_state",
+    "enable_session_state",
+    "enable_session_digest",
+    "session_digest",
+    "enable_context_tracker",
+    "context_estimate",
+    "enable_subagent_rollup",
+    "subagent_summary",
+    "HookContext",
     "HookEvent",
     "PermissionMode",
     "PermissionDecision",
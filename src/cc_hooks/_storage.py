@@ -0,0 +1,80 @@
+import fcntl
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_connections: dict[tuple[int, int, Path], "sqlite3.Connection"] = {}
+
+
+def state_home() -> Path:
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(os.path.expanduser("~"), ".local", "state")
+    return Path(base) / "cc-hooks"
+
+
+def cache_home() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "cc-hooks"
+
+
+def connect(path: Path, schema: str) -> "sqlite3.Connection":
+    # One connection per process, thread and database: a forked child opens its own,
+    # and handlers running on concurrent threads never share a transaction.
+    key = (os.getpid(), threading.get_ident(), path)
+    db = _connections.get(key)
+    if db is None:
+        import sqlite3
+
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # SQLite gives the -wal and -shm files the database's mode.
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        db = sqlite3.connect(path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(schema)
+        _connections[key] = db
+    return db
+
+
+@contextmanager
+def locked_json(path: Path) -> Iterator[dict[str, Any]]:
+    # A JSON object shared by every hook process; changes are written back on exit.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        f.seek(0)
+        try:
+            data = json.loads(f.read() or b"{}")
+        except ValueError:
+            data = {}
+        state: dict[str, Any] = data if isinstance(data, dict) else {}
+        yield state
+        f.seek(0)
+        f.truncate()
+        f.write(json.dumps(state, separators=(",", ":")).encode())
+
+
+def owned(path: Path, forbidden: int) -> bool:
+    # Files that are unpickled must belong to this user and not be writable by others.
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_uid == os.getuid() and stat.st_mode & forbidden == 0
+
+
+def remove_stale(directory: Path, pattern: str, max_age: float) -> None:
+    cutoff = time.time() - max_age
+    try:
+        for path in directory.glob(pattern):
+            if path.stat().st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+    except OSError:
+        pass
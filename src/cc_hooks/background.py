@@ -0,0 +1,112 @@
+import inspect
+import os
+import sys
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+ENV_TIMEOUT = "CC_HOOKS_BACKGROUND_TIMEOUT"
+ENV_LOG = "CC_HOOKS_BACKGROUND_LOG"
+DEFAULT_TIMEOUT = 60.0
+
+Task = Callable[[], Any]
+
+
+class HookContext:
+    __slots__ = ("event", "tasks")
+
+    def __init__(self, event: str) -> None:
+        self.event = event
+        self.tasks: list[Task] = []
+
+    def defer(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> None:
+        # Runs after the hook output is written and the agent has moved on.
+        self.tasks.append(partial(fn, *args, **kwargs))
+
+
+_current: HookContext | None = None
+
+
+def hook_context() -> HookContext:
+    if _current is None:
+        raise RuntimeError("hook_context() is only available while a hook handler runs")
+    return _current
+
+
+def begin(event: str) -> HookContext:
+    global _current
+    _current = HookContext(event)
+    return _current
+
+
+def take_tasks() -> list[Task]:
+    global _current
+    tasks = _current.tasks if _current is not None else []
+    _current = None
+    return tasks
+
+
+def spawn(tasks: list[Task]) -> None:
+    # Double fork: the hook process returns (and exits) right away, and the detached
+    # grandchild runs the tasks with stdio on /dev/null, so Claude Code sees EOF on
+    # the pipes as soon as the hook process is gone.
+    if not tasks:
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if not hasattr(os, "fork"):
+        run_tasks(tasks)
+        return
+    child = os.fork()
+    if child:
+        os.waitpid(child, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        _redirect_stdio()
+        run_tasks(tasks)
+    finally:
+        os._exit(0)
+
+
+def run_tasks(tasks: list[Task], timeout: float | None = None) -> None:
+    import asyncio
+
+    from cc_hooks.deadlines import in_daemon_thread
+
+    if timeout is None:
+        timeout = float(os.environ.get(ENV_TIMEOUT) or DEFAULT_TIMEOUT)
+
+    async def gather() -> list[Any]:
+        calls = [task() if inspect.iscoroutinefunction(task) else in_daemon_thread(task, _name(task)) for task in tasks]
+        return await asyncio.gather(*calls, return_exceptions=True)
+
+    try:
+        results = asyncio.run(asyncio.wait_for(gather(), timeout))
+    except TimeoutError:
+        sys.stderr.write(f"cc-hooks: background tasks did not finish within {timeout:g}s\n")
+        return
+    for task, result in zip(tasks, results, strict=True):
+        if isinstance(result, BaseException):
+            import traceback
+
+            sys.stderr.write(f"cc-hooks: background task {_name(task)} failed\n")
+            traceback.print_exception(result, file=sys.stderr)
+
+
+def _name(task: Task) -> str:
+    return str(getattr(getattr(task, "func", task), "__name__", "task"))
+
+
+def _redirect_stdio() -> None:
+    null = os.open(os.devnull, os.O_RDWR)
+    log = os.environ.get(ENV_LOG)
+    err = os.open(log, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600) if log else null
+    os.dup2(null, 0)
+    os.dup2(null, 1)
+    os.dup2(err, 2)
+
+
+__all__ = ["HookContext", "hook_context"]
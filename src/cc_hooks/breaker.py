@@ -0,0 +1,189 @@
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from cc_hooks import deadlines
+from cc_hooks._storage import locked_json, remove_stale, state_home
+from cc_hooks.chain import handler_id
+
+ENV_VAR = "CC_HOOKS_BREAKER"
+# Per-session state files untouched for this long are removed when a session starts.
+STALE_AFTER = 7 * 24 * 3600.0
+
+Handler = Callable[[Any], Any]
+# Handler id -> {"state": "closed" | "open" | "half_open", "failures": [...], "since": t}.
+State = dict[str, dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    failures: int
+    window: float
+    cooldown: float
+    state_dir: Path
+
+
+_policy: BreakerPolicy | None = None
+
+
+def default_state_dir() -> Path:
+    return state_home() / "breakers"
+
+
+def enable_breaker(
+    failures: int = 3,
+    window: float = 60.0,
+    cooldown: float = 300.0,
+    state_dir: str | os.PathLike[str] | None = None,
+) -> BreakerPolicy:
+    global _policy
+    _policy = BreakerPolicy(
+        failures, window, cooldown, Path(state_dir) if state_dir is not None else default_state_dir()
+    )
+    return _policy
+
+
+def disable_breaker() -> None:
+    global _policy
+    _policy = None
+
+
+def breaker_policy() -> BreakerPolicy | None:
+    return _policy
+
+
+class Breakers:
+    # The breaker state of one session's handlers. Decisions are read without a lock;
+    # transitions re-read and write the file under flock, so concurrent hook processes
+    # of the session agree on which one probes a half-open handler.
+
+    def __init__(self, policy: BreakerPolicy, event: str, session_id: str) -> None:
+        project = os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+        digest = hashlib.sha256(f"{project}\0{session_id}".encode()).hexdigest()[:24]
+        self.policy = policy
+        self.event = event
+        self.path = policy.state_dir / f"{digest}.json"
+        self.state = self._read()
+        self.allowed: set[Handler] = set()
+        self.notes: list[str] = []
+
+    def allow(self, fn: Handler) -> bool:
+        key = handler_id(self.event, fn)
+        entry = self.state.get(key)
+        if entry is None or entry["state"] == "closed":
+            allowed = True
+        elif time.time() < entry["since"] + self.policy.cooldown:
+            allowed = False
+        else:
+            try:
+                with self._locked() as state:
+                    allowed = self._claim_probe(fn, state.get(key))
+            except OSError:
+                allowed = True
+        if allowed:
+            self.allowed.add(fn)
+        return allowed
+
+    def record(self, fns: list[Handler], results: list[Any], called: set[int] | None = None) -> str:
+        # Handlers a chain skipped count as neither success nor failure: a half-open
+        # one stays half-open until a later invocation really probes it.
+        outcomes = {
+            handler_id(self.event, fn): (fn, item is deadlines.PENDING or isinstance(item, Exception))
+            for index, (fn, item) in enumerate(zip(fns, results, strict=True))
+            if fn in self.allowed and (called is None or index in called)
+        }
+        if any(
+            failed or self.state.get(key, {}).get("state", "closed") != "closed"
+            for key, (_, failed) in outcomes.items()
+        ):
+            try:
+                with self._locked() as state:
+                    for key, (fn, failed) in outcomes.items():
+                        entry = self._transition(fn, state.get(key), failed)
+                        if entry is None:
+                            state.pop(key, None)
+                        else:
+                            state[key] = entry
+            except OSError:
+                pass  # Read-only state dir: the breaker stays closed.
+        return "".join(f"cc-hooks: {self.event} handler={note}\n" for note in self.notes)
+
+    def _claim_probe(self, fn: Handler, entry: dict[str, Any] | None) -> bool:
+        # Open, or half-open with a probe that never reported back, past its cool-down:
+        # this invocation runs the handler once to decide whether to close the circuit.
+        if entry is None or entry["state"] == "closed":
+            return True
+        if time.time() < entry["since"] + self.policy.cooldown:
+            return False
+        entry.update(state="half_open", since=time.time())
+        self.notes.append(f"{_name(fn)}: cool-down over, probing")
+        return True
+
+    def _transition(self, fn: Handler, entry: dict[str, Any] | None, failed: bool) -> dict[str, Any] | None:
+        now = time.time()
+        name = _name(fn)
+        state = entry["state"] if entry is not None else "closed"
+        if state == "half_open" and not failed:
+            self.notes.append(f"{name}: probe succeeded, circuit closed")
+            return None
+        if state == "half_open":
+            self.notes.append(f"{name}: probe failed, skipping for {self.policy.cooldown:g}s")
+            return {"state": "open", "failures": [], "since": now}
+        if state == "open" or not failed:
+            # Opened by a concurrent invocation, or nothing new to count.
+            return entry
+        failures = [at for at in (entry or {}).get("failures", []) if at > now - self.policy.window] + [now]
+        if len(failures) < self.policy.failures:
+            return {"state": "closed", "failures": failures, "since": now}
+        self.notes.append(
+            f"{name}: {len(failures)} failures in {self.policy.window:g}s, skipping for {self.policy.cooldown:g}s"
+        )
+        return {"state": "open", "failures": [], "since": now}
+
+    def _read(self) -> State:
+        try:
+            data = json.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            remove_stale(self.policy.state_dir, "*.json", STALE_AFTER)
+            return {}
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @contextmanager
+    def _locked(self) -> Iterator[State]:
+        with locked_json(self.path) as state:
+            yield state
+            self.state = state
+
+
+def gate(event: str, parsed_input: BaseModel) -> Breakers | None:
+    session_id = getattr(parsed_input, "session_id", None)
+    if _policy is None or not isinstance(session_id, str):
+        return None
+    return Breakers(_policy, event, session_id)
+
+
+def _name(fn: Handler) -> str:
+    return str(getattr(fn, "__name__", "<handler>"))
+
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    _value = os.environ[ENV_VAR].strip()
+    enable_breaker(state_dir=None if _value.lower() in ("1", "true", "yes", "on") else _value)
+
+__all__ = [
+    "BreakerPolicy",
+    "breaker_policy",
+    "default_state_dir",
+    "disable_breaker",
+    "enable_breaker",
+]
@@ -0,0 +1,238 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from cc_hooks import deadlines
+from cc_hooks._storage import cache_home
+from cc_hooks.enums import HookEvent
+from cc_hooks.merge import PRECEDENCE
+
+ENV_VAR = "CC_HOOKS_CHAIN"
+DEFAULT_EVENTS = (
+    HookEvent.PRE_TOOL_USE.value,
+    HookEvent.USER_PROMPT_SUBMIT.value,
+    HookEvent.PERMISSION_REQUEST.value,
+)
+# Counts are halved past this many runs, so the order follows recent behavior.
+WINDOW = 256
+
+Handler = Callable[[Any], Any]
+# Handler id -> [runs, decisive runs, total seconds].
+Stats = dict[str, list[float]]
+
+_events: set[str] = set()
+_stats_path: Path | None = None
+_after: dict[Handler, frozenset[str]] = {}
+
+
+@dataclass(frozen=True)
+class ChainEntry:
+    handler: Handler
+    runs: float
+    mean_seconds: float
+    decisive_rate: float
+
+    @property
+    def name(self) -> str:
+        return str(getattr(self.handler, "__name__", self.handler))
+
+
+def default_stats_path() -> Path:
+    return cache_home() / "chain-stats.json"
+
+
+def enable_chain(*events: str | HookEvent, stats_path: str | os.PathLike[str] | None = None) -> Path:
+    global _stats_path
+    _events.update(event.value if isinstance(event, HookEvent) else event for event in events or DEFAULT_EVENTS)
+    _stats_path = Path(stats_path) if stats_path is not None else default_stats_path()
+    return _stats_path
+
+
+def disable_chain(*events: str | HookEvent) -> None:
+    global _stats_path
+    if events:
+        _events.difference_update(event.value if isinstance(event, HookEvent) else event for event in events)
+    else:
+        _events.clear()
+    if not _events:
+        _stats_path = None
+
+
+def chain_enabled(event: str) -> bool:
+    return event in _events
+
+
+def run_after(fn: Handler, names: Iterable[str]) -> None:
+    _after[fn] = frozenset(names)
+
+
+def is_decisive(output: BaseModel) -> bool:
+    # The most restrictive value of a decision field (deny, block) cannot be overruled
+    # by a later handler, so the rest of the chain is skipped.
+    for name, order in PRECEDENCE.items():
+        if getattr(output, name, None) == order[0]:
+            return True
+    return any(isinstance(value, BaseModel) and is_decisive(value) for value in output.__dict__.values())
+
+
+def load_stats(path: Path) -> Stats:
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {key: value for key, value in data.items() if isinstance(value, list) and len(value) == 3}
+
+
+def save_stats(path: Path, stats: Stats) -> None:
+    # Written to a temp file and renamed, so concurrent hook processes never read a
+    # partial file; an update racing with another one may be lost, which only delays
+    # the reordering.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp.write_text(json.dumps(stats, separators=(",", ":")), encoding="utf-8")
+        os.replace(temp, path)
+    except OSError:
+        pass
+
+
+def order_handlers(fns: list[Handler], event: str, stats: Stats) -> list[ChainEntry]:
+    # Greedy by mean cost / P(decisive), the optimal order for independent checks that
+    # stop the chain; among handlers whose `after` constraints are met, the cheapest
+    # expected stop goes first. Handlers without stats cost 0 and so run first once.
+    entries = []
+    for fn in fns:
+        runs, decisive, seconds = stats.get(handler_id(event, fn), (0, 0, 0.0))
+        entries.append(ChainEntry(fn, runs, seconds / runs if runs else 0.0, (decisive + 1) / (runs + 2)))
+    names = {entry.name for entry in entries}
+
+    ordered: list[ChainEntry] = []
+    pending = list(entries)
+    while pending:
+        placed = {entry.name for entry in ordered}
+        ready = [entry for entry in pending if (_after.get(entry.handler, frozenset()) & names) <= placed]
+        if not ready:
+            cycle = ", ".join(entry.name for entry in pending)
+            raise ValueError(f"Handler ordering constraints form a cycle: {cycle}")
+        best = min(ready, key=lambda entry: entry.mean_seconds / entry.decisive_rate)
+        ordered.append(best)
+        pending.remove(best)
+    return ordered
+
+
+def run_chain(
+    fns: list[Handler], event: str, parsed_input: BaseModel, results: list[Any], deadline: float | None = None
+) -> set[int]:
+    # Fills the runner's result slots (registration order) for the handlers that ran;
+    # the ones skipped after a decisive output get None. Returns the indexes of the
+    # handlers that were actually called.
+    path = _stats_path or default_stats_path()
+    stats = load_stats(path)
+    ran: set[int] = set()
+    called: set[int] = set()
+    try:
+        for entry in order_handlers(fns, event, stats):
+            index = fns.index(entry.handler)
+            ran.add(index)
+            if results[index] is not deadlines.PENDING:
+                # Filled in by the runner (an open circuit breaker): not called.
+                output = results[index]
+            else:
+                called.add(index)
+                start = time.perf_counter()
+                results[index] = deadlines.call(entry.handler, parsed_input, deadline)
+                output = deadlines.settle(entry.handler, results[index])
+                if not isinstance(output, Exception):
+                    decisive = output is not None and is_decisive(output)
+                    _record(stats, handler_id(event, entry.handler), time.perf_counter() - start, decisive)
+            if isinstance(output, Exception) or (output is not None and is_decisive(output)):
+                break
+        for index in set(range(len(fns))) - ran:
+            results[index] = None
+    finally:
+        save_stats(path, stats)
+    return called
+
+
+def chain_order(event: str | HookEvent, tool: str | None = None) -> list[ChainEntry]:
+    from cc_hooks import runner
+
+    resolved_event = event.value if isinstance(event, HookEvent) else event
+    fns = runner._handlers_for(resolved_event, tool)
+    return order_handlers(fns, resolved_event, load_stats(_stats_path or default_stats_path()))
+
+
+def handler_id(event: str, fn: Handler) -> str:
+    return f"{event} {qualified_name(fn)}"
+
+
+def qualified_name(fn: Callable[..., Any]) -> str:
+    # Scripts all run as __main__, so they are told apart by file.
+    module = getattr(fn, "__module__", None)
+    if module in (None, "__main__"):
+        code = getattr(fn, "__code__", None)
+        module = code.co_filename if code is not None else module
+    return f"{module}:{getattr(fn, '__qualname__', fn)}"
+
+
+def _record(stats: Stats, key: str, seconds: float, decisive: bool) -> None:
+    runs, hits, total = stats.get(key, (0, 0, 0.0))
+    if runs >= WINDOW:
+        runs, hits, total = runs / 2, hits / 2, total / 2
+    stats[key] = [runs + 1, hits + int(decisive), total + seconds]
+
+
+def main(argv: list[str] | None = None) -> int:
+    # Under `python -m` this file is __main__; handlers configure the imported module.
+    from importlib import import_module
+
+    from cc_hooks import runner
+    from cc_hooks.server import load_handlers
+
+    chain = import_module("cc_hooks.chain")
+
+    parser = argparse.ArgumentParser(description="Show the order chained @hook handlers will run in.")
+    parser.add_argument("handlers", nargs="+", help="Hook script paths or importable module names")
+    args = parser.parse_args(argv)
+
+    load_handlers(args.handlers)
+    for (event, tool), fns in runner._HANDLERS.items():
+        if not chain.chain_enabled(event) or len(fns) < 2:
+            continue
+        sys.stdout.write(f"{event}" + (f" ({tool})" if tool else "") + ":\n")
+        for position, entry in enumerate(chain.chain_order(event, tool), 1):
+            sys.stdout.write(
+                f"  {position}. {entry.name}  runs={entry.runs:g} mean={entry.mean_seconds * 1000:.2f}ms"
+                f" decisive={entry.decisive_rate:.0%}\n"
+            )
+    return 0
+
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    _value = os.environ[ENV_VAR].strip()
+    enable_chain(
+        *([] if _value.lower() in ("1", "true", "yes", "on") else [event.strip() for event in _value.split(",")])
+    )
+
+__all__ = [
+    "ChainEntry",
+    "chain_enabled",
+    "chain_order",
+    "default_stats_path",
+    "disable_chain",
+    "enable_chain",
+    "is_decisive",
+]
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import socket
+import struct
+import sys
+
+RESPONSE_HEADER = "!iII"
+ENV_NO_DAEMON = "CC_HOOKS_NO_DAEMON"
+ENV_SOCKET_DIR = "CC_HOOKS_SOCKET_DIR"
+ENV_IDLE_TIMEOUT = "CC_HOOKS_DAEMON_IDLE_TIMEOUT"
+
+
+def socket_dir() -> str:
+    configured = os.environ.get(ENV_SOCKET_DIR)
+    if configured:
+        return configured
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return os.path.join(runtime, "cc-hooks")
+    return os.path.join("/tmp", f"cc-hooks-{os.getuid()}")
+
+
+def socket_path(specs: list[str]) -> str:
+    # Handler file mtimes are part of the key, so editing a hook script makes the
+    # next invocation start a fresh daemon; the stale one exits when idle.
+    project = os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+    digest = hashlib.sha256(project.encode())
+    for spec in specs:
+        digest.update(b"\0" + spec.encode())
+        try:
+            stat = os.stat(spec)
+        except OSError:
+            continue
+        digest.update(f"{os.path.abspath(spec)}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+    return os.path.join(socket_dir(), f"{digest.hexdigest()[:20]}.sock")
+
+
+def recv_all(conn: socket.socket) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def encode_meta(cwd: str, env: dict[str, str]) -> bytes:
+    # NUL-separated "cwd, KEY=VALUE..." keeps json out of the client's imports.
+    return "\0".join([cwd, *(f"{key}={value}" for key, value in env.items())]).encode("utf-8", "surrogateescape")
+
+
+def decode_meta(meta: bytes) -> tuple[str, dict[str, str]]:
+    cwd, *pairs = meta.decode("utf-8", "surrogateescape").split("\0")
+    return cwd, dict(pair.split("=", 1) for pair in pairs if "=" in pair)
+
+
+def _request(path: str, stdin: bytes) -> tuple[int, bytes, bytes] | None:
+    meta = encode_meta(os.getcwd(), dict(os.environ))
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(path)
+            conn.sendall(struct.pack("!I", len(meta)) + meta + stdin)
+            conn.shutdown(socket.SHUT_WR)
+            response = recv_all(conn)
+    except OSError:
+        return None
+
+    header_size = struct.calcsize(RESPONSE_HEADER)
+    if len(response) < header_size:
+        return None
+    code, out_len, err_len = struct.unpack_from(RESPONSE_HEADER, response)
+    if len(response) != header_size + out_len + err_len:
+        return None
+    stdout = response[header_size : header_size + out_len]
+    return code, stdout, response[header_size + out_len :]
+
+
+def _ensure_socket_dir(path: str) -> bool:
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stat = os.stat(directory)
+    except OSError:
+        return False
+    return stat.st_uid == os.getuid() and stat.st_mode & 0o077 == 0
+
+
+def _spawn_daemon(specs: list[str], path: str) -> None:
+    import subprocess
+
+    idle_timeout = os.environ.get(ENV_IDLE_TIMEOUT)
+    options = ["--idle-timeout", idle_timeout] if idle_timeout else []
+    subprocess.Popen(
+        [sys.executable, "-m", "cc_hooks.server", "--socket", path, *options, *specs],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _run_in_process(specs: list[str], stdin: bytes) -> tuple[int, bytes, bytes]:
+    from cc_hooks.server import handle_request, load_handlers
+
+    load_handlers(specs)
+    return handle_request(None, stdin)
+
+
+def main(argv: list[str] | None = None) -> int:
+    specs = list(sys.argv[1:] if argv is None else argv)
+    if not specs:
+        sys.stderr.write("usage: python -m cc_hooks.client HANDLER [HANDLER ...]\n")
+        return 2
+
+    stdin = sys.stdin.buffer.read()
+    response = None
+    if not os.environ.get(ENV_NO_DAEMON):
+        path = socket_path(specs)
+        if _ensure_socket_dir(path):
+            response = _request(path, stdin)
+            if response is None:
+                _spawn_daemon(specs, path)
+    in_process = response is None
+    if response is None:
+        response = _run_in_process(specs, stdin)
+
+    code, stdout, stderr = response
+    sys.stdout.buffer.write(stdout)
+    sys.stdout.buffer.flush()
+    sys.stderr.buffer.write(stderr)
+    sys.stderr.buffer.flush()
+    if in_process:
+        from cc_hooks import background
+
+        background.spawn(background.take_tasks())
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
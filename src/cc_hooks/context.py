@@ -0,0 +1,196 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from cc_hooks.state import SessionState
+
+KEY = "cc_hooks.context"
+DEFAULT_LIMIT = 200_000
+# Fraction of the window at which auto-compaction is expected to trigger.
+DEFAULT_COMPACT_AT = 0.92
+# Per-turn growth samples kept for the projection.
+GROWTH_WINDOW = 8
+# Records searched backwards for the latest usage the first time a session is seen.
+INITIAL_TAIL = 200
+# Counters derived from the transcript; a write that finds them changed is retried.
+_TRANSCRIPT_KEYS = ("base", "pending", "offset")
+# Content-block keys whose values are not sent to the model as text.
+_SKIP_KEYS = frozenset({"type", "id", "tool_use_id", "signature"})
+
+_ALNUM = frozenset(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+_NOT_ALNUM = bytes(byte for byte in range(256) if byte not in _ALNUM)
+_NOT_HIGH = bytes(range(128))
+_NOT_OTHER = bytes(sorted(_ALNUM | set(b" \t\r\n\f\v") | set(range(128, 256))))
+
+_limit = DEFAULT_LIMIT
+_compact_at = DEFAULT_COMPACT_AT
+
+
+@dataclass(frozen=True)
+class ContextEstimate:
+    tokens: int
+    limit: int
+    compact_at: int
+    turns_left: float | None
+
+    @property
+    def fraction(self) -> float:
+        return self.tokens / self.limit
+
+
+def estimate_tokens(text: str | bytes) -> int:
+    # Character classes instead of a tokenizer: runs of letters and digits average
+    # about four characters per token, punctuation about two, and multi-byte UTF-8
+    # (mostly CJK) about one token per character.
+    data = text.encode("utf-8", "replace") if isinstance(text, str) else text
+    alnum = len(data.translate(None, _NOT_ALNUM))
+    high = len(data.translate(None, _NOT_HIGH))
+    other = len(data.translate(None, _NOT_OTHER))
+    return round(alnum / 4 + other / 2 + high / 3)
+
+
+def enable_context_tracker(*, limit: int = DEFAULT_LIMIT, compact_at: float = DEFAULT_COMPACT_AT) -> None:
+    # Registers handlers that keep the estimate current; they run before handlers
+    # registered after this call.
+    from cc_hooks.runner import hook
+
+    global _limit, _compact_at
+    _limit, _compact_at = limit, compact_at
+    for event in ("UserPromptSubmit", "PostToolUse", "PostToolUseFailure", "Stop", "SessionStart"):
+        hook(event)(track)
+
+
+def context_estimate(session: BaseModel | str) -> ContextEstimate:
+    # One read of the stored counters; never touches the transcript.
+    return _estimate(SessionState(session).get(KEY, {}))
+
+
+def track(input: BaseModel) -> None:
+    added = _event_tokens(input, getattr(input, "hook_event_name", None))
+    transcript = input.transcript()  # type: ignore[attr-defined]
+    session = SessionState(input)
+    while True:
+        # New transcript records are read before the write transaction, which only
+        # checks that no other hook moved the counters meanwhile. If one did, the
+        # records are read again from where it stopped.
+        seen = _defaults(session.get(KEY, {}))
+        read, advanced = _read(seen, transcript)
+        try:
+            session.update(KEY, partial(_apply, input, seen, read, advanced, added), {})
+        except _Moved:
+            continue
+        return
+
+
+def _apply(
+    input: BaseModel, seen: dict[str, Any], read: dict[str, Any], advanced: bool, added: int, data: dict[str, Any]
+) -> dict[str, Any]:
+    state = _defaults(data)
+    if any(state[key] != seen[key] for key in _TRANSCRIPT_KEYS):
+        raise _Moved
+    state.update((key, read[key]) for key in _TRANSCRIPT_KEYS)
+    if advanced:
+        # Prompts and tool output counted from events have reached the transcript.
+        state["events"] = 0
+    state["events"] += added
+    event = getattr(input, "hook_event_name", None)
+    if event == "SessionStart" and getattr(input, "source", None) == "compact":
+        state.update(base=0, pending=0, events=0, turn_start=None)
+    if event == "UserPromptSubmit":
+        current = _total(state)
+        if state["turn_start"] is not None and current > state["turn_start"]:
+            state["growth"] = [*state["growth"], current - state["turn_start"]][-GROWTH_WINDOW:]
+        state["turn_start"] = current
+    return state
+
+
+class _Moved(Exception):
+    pass
+
+
+def _defaults(data: dict[str, Any]) -> dict[str, Any]:
+    return {"base": 0, "pending": 0, "events": 0, "offset": None, "turn_start": None, "growth": [], **data}
+
+
+def _read(seen: dict[str, Any], transcript: Any) -> tuple[dict[str, Any], bool]:
+    state = dict(seen)
+    if state["offset"] is None or state["offset"] > transcript.complete_size:
+        _start(state, transcript)
+    advanced = False
+    for offset, record in transcript.since(state["offset"]):
+        usage = _usage(record)
+        if usage is not None:
+            state["base"], state["pending"] = usage, 0
+        else:
+            state["pending"] += _record_tokens(record)
+        state["offset"] = offset
+        advanced = True
+    return state, advanced
+
+
+def _start(state: dict[str, Any], transcript: Any) -> None:
+    # First sight of the session (or a rewritten transcript): take the latest usage
+    # from the tail and estimate what follows it, instead of reading the whole file.
+    state.update(base=0, pending=0, offset=transcript.complete_size)
+    for record in transcript.tail(INITIAL_TAIL):
+        usage = _usage(record)
+        if usage is not None:
+            state["base"], state["pending"] = usage, 0
+        else:
+            state["pending"] += _record_tokens(record)
+
+
+def _estimate(state: dict[str, Any]) -> ContextEstimate:
+    tokens = _total(state) if state else 0
+    threshold = int(_limit * _compact_at)
+    growth = state.get("growth") or []
+    per_turn = sum(growth) / len(growth) if growth else 0
+    turns_left = max(threshold - tokens, 0) / per_turn if per_turn > 0 else None
+    return ContextEstimate(tokens=tokens, limit=_limit, compact_at=threshold, turns_left=turns_left)
+
+
+def _total(state: dict[str, Any]) -> int:
+    return int(state["base"] + state["pending"] + state["events"])
+
+
+def _event_tokens(input: Any, event: str | None) -> int:
+    if event == "UserPromptSubmit":
+        return estimate_tokens(str(getattr(input, "prompt", "")))
+    if event == "PostToolUse":
+        # A deferred tool_response (cc_hooks.lazy) is estimated from its raw bytes.
+        lazy = input.lazy_field("tool_response")
+        return estimate_tokens(lazy.raw() if lazy is not None else to_json(input.tool_response))
+    if event == "PostToolUseFailure":
+        return estimate_tokens(str(input.error))
+    return 0
+
+
+def _usage(record: dict[str, Any]) -> int | None:
+    message = record.get("message")
+    usage = message.get("usage") if isinstance(message, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    keys = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+    return sum(int(usage.get(key) or 0) for key in keys)
+
+
+def _record_tokens(record: dict[str, Any]) -> int:
+    message = record.get("message")
+    content = message.get("content") if isinstance(message, dict) else record.get("content")
+    return sum(estimate_tokens(text) for text in _strings(content))
+
+
+def _strings(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, dict):
+        return [text for key, item in value.items() if key not in _SKIP_KEYS for text in _strings(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in _strings(item)]
+    return []
+
+
+__all__ = ["ContextEstimate", "context_estimate", "enable_context_tracker", "estimate_tokens", "track"]
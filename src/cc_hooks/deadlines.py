@@ -0,0 +1,179 @@
+import inspect
+import os
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import IO, TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import asyncio
+
+ENV_BUDGET = "CC_HOOKS_BUDGET"
+ENV_STDIN_TIMEOUT = "CC_HOOKS_STDIN_TIMEOUT"
+
+Handler = Callable[[Any], Any]
+
+# Result slot of a handler that has not finished: it ran out of time, or the process
+# is being terminated. Resolved to the handler's fallback by settle().
+PENDING: Any = object()
+
+_CHUNK = 64 * 1024
+
+
+@dataclass(frozen=True)
+class HandlerLimit:
+    timeout: float | None
+    fallback: BaseModel | None
+
+
+_budget: float | None = None
+_stdin_timeout: float | None = None
+_limits: dict[Handler, HandlerLimit] = {}
+
+
+def enable_deadlines(budget: float | None = None, *, stdin_timeout: float | None = None) -> None:
+    global _budget, _stdin_timeout
+    _budget = budget
+    _stdin_timeout = stdin_timeout
+
+
+def disable_deadlines() -> None:
+    enable_deadlines()
+
+
+def set_limit(fn: Handler, timeout: float | None, fallback: BaseModel | None) -> None:
+    _limits[fn] = HandlerLimit(timeout, fallback)
+
+
+def invocation_deadline() -> float | None:
+    return time.monotonic() + _budget if _budget is not None else None
+
+
+def handler_timeout(fn: Handler, deadline: float | None) -> float | None:
+    limit = _limits.get(fn)
+    timeout = limit.timeout if limit is not None else None
+    if deadline is not None:
+        remaining = max(deadline - time.monotonic(), 0.0)
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    return timeout
+
+
+def fallback_for(fn: Handler) -> BaseModel | None:
+    limit = _limits.get(fn)
+    return limit.fallback if limit is not None else None
+
+
+def settle(fn: Handler, item: Any) -> Any:
+    if item is not PENDING:
+        return item
+    fallback = fallback_for(fn)
+    return fallback if fallback is not None else TimeoutError("handler did not finish before its deadline")
+
+
+def call(fn: Handler, parsed_input: BaseModel, deadline: float | None) -> Any:
+    # Returns the handler's output, the exception it raised, or PENDING. Without a
+    # deadline sync handlers run on the calling thread, as they always have.
+    timeout = handler_timeout(fn, deadline)
+    if timeout is None and not inspect.iscoroutinefunction(fn):
+        try:
+            return fn(parsed_input)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+    import asyncio
+
+    return asyncio.run(call_async(fn, parsed_input, timeout))
+
+
+async def call_async(fn: Handler, parsed_input: BaseModel, timeout: float | None) -> Any:
+    # Async handlers are cancelled when the timeout expires; sync handlers run on a
+    # daemon thread that is abandoned, so the process can still exit on time.
+    import asyncio
+
+    if timeout is not None and timeout <= 0:
+        return PENDING
+    scope = asyncio.timeout(timeout)
+    try:
+        async with scope:
+            if inspect.iscoroutinefunction(fn):
+                return await fn(parsed_input)
+            return await in_daemon_thread(partial(fn, parsed_input), getattr(fn, "__name__", "handler"))
+    except Exception as exc:  # noqa: BLE001
+        return PENDING if scope.expired() else exc
+
+
+def in_daemon_thread(call: Callable[[], Any], name: str) -> "asyncio.Future[Any]":
+    # Unlike asyncio.to_thread, nothing joins the thread at loop or interpreter
+    # shutdown, so a call that never returns cannot hold the process.
+    import asyncio
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[Any] = loop.create_future()
+
+    def settle_future(result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def target() -> None:
+        result, error = None, None
+        try:
+            result = call()
+        except BaseException as exc:  # noqa: BLE001
+            error = exc
+        try:
+            loop.call_soon_threadsafe(settle_future, result, error)
+        except RuntimeError:
+            pass  # The loop is closed: the handler was abandoned.
+
+    threading.Thread(target=target, name=f"cc-hooks-{name}", daemon=True).start()
+    return future
+
+
+def stdin_timeout(deadline: float | None) -> float | None:
+    timeout = _stdin_timeout
+    if deadline is not None:
+        remaining = max(deadline - time.monotonic(), 0.0)
+        timeout = remaining if timeout is None else min(timeout, remaining)
+    return timeout
+
+
+def timed_reader(stream: IO[bytes], timeout: float) -> Callable[[int], bytes]:
+    import select
+
+    fd = stream.fileno()
+    end = time.monotonic() + timeout
+
+    def read(size: int) -> bytes:
+        remaining = end - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            raise TimeoutError(f"stdin was not closed within {timeout:g}s")
+        return os.read(fd, size)
+
+    return read
+
+
+def read_with_timeout(stream: IO[bytes], timeout: float) -> bytes:
+    return b"".join(iter(partial(timed_reader(stream, timeout), _CHUNK), b""))
+
+
+def _seconds(name: str) -> float | None:
+    value = os.environ.get(name, "").strip()
+    return float(value) if value else None
+
+
+if os.environ.get(ENV_BUDGET) or os.environ.get(ENV_STDIN_TIMEOUT):
+    enable_deadlines(_seconds(ENV_BUDGET), stdin_timeout=_seconds(ENV_STDIN_TIMEOUT))
+
+__all__ = [
+    "HandlerLimit",
+    "disable_deadlines",
+    "enable_deadlines",
+    "invocation_deadline",
+]
@@ -0,0 +1,153 @@
+import re
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+from cc_hooks.state import SessionState
+
+KEY = "cc_hooks.digest"
+DEFAULT_MAX_ITEMS = 20
+MAX_TEXT = 200
+
+# Editing tool name -> the tool_input key holding the edited path.
+EDIT_TOOLS = {"Edit": "file_path", "MultiEdit": "file_path", "Write": "file_path", "NotebookEdit": "notebook_path"}
+_TEST_COMMAND = re.compile(r"\b(pytest|py\.test|tox|nox|unittest|jest|vitest|(npm|yarn|pnpm|go|cargo|mix) test)\b")
+# pytest "FAILED tests/x.py::test_y", go "--- FAIL: TestY", unittest/cargo "test_y ... FAILED".
+_FAILED_TEST = re.compile(r"^FAILED (\S+)|^\s*--- FAIL: (\S+)|^(?:test )?(\S+) \.\.\. (?:FAILED|ERROR)", re.MULTILINE)
+
+_max_items = DEFAULT_MAX_ITEMS
+
+
+@dataclass
+class SessionDigest:
+    # Edited path -> edit count, in order of the most recent edit.
+    files: dict[str, int] = field(default_factory=dict)
+    # [command, ok] pairs, most recent last.
+    commands: list[list[Any]] = field(default_factory=list)
+    failing_tests: list[str] = field(default_factory=list)
+    prompts: list[str] = field(default_factory=list)
+    decisions: list[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        lines = ["Session digest (maintained by hooks):"]
+        if self.files:
+            edited = ", ".join(f"{path} ({count}x)" if count > 1 else path for path, count in self.files.items())
+            lines.append(f"- Files changed: {edited}")
+        if self.commands:
+            run = ", ".join(f"`{command}`" + ("" if ok else " (failed)") for command, ok in self.commands)
+            lines.append(f"- Recent commands: {run}")
+        if self.failing_tests:
+            lines.append(f"- Failing tests: {', '.join(self.failing_tests)}")
+        lines += [f"- User asked: {prompt}" for prompt in self.prompts]
+        lines += [f"- Decided: {decision}" for decision in self.decisions]
+        return "\n".join(lines)
+
+
+Change = Callable[[SessionDigest], None]
+
+
+def session_digest(session: BaseModel | str) -> SessionDigest:
+    return SessionDigest(**SessionState(session).get(KEY, {}))
+
+
+def record(input: BaseModel) -> None:
+    # Folds one PostToolUse, PostToolUseFailure or UserPromptSubmit event into the
+    # session's digest; other events are ignored.
+    event = getattr(input, "hook_event_name", None)
+    if event == "UserPromptSubmit":
+        prompt = clip_text(str(getattr(input, "prompt", "")))
+        _update(input, lambda digest: _push(digest.prompts, prompt))
+    elif event in ("PostToolUse", "PostToolUseFailure"):
+        change = _tool_change(input, failed=event == "PostToolUseFailure")
+        if change is not None:
+            _update(input, change)
+
+
+def note_decision(session: BaseModel | str, decision: str) -> None:
+    _update(session, lambda digest: _push(digest.decisions, clip_text(decision)))
+
+
+def clip_text(text: str) -> str:
+    # The first line of `text`, cut to MAX_TEXT characters.
+    line = text.strip().splitlines()[0] if text.strip() else ""
+    return line if len(line) <= MAX_TEXT else line[: MAX_TEXT - 1] + "…"
+
+
+def enable_session_digest(*, max_items: int = DEFAULT_MAX_ITEMS, inject_on_compact: bool = True) -> None:
+    # Registers the recording handlers and, with inject_on_compact, a SessionStart
+    # handler that re-injects the digest after compaction.
+    from cc_hooks.runner import hook
+
+    global _max_items
+    _max_items = max_items
+    for event in ("PostToolUse", "PostToolUseFailure", "UserPromptSubmit"):
+        hook(event)(record)
+    if inject_on_compact:
+        hook("SessionStart")(_inject_after_compact)
+
+
+def _inject_after_compact(input: BaseModel) -> BaseModel | None:
+    from cc_hooks.models import SessionStartOutput
+
+    if getattr(input, "source", None) != "compact":
+        return None
+    digest = session_digest(input)
+    if digest == SessionDigest():
+        return None
+    return SessionStartOutput.add_context(digest.render())
+
+
+def _tool_change(input: Any, failed: bool) -> Change | None:
+    tool_input: dict[str, Any] = input.tool_input
+    if input.tool_name in EDIT_TOOLS and not failed:
+        path = tool_input.get(EDIT_TOOLS[input.tool_name])
+        if not isinstance(path, str):
+            return None
+
+        def edited(digest: SessionDigest) -> None:
+            count = digest.files.pop(path, 0) + 1
+            digest.files[path] = count
+            for stale in list(digest.files)[: -_max_items or None]:
+                del digest.files[stale]
+
+        return edited
+    if input.tool_name != "Bash" or not isinstance(tool_input.get("command"), str):
+        return None
+    command = tool_input["command"]
+    failures = None
+    if _TEST_COMMAND.search(command):
+        # The output is only read for test runs; other Bash responses stay unparsed.
+        output = input.error if failed else _text(input.tool_response)
+        failures = [next(name for name in match.groups() if name) for match in _FAILED_TEST.finditer(output)]
+
+    def ran(digest: SessionDigest) -> None:
+        _push(digest.commands, [clip_text(command), not failed])
+        if failures is not None:
+            digest.failing_tests = list(dict.fromkeys(failures))[:_max_items]
+
+    return ran
+
+
+def _update(session: BaseModel | str, change: Change) -> None:
+    def apply(data: dict[str, Any]) -> dict[str, Any]:
+        digest = SessionDigest(**data)
+        change(digest)
+        return asdict(digest)
+
+    SessionState(session).update(KEY, apply, {})
+
+
+def _push(items: list[Any], item: Any) -> None:
+    items.append(item)
+    del items[:-_max_items]
+
+
+def _text(response: Any) -> str:
+    if isinstance(response, dict):
+        return "\n".join(str(response.get(key) or "") for key in ("stdout", "stderr"))
+    return str(response)
+
+
+__all__ = ["SessionDigest", "clip_text", "enable_session_digest", "note_decision", "record", "session_digest"]
@@ -3,6 +3,7 @@ from enum import Enum
 try:
     from enum import StrEnum
 except ImportError:  # pragma: no cover - Python < 3.11 compatibility
+
     class StrEnum(str, Enum):  # type: ignore[no-redef]
         pass
 
@@ -0,0 +1,285 @@
+import os
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import IO, TYPE_CHECKING, Any, get_origin
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from cc_hooks.models._base import LAZY_ATTR
+
+if TYPE_CHECKING:
+    from pydantic import TypeAdapter
+
+ENV_VAR = "CC_HOOKS_LAZY_FIELDS"
+DEFAULT_FIELDS = ("tool_input", "tool_response", "prompt")
+
+_CHUNK = 1024 * 1024
+_WHITESPACE = re.compile(rb"[ \t\r\n]*+")
+_SCALAR = re.compile(rb"[^,}\]\s]*+")
+# Inside a container the regex engine skips, without returning to Python, everything
+# but long or escaped strings and containers nested deeper than four levels: bracket
+# free runs, short plain strings and small containers built from those.
+_SHORT = rb'[^"\[\]{}]++|"[^"\\]{0,256}+"'
+_nested = _SHORT
+for _ in range(4):
+    _nested = _SHORT + rb"|[\[{](?:" + _nested + rb")*+[\]}]"
+_SKIP = re.compile(rb"(?:" + _nested + rb")*+")
+
+
+@dataclass(frozen=True)
+class LazyConfig:
+    fields: frozenset[str]
+    min_bytes: int
+    spill_bytes: int
+    preview_chars: int
+    spill_dir: str | None
+
+
+_config: LazyConfig | None = None
+_adapters: dict[tuple[type[BaseModel], str], "TypeAdapter[Any]"] = {}
+
+
+def enable_lazy_fields(
+    fields: Iterable[str] = DEFAULT_FIELDS,
+    *,
+    min_bytes: int = 64 * 1024,
+    spill_bytes: int = 8 * 1024 * 1024,
+    preview_chars: int = 200,
+    spill_dir: str | os.PathLike[str] | None = None,
+) -> LazyConfig:
+    global _config
+    _config = LazyConfig(
+        fields=frozenset(fields),
+        min_bytes=min_bytes,
+        spill_bytes=spill_bytes,
+        preview_chars=preview_chars,
+        spill_dir=os.fspath(spill_dir) if spill_dir is not None else None,
+    )
+    return _config
+
+
+def disable_lazy_fields() -> None:
+    global _config
+    _config = None
+
+
+def lazy_fields_config() -> LazyConfig | None:
+    return _config
+
+
+class LazyValue:
+    __slots__ = ("_buffer", "_end", "_preview_chars", "_start", "spilled")
+
+    def __init__(self, buffer: Any, start: int, end: int, preview_chars: int = 200, spilled: bool = False) -> None:
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._preview_chars = preview_chars
+        self.spilled = spilled
+
+    @property
+    def size(self) -> int:
+        return self._end - self._start
+
+    def raw(self) -> bytes:
+        return bytes(self._buffer[self._start : self._end])
+
+    def load(self) -> Any:
+        return from_json(self.raw())
+
+    def preview(self, chars: int | None = None) -> str:
+        limit = self._preview_chars if chars is None else chars
+        head = bytes(self._buffer[self._start : min(self._end, self._start + limit * 4)])
+        text = head.decode("utf-8", "ignore")
+        if len(text) > limit or self.size > len(head):
+            return text[:limit] + "…"
+        return text
+
+    def __repr__(self) -> str:
+        return f"LazyValue(size={self.size}, preview={self.preview(40)!r})"
+
+
+class LazyPayload:
+    def __init__(self, buffer: Any, config: LazyConfig, spilled: bool = False) -> None:
+        self.buffer = buffer
+        self.config = config
+        self.spilled = spilled
+        self.members = _scan_members(buffer)
+
+    def subset(self, keys: Iterable[str]) -> bytes:
+        wanted = [self.members[key] for key in keys if key in self.members]
+        return b"{" + b",".join(self.buffer[start:end] for start, _, _, end in wanted) + b"}"
+
+    def validate(self, model: type[BaseModel]) -> BaseModel:
+        names = {field.alias or name: name for name, field in model.model_fields.items()}
+        parts: list[bytes] = []
+        deferred: dict[str, LazyValue] = {}
+        for key, (start, key_end, value_start, value_end) in self.members.items():
+            name = names.get(key, key)
+            if name in self.config.fields and value_end - value_start >= self.config.min_bytes:
+                deferred[name] = LazyValue(
+                    self.buffer, value_start, value_end, self.config.preview_chars, spilled=self.spilled
+                )
+                if name in model.model_fields:
+                    parts.append(self.buffer[start:key_end] + b":" + _placeholder(model.model_fields[name].annotation))
+            else:
+                parts.append(self.buffer[start:value_end])
+
+        if not deferred and isinstance(self.buffer, bytes):
+            return model.model_validate_json(self.buffer)
+        instance = model.model_validate_json(b"{" + b",".join(parts) + b"}")
+        for name in deferred:
+            instance.__dict__.pop(name, None)
+        vars(instance)[LAZY_ATTR] = deferred
+        return instance
+
+
+def read_payload(stream: IO[bytes] | Callable[[int], bytes], config: LazyConfig) -> LazyPayload:
+    # Payloads above spill_bytes go to an unlinked temp file and are mapped, so
+    # deferred values are paged in from the file instead of held on the heap.
+    # A read callable stands in for the stream, e.g. one that enforces a timeout.
+    read = stream if callable(stream) else stream.read
+    chunks: list[bytes] = []
+    size = 0
+    while size <= config.spill_bytes:
+        chunk = read(_CHUNK)
+        if not chunk:
+            return LazyPayload(b"".join(chunks), config)
+        chunks.append(chunk)
+        size += len(chunk)
+
+    import mmap
+    import tempfile
+
+    with tempfile.TemporaryFile(dir=config.spill_dir) as spool:
+        spool.writelines(chunks)
+        chunks.clear()
+        while chunk := read(_CHUNK):
+            spool.write(chunk)
+        spool.flush()
+        mapped = mmap.mmap(spool.fileno(), 0, access=mmap.ACCESS_READ)
+    return LazyPayload(mapped, config, spilled=True)
+
+
+def materialize(instance: BaseModel, name: str) -> Any:
+    deferred: dict[str, LazyValue] = vars(instance)[LAZY_ATTR]
+    lazy = deferred[name]
+    model = type(instance)
+    if name in model.model_fields:
+        adapter = _adapters.get((model, name))
+        if adapter is None:
+            from pydantic import TypeAdapter
+
+            annotation = model.model_fields[name].annotation
+            adapter = _adapters[(model, name)] = TypeAdapter(Any if annotation is None else annotation)
+        value = adapter.validate_json(lazy.raw())
+        instance.__dict__[name] = value
+    else:
+        value = lazy.load()
+        if instance.__pydantic_extra__ is not None:
+            instance.__pydantic_extra__[name] = value
+    del deferred[name]
+    return value
+
+
+def _placeholder(annotation: Any) -> bytes:
+    origin = get_origin(annotation) or annotation
+    if origin is str:
+        return b'""'
+    if origin is dict:
+        return b"{}"
+    if origin in (list, tuple, set):
+        return b"[]"
+    return b"null"
+
+
+def _scan_members(buffer: Any) -> dict[str, tuple[int, int, int, int]]:
+    # Maps each top-level key to (member start, key end, value start, value end).
+    # Only the top level is walked in Python; values are skipped with find and regex.
+    members: dict[str, tuple[int, int, int, int]] = {}
+    try:
+        position = _skip_whitespace(buffer, 0)
+        if buffer[position] != 0x7B:  # '{'
+            raise ValueError
+        position = _skip_whitespace(buffer, position + 1)
+        if buffer[position] == 0x7D:  # '}'
+            return members
+        while True:
+            if buffer[position] != 0x22:
+                raise ValueError
+            start, key_end = position, _string_end(buffer, position)
+            position = _skip_whitespace(buffer, key_end)
+            if buffer[position] != 0x3A:  # ':'
+                raise ValueError
+            value_start = _skip_whitespace(buffer, position + 1)
+            value_end = _value_end(buffer, value_start)
+            members[from_json(buffer[start:key_end])] = (start, key_end, value_start, value_end)
+            position = _skip_whitespace(buffer, value_end)
+            if buffer[position] == 0x7D:
+                return members
+            if buffer[position] != 0x2C:  # ','
+                raise ValueError
+            position = _skip_whitespace(buffer, position + 1)
+    except (IndexError, ValueError):
+        raise ValueError("payload is not a complete JSON object") from None
+
+
+def _value_end(buffer: Any, position: int) -> int:
+    char = buffer[position]
+    if char == 0x22:  # '"'
+        return _string_end(buffer, position)
+    if char not in b"{[":
+        end: int = _SCALAR.match(buffer, position).end()  # type: ignore[union-attr]
+        return end
+    depth = 0
+    while True:
+        char = buffer[position]
+        if char == 0x22:
+            position = _string_end(buffer, position)
+        else:
+            depth += 1 if char in b"{[" else -1
+            position += 1
+            if depth == 0:
+                return position
+        position = _SKIP.match(buffer, position).end()  # type: ignore[union-attr]
+
+
+def _string_end(buffer: Any, position: int) -> int:
+    end: int = buffer.find(b'"', position + 1)
+    if end < 0:
+        raise ValueError
+    if buffer[end - 1] != 0x5C:  # '\\'
+        return end + 1
+    # Escaped backslashes and quotes are blanked out, keeping offsets, so the closing
+    # quote is found by find(). Each window resumes where the last one stopped, backing
+    # up one byte when it ends on an unpaired backslash so an escape is never split.
+    start, size = position + 1, 4096
+    while True:
+        window = buffer[start : start + size]
+        end = window.replace(b"\\\\", b"__").replace(b'\\"', b"__").find(b'"')
+        if end >= 0:
+            return start + end + 1
+        if start + size >= len(buffer):
+            raise ValueError
+        start += len(window) - (len(window) - len(window.rstrip(b"\\"))) % 2
+        size = min(size * 4, 1 << 20)
+
+
+def _skip_whitespace(buffer: Any, position: int) -> int:
+    end: int = _WHITESPACE.match(buffer, position).end()  # type: ignore[union-attr]
+    return end
+
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    enable_lazy_fields()
+
+__all__ = [
+    "LazyPayload",
+    "LazyValue",
+    "disable_lazy_fields",
+    "enable_lazy_fields",
+    "lazy_fields_config",
+    "read_payload",
+]
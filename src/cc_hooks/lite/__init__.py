@@ -0,0 +1,111 @@
+# Generated by scripts/generate_schemas.py from schemas/. Do not edit.
+
+from cc_hooks.lite._runtime import LiteModel, ValidationError
+from cc_hooks.lite.models import (
+    INPUT_MODELS,
+    ConfigChangeInput,
+    ConfigChangeOutput,
+    NotificationInput,
+    NotificationOutput,
+    PermissionRequestDecision,
+    PermissionRequestHookSpecific,
+    PermissionRequestInput,
+    PermissionRequestOutput,
+    PostToolUseFailureHookSpecific,
+    PostToolUseFailureInput,
+    PostToolUseFailureOutput,
+    PostToolUseHookSpecific,
+    PostToolUseInput,
+    PostToolUseOutput,
+    PreCompactInput,
+    PreCompactOutput,
+    PreToolUseHookSpecific,
+    PreToolUseInput,
+    PreToolUseOutput,
+    SessionEndInput,
+    SessionEndOutput,
+    SessionStartHookSpecific,
+    SessionStartInput,
+    SessionStartOutput,
+    StopInput,
+    StopOutput,
+    SubagentStartInput,
+    SubagentStartOutput,
+    SubagentStopInput,
+    SubagentStopOutput,
+    TaskCompletedInput,
+    TaskCompletedOutput,
+    TeammateIdleInput,
+    TeammateIdleOutput,
+    UserPromptSubmitHookSpecific,
+    UserPromptSubmitInput,
+    UserPromptSubmitOutput,
+)
+from cc_hooks.lite.runner import hook, run
+from cc_hooks.lite.tools import (
+    BashInput,
+    EditInput,
+    GlobInput,
+    GrepInput,
+    NotebookEditInput,
+    ReadInput,
+    TaskInput,
+    WebFetchInput,
+    WebSearchInput,
+    WriteInput,
+)
+
+__all__ = [
+    "INPUT_MODELS",
+    "BashInput",
+    "ConfigChangeInput",
+    "ConfigChangeOutput",
+    "EditInput",
+    "GlobInput",
+    "GrepInput",
+    "LiteModel",
+    "NotebookEditInput",
+    "NotificationInput",
+    "NotificationOutput",
+    "PermissionRequestDecision",
+    "PermissionRequestHookSpecific",
+    "PermissionRequestInput",
+    "PermissionRequestOutput",
+    "PostToolUseFailureHookSpecific",
+    "PostToolUseFailureInput",
+    "PostToolUseFailureOutput",
+    "PostToolUseHookSpecific",
+    "PostToolUseInput",
+    "PostToolUseOutput",
+    "PreCompactInput",
+    "PreCompactOutput",
+    "PreToolUseHookSpecific",
+    "PreToolUseInput",
+    "PreToolUseOutput",
+    "ReadInput",
+    "SessionEndInput",
+    "SessionEndOutput",
+    "SessionStartHookSpecific",
+    "SessionStartInput",
+    "SessionStartOutput",
+    "StopInput",
+    "StopOutput",
+    "SubagentStartInput",
+    "SubagentStartOutput",
+    "SubagentStopInput",
+    "SubagentStopOutput",
+    "TaskCompletedInput",
+    "TaskCompletedOutput",
+    "TaskInput",
+    "TeammateIdleInput",
+    "TeammateIdleOutput",
+    "UserPromptSubmitHookSpecific",
+    "UserPromptSubmitInput",
+    "UserPromptSubmitOutput",
+    "ValidationError",
+    "WebFetchInput",
+    "WebSearchInput",
+    "WriteInput",
+    "hook",
+    "run",
+]
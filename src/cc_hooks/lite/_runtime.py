@@ -0,0 +1,181 @@
+import json
+
+# Spelled out instead of imported from typing, like cc_hooks/__init__.py: the lite
+# models exist so that a hook process imports nothing but json.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Self, TypeVar
+
+    Convert = Callable[[Any], Any]
+    M = TypeVar("M", bound="LiteModel")
+
+REQUIRED = object()
+
+
+class ValidationError(ValueError):
+    pass
+
+
+class LiteModel:
+    __slots__ = ("extra",)
+
+    # (attribute name, JSON alias, converter, default or REQUIRED), in schema order.
+    _fields: "tuple[tuple[str, str, Convert, Any], ...]" = ()
+
+    extra: "dict[str, Any]"
+
+    def __init__(self, **data: "Any") -> None:
+        self._load(data)
+
+    @classmethod
+    def from_dict(cls, data: "dict[str, Any]") -> "Self":
+        if not isinstance(data, dict):
+            raise ValidationError(f"1 validation error for {cls.__name__}: input should be an object")
+        instance = cls.__new__(cls)
+        instance._load(dict(data))
+        return instance
+
+    @classmethod
+    def from_json(cls, raw: "bytes | str") -> "Self":
+        return cls.from_dict(json.loads(raw))
+
+    def _load(self, data: "dict[str, Any]") -> None:
+        # Aliases win over attribute names, as with pydantic's populate_by_name;
+        # unknown keys are kept in ``extra`` like extra="allow".
+        errors: list[str] = []
+        for name, alias, convert, default in self._fields:
+            if alias in data:
+                value = data.pop(alias)
+                data.pop(name, None)
+            elif name in data:
+                value = data.pop(name)
+            elif default is REQUIRED:
+                errors.append(f"{alias}: field required")
+                continue
+            else:
+                value = default
+            try:
+                value = convert(value)
+            except (TypeError, ValueError) as exc:
+                errors.append(f"{alias}: {exc}")
+                continue
+            object.__setattr__(self, name, value)
+        if errors:
+            count = len(errors)
+            raise ValidationError(
+                f"{count} validation error{'s' if count > 1 else ''} for {type(self).__name__}: " + "; ".join(errors)
+            )
+        object.__setattr__(self, "extra", data)
+
+    def to_dict(self) -> "dict[str, Any]":
+        out: dict[str, Any] = {}
+        for name, alias, _, _ in self._fields:
+            value = getattr(self, name)
+            if value is not None:
+                out[alias] = value.to_dict() if isinstance(value, LiteModel) else value
+        for key, value in self.extra.items():
+            if value is not None:
+                out[key] = value.to_dict() if isinstance(value, LiteModel) else value
+        return out
+
+    def to_json(self) -> bytes:
+        return json.dumps(self.to_dict(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def __getattr__(self, name: str) -> "Any":
+        if name != "extra":
+            try:
+                return self.extra[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        values = [(name, getattr(self, name)) for name, _, _, _ in self._fields]
+        fields = [f"{name}={value!r}" for name, value in [*values, *self.extra.items()] if value is not None]
+        return f"{type(self).__name__}({', '.join(fields)})"
+
+
+def any_value(value: "Any") -> "Any":
+    return value
+
+
+def string(value: "Any") -> str:
+    if not isinstance(value, str):
+        raise TypeError("input should be a valid string")
+    return value
+
+
+def boolean(value: "Any") -> bool:
+    if value is not True and value is not False:
+        raise TypeError("input should be a valid boolean")
+    return value
+
+
+def integer(value: "Any") -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError("input should be a valid integer")
+    return value
+
+
+def obj(value: "Any") -> "dict[str, Any]":
+    if not isinstance(value, dict):
+        raise TypeError("input should be a valid dictionary")
+    return value
+
+
+def array(item: "Convert") -> "Convert":
+    def convert(value: "Any") -> "list[Any]":
+        if not isinstance(value, list):
+            raise TypeError("input should be a valid list")
+        return [item(entry) for entry in value]
+
+    return convert
+
+
+def optional(inner: "Convert") -> "Convert":
+    def convert(value: "Any") -> "Any":
+        return None if value is None else inner(value)
+
+    return convert
+
+
+def literal(*values: str) -> "Convert":
+    def convert(value: "Any") -> str:
+        if not isinstance(value, str) or value not in values:
+            raise ValueError(f"input should be {' or '.join(repr(v) for v in values)}")
+        return value
+
+    return convert
+
+
+def model(cls: "type[LiteModel]") -> "Convert":
+    def convert(value: "Any") -> "LiteModel":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls.from_dict(value)
+        raise TypeError(f"input should be a {cls.__name__} or an object")
+
+    return convert
+
+
+class ToolInputMixin:
+    __slots__ = ()
+
+    tool_name: str
+    tool_input: "dict[str, Any]"
+
+    def as_tool_input(self, tool_model: "type[M]") -> "M | None":
+        try:
+            return tool_model.from_dict(self.tool_input)
+        except ValidationError:
+            return None
@@ -0,0 +1,1117 @@
+# Generated by scripts/generate_schemas.py from schemas/models/*.schema.json. Do not edit.
+
+from cc_hooks.lite._runtime import (
+    REQUIRED,
+    LiteModel,
+    ToolInputMixin,
+    array,
+    boolean,
+    literal,
+    model,
+    obj,
+    optional,
+    string,
+)
+from cc_hooks.lite.tools import (
+    BashInput,
+    EditInput,
+    GlobInput,
+    GrepInput,
+    NotebookEditInput,
+    ReadInput,
+    TaskInput,
+    WebFetchInput,
+    WebSearchInput,
+    WriteInput,
+)
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class ToolInputParsingMixin(ToolInputMixin):
+    __slots__ = ()
+
+    def as_bash_input(self) -> "BashInput | None":
+        return self.as_tool_input(BashInput) if self.tool_name == "Bash" else None
+
+    def as_edit_input(self) -> "EditInput | None":
+        return self.as_tool_input(EditInput) if self.tool_name == "Edit" else None
+
+    def as_glob_input(self) -> "GlobInput | None":
+        return self.as_tool_input(GlobInput) if self.tool_name == "Glob" else None
+
+    def as_grep_input(self) -> "GrepInput | None":
+        return self.as_tool_input(GrepInput) if self.tool_name == "Grep" else None
+
+    def as_notebook_edit_input(self) -> "NotebookEditInput | None":
+        return self.as_tool_input(NotebookEditInput) if self.tool_name == "NotebookEdit" else None
+
+    def as_read_input(self) -> "ReadInput | None":
+        return self.as_tool_input(ReadInput) if self.tool_name == "Read" else None
+
+    def as_task_input(self) -> "TaskInput | None":
+        return self.as_tool_input(TaskInput) if self.tool_name == "Task" else None
+
+    def as_web_fetch_input(self) -> "WebFetchInput | None":
+        return self.as_tool_input(WebFetchInput) if self.tool_name == "WebFetch" else None
+
+    def as_web_search_input(self) -> "WebSearchInput | None":
+        return self.as_tool_input(WebSearchInput) if self.tool_name == "WebSearch" else None
+
+    def as_write_input(self) -> "WriteInput | None":
+        return self.as_tool_input(WriteInput) if self.tool_name == "Write" else None
+
+
+class ConfigChangeInput(LiteModel):
+    __slots__ = ("cwd", "file_path", "hook_event_name", "permission_mode", "session_id", "source", "transcript_path")
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("ConfigChange"), "ConfigChange"),
+        ("source", "source", string, REQUIRED),
+        ("file_path", "filePath", optional(string), None),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    source: str
+    file_path: str | None
+
+
+class ConfigChangeOutput(LiteModel):
+    __slots__ = ("continue_", "decision", "reason", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("decision", "decision", optional(string), None),
+        ("reason", "reason", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    decision: str | None
+    reason: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "ConfigChangeOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def ok(cls) -> "ConfigChangeOutput":
+        return cls()
+
+    @classmethod
+    def block(cls, reason: str) -> "ConfigChangeOutput":
+        return cls(decision="block", reason=reason)
+
+
+class NotificationInput(LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "message",
+        "notification_type",
+        "permission_mode",
+        "session_id",
+        "title",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("Notification"), "Notification"),
+        ("message", "message", string, REQUIRED),
+        ("title", "title", optional(string), None),
+        ("notification_type", "notificationType", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    message: str
+    title: str | None
+    notification_type: str
+
+
+class NotificationOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "NotificationOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class PermissionRequestInput(ToolInputParsingMixin, LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "permission_suggestions",
+        "session_id",
+        "tool_input",
+        "tool_name",
+        "transcript_path",
+    )
+    _fields = (
+        ("tool_name", "toolName", string, REQUIRED),
+        ("tool_input", "toolInput", obj, REQUIRED),
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("PermissionRequest"), "PermissionRequest"),
+        ("permission_suggestions", "permissionSuggestions", optional(array(obj)), None),
+    )
+
+    tool_name: str
+    tool_input: "dict[str, Any]"
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    permission_suggestions: "list[dict[str, Any]] | None"
+
+
+class PermissionRequestDecision(LiteModel):
+    __slots__ = ("behavior", "message", "updated_input")
+    _fields = (
+        ("behavior", "behavior", literal("allow", "deny", "ask"), REQUIRED),
+        ("message", "message", optional(string), None),
+        ("updated_input", "updatedInput", optional(obj), None),
+    )
+
+    behavior: str
+    message: str | None
+    updated_input: "dict[str, Any] | None"
+
+
+class PermissionRequestHookSpecific(LiteModel):
+    __slots__ = ("decision", "hook_event_name")
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("PermissionRequest"), "PermissionRequest"),
+        ("decision", "decision", optional(model(PermissionRequestDecision)), None),
+    )
+
+    hook_event_name: str
+    decision: PermissionRequestDecision | None
+
+
+class PermissionRequestOutput(LiteModel):
+    __slots__ = ("continue_", "hook_specific_output", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(PermissionRequestHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    hook_specific_output: PermissionRequestHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "PermissionRequestOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def allow(cls, message: str | None = None) -> "PermissionRequestOutput":
+        return cls(
+            hook_specific_output=PermissionRequestHookSpecific(
+                decision=PermissionRequestDecision(behavior="allow", message=message),
+            ),
+        )
+
+    @classmethod
+    def deny(cls, message: str | None = None) -> "PermissionRequestOutput":
+        return cls(
+            hook_specific_output=PermissionRequestHookSpecific(
+                decision=PermissionRequestDecision(behavior="deny", message=message),
+            ),
+        )
+
+    @classmethod
+    def ask(cls, message: str | None = None) -> "PermissionRequestOutput":
+        return cls(
+            hook_specific_output=PermissionRequestHookSpecific(
+                decision=PermissionRequestDecision(behavior="ask", message=message),
+            ),
+        )
+
+    @classmethod
+    def modify_and_allow(cls, updated_input: "dict[str, Any]", message: str | None = None) -> "PermissionRequestOutput":
+        return cls(
+            hook_specific_output=PermissionRequestHookSpecific(
+                decision=PermissionRequestDecision(behavior="allow", message=message, updated_input=updated_input),
+            ),
+        )
+
+
+class PostToolUseFailureInput(ToolInputParsingMixin, LiteModel):
+    __slots__ = (
+        "cwd",
+        "error",
+        "hook_event_name",
+        "is_interrupt",
+        "permission_mode",
+        "session_id",
+        "tool_input",
+        "tool_name",
+        "tool_use_id",
+        "transcript_path",
+    )
+    _fields = (
+        ("tool_name", "toolName", string, REQUIRED),
+        ("tool_input", "toolInput", obj, REQUIRED),
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("PostToolUseFailure"), "PostToolUseFailure"),
+        ("tool_use_id", "toolUseId", string, REQUIRED),
+        ("error", "error", string, REQUIRED),
+        ("is_interrupt", "isInterrupt", optional(boolean), None),
+    )
+
+    tool_name: str
+    tool_input: "dict[str, Any]"
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    tool_use_id: str
+    error: str
+    is_interrupt: bool | None
+
+
+class PostToolUseFailureHookSpecific(LiteModel):
+    __slots__ = ("additional_context", "hook_event_name")
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("PostToolUseFailure"), "PostToolUseFailure"),
+        ("additional_context", "additionalContext", optional(string), None),
+    )
+
+    hook_event_name: str
+    additional_context: str | None
+
+
+class PostToolUseFailureOutput(LiteModel):
+    __slots__ = ("continue_", "hook_specific_output", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(PostToolUseFailureHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    hook_specific_output: PostToolUseFailureHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "PostToolUseFailureOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def add_context(cls, context: str) -> "PostToolUseFailureOutput":
+        return cls(hook_specific_output=PostToolUseFailureHookSpecific(additional_context=context))
+
+
+class PostToolUseInput(ToolInputParsingMixin, LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "session_id",
+        "tool_input",
+        "tool_name",
+        "tool_response",
+        "tool_use_id",
+        "transcript_path",
+    )
+    _fields = (
+        ("tool_name", "toolName", string, REQUIRED),
+        ("tool_input", "toolInput", obj, REQUIRED),
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("PostToolUse"), "PostToolUse"),
+        ("tool_response", "toolResponse", obj, REQUIRED),
+        ("tool_use_id", "toolUseId", string, REQUIRED),
+    )
+
+    tool_name: str
+    tool_input: "dict[str, Any]"
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    tool_response: "dict[str, Any]"
+    tool_use_id: str
+
+
+class PostToolUseHookSpecific(LiteModel):
+    __slots__ = ("additional_context", "hook_event_name", "updated_mcp_tool_output")
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("PostToolUse"), "PostToolUse"),
+        ("additional_context", "additionalContext", optional(string), None),
+        ("updated_mcp_tool_output", "updatedMCPToolOutput", optional(obj), None),
+    )
+
+    hook_event_name: str
+    additional_context: str | None
+    updated_mcp_tool_output: "dict[str, Any] | None"
+
+
+class PostToolUseOutput(LiteModel):
+    __slots__ = (
+        "continue_",
+        "decision",
+        "hook_specific_output",
+        "reason",
+        "stop_reason",
+        "suppress_output",
+        "system_message",
+    )
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("decision", "decision", optional(string), None),
+        ("reason", "reason", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(PostToolUseHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    decision: str | None
+    reason: str | None
+    hook_specific_output: PostToolUseHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "PostToolUseOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def ok(cls) -> "PostToolUseOutput":
+        return cls()
+
+    @classmethod
+    def block(cls, reason: str) -> "PostToolUseOutput":
+        return cls(decision="block", reason=reason)
+
+    @classmethod
+    def add_context(cls, context: str) -> "PostToolUseOutput":
+        return cls(hook_specific_output=PostToolUseHookSpecific(additional_context=context))
+
+    @classmethod
+    def update_tool_output(cls, updated_output: "dict[str, Any]") -> "PostToolUseOutput":
+        return cls(hook_specific_output=PostToolUseHookSpecific(updated_mcp_tool_output=updated_output))
+
+
+class PreCompactInput(LiteModel):
+    __slots__ = (
+        "custom_instructions",
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "session_id",
+        "transcript_path",
+        "trigger",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("PreCompact"), "PreCompact"),
+        ("trigger", "trigger", string, REQUIRED),
+        ("custom_instructions", "customInstructions", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    trigger: str
+    custom_instructions: str
+
+
+class PreCompactOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "PreCompactOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class PreToolUseInput(ToolInputParsingMixin, LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "session_id",
+        "tool_input",
+        "tool_name",
+        "tool_use_id",
+        "transcript_path",
+    )
+    _fields = (
+        ("tool_name", "toolName", string, REQUIRED),
+        ("tool_input", "toolInput", obj, REQUIRED),
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("PreToolUse"), "PreToolUse"),
+        ("tool_use_id", "toolUseId", string, REQUIRED),
+    )
+
+    tool_name: str
+    tool_input: "dict[str, Any]"
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    tool_use_id: str
+
+
+class PreToolUseHookSpecific(LiteModel):
+    __slots__ = (
+        "additional_context",
+        "hook_event_name",
+        "permission_decision",
+        "permission_decision_reason",
+        "updated_input",
+    )
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("PreToolUse"), "PreToolUse"),
+        ("permission_decision", "permissionDecision", optional(literal("allow", "deny", "ask")), None),
+        ("permission_decision_reason", "permissionDecisionReason", optional(string), None),
+        ("updated_input", "updatedInput", optional(obj), None),
+        ("additional_context", "additionalContext", optional(string), None),
+    )
+
+    hook_event_name: str
+    permission_decision: str | None
+    permission_decision_reason: str | None
+    updated_input: "dict[str, Any] | None"
+    additional_context: str | None
+
+
+class PreToolUseOutput(LiteModel):
+    __slots__ = ("continue_", "hook_specific_output", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(PreToolUseHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    hook_specific_output: PreToolUseHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "PreToolUseOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def allow(cls) -> "PreToolUseOutput":
+        return cls(hook_specific_output=PreToolUseHookSpecific(permission_decision="allow"))
+
+    @classmethod
+    def deny(cls, reason: str) -> "PreToolUseOutput":
+        return cls(
+            hook_specific_output=PreToolUseHookSpecific(permission_decision="deny", permission_decision_reason=reason),
+        )
+
+    @classmethod
+    def ask(cls, reason: str) -> "PreToolUseOutput":
+        return cls(
+            hook_specific_output=PreToolUseHookSpecific(permission_decision="ask", permission_decision_reason=reason),
+        )
+
+    @classmethod
+    def modify(cls, updated_input: "dict[str, Any]", reason: str | None = None) -> "PreToolUseOutput":
+        return cls(
+            hook_specific_output=PreToolUseHookSpecific(
+                permission_decision="allow",
+                permission_decision_reason=reason,
+                updated_input=updated_input,
+            ),
+        )
+
+    @classmethod
+    def add_context(cls, context: str) -> "PreToolUseOutput":
+        return cls(hook_specific_output=PreToolUseHookSpecific(additional_context=context))
+
+
+class SessionEndInput(LiteModel):
+    __slots__ = ("cwd", "hook_event_name", "permission_mode", "reason", "session_id", "transcript_path")
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("SessionEnd"), "SessionEnd"),
+        ("reason", "reason", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    reason: str
+
+
+class SessionEndOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "SessionEndOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class SessionStartInput(LiteModel):
+    __slots__ = (
+        "agent_type",
+        "cwd",
+        "hook_event_name",
+        "model",
+        "permission_mode",
+        "session_id",
+        "source",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("SessionStart"), "SessionStart"),
+        ("source", "source", string, REQUIRED),
+        ("model", "model", string, REQUIRED),
+        ("agent_type", "agentType", optional(string), None),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    source: str
+    model: str
+    agent_type: str | None
+
+
+class SessionStartHookSpecific(LiteModel):
+    __slots__ = ("additional_context", "hook_event_name")
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("SessionStart"), "SessionStart"),
+        ("additional_context", "additionalContext", optional(string), None),
+    )
+
+    hook_event_name: str
+    additional_context: str | None
+
+
+class SessionStartOutput(LiteModel):
+    __slots__ = ("continue_", "hook_specific_output", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(SessionStartHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    hook_specific_output: SessionStartHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "SessionStartOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def add_context(cls, context: str) -> "SessionStartOutput":
+        return cls(hook_specific_output=SessionStartHookSpecific(additional_context=context))
+
+
+class StopInput(LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "last_assistant_message",
+        "permission_mode",
+        "session_id",
+        "stop_hook_active",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("Stop"), "Stop"),
+        ("stop_hook_active", "stopHookActive", boolean, REQUIRED),
+        ("last_assistant_message", "lastAssistantMessage", optional(string), None),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    stop_hook_active: bool
+    last_assistant_message: str | None
+
+
+class StopOutput(LiteModel):
+    __slots__ = ("continue_", "decision", "reason", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("decision", "decision", optional(string), None),
+        ("reason", "reason", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    decision: str | None
+    reason: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "StopOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def ok(cls) -> "StopOutput":
+        return cls()
+
+    @classmethod
+    def block(cls, reason: str) -> "StopOutput":
+        return cls(decision="block", reason=reason)
+
+
+class SubagentStartInput(LiteModel):
+    __slots__ = ("agent_id", "agent_type", "cwd", "hook_event_name", "permission_mode", "session_id", "transcript_path")
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("SubagentStart"), "SubagentStart"),
+        ("agent_id", "agentId", string, REQUIRED),
+        ("agent_type", "agentType", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    agent_id: str
+    agent_type: str
+
+
+class SubagentStartOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "SubagentStartOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class SubagentStopInput(LiteModel):
+    __slots__ = (
+        "agent_id",
+        "agent_transcript_path",
+        "agent_type",
+        "cwd",
+        "hook_event_name",
+        "last_assistant_message",
+        "permission_mode",
+        "session_id",
+        "stop_hook_active",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("SubagentStop"), "SubagentStop"),
+        ("stop_hook_active", "stopHookActive", boolean, REQUIRED),
+        ("agent_id", "agentId", string, REQUIRED),
+        ("agent_type", "agentType", string, REQUIRED),
+        ("agent_transcript_path", "agentTranscriptPath", string, REQUIRED),
+        ("last_assistant_message", "lastAssistantMessage", optional(string), None),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    stop_hook_active: bool
+    agent_id: str
+    agent_type: str
+    agent_transcript_path: str
+    last_assistant_message: str | None
+
+
+class SubagentStopOutput(LiteModel):
+    __slots__ = ("continue_", "decision", "reason", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("decision", "decision", optional(string), None),
+        ("reason", "reason", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    decision: str | None
+    reason: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "SubagentStopOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def ok(cls) -> "SubagentStopOutput":
+        return cls()
+
+    @classmethod
+    def block(cls, reason: str) -> "SubagentStopOutput":
+        return cls(decision="block", reason=reason)
+
+
+class TaskCompletedInput(LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "session_id",
+        "task_description",
+        "task_id",
+        "task_subject",
+        "team_name",
+        "teammate_name",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("TaskCompleted"), "TaskCompleted"),
+        ("task_id", "taskId", string, REQUIRED),
+        ("task_subject", "taskSubject", string, REQUIRED),
+        ("task_description", "taskDescription", optional(string), None),
+        ("teammate_name", "teammateName", optional(string), None),
+        ("team_name", "teamName", optional(string), None),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    task_id: str
+    task_subject: str
+    task_description: str | None
+    teammate_name: str | None
+    team_name: str | None
+
+
+class TaskCompletedOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "TaskCompletedOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class TeammateIdleInput(LiteModel):
+    __slots__ = (
+        "cwd",
+        "hook_event_name",
+        "permission_mode",
+        "session_id",
+        "team_name",
+        "teammate_name",
+        "transcript_path",
+    )
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("TeammateIdle"), "TeammateIdle"),
+        ("teammate_name", "teammate_name", string, REQUIRED),
+        ("team_name", "team_name", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    teammate_name: str
+    team_name: str
+
+
+class TeammateIdleOutput(LiteModel):
+    __slots__ = ("continue_", "stop_reason", "suppress_output", "system_message")
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "TeammateIdleOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+
+class UserPromptSubmitInput(LiteModel):
+    __slots__ = ("cwd", "hook_event_name", "permission_mode", "prompt", "session_id", "transcript_path")
+    _fields = (
+        ("session_id", "sessionId", string, REQUIRED),
+        ("transcript_path", "transcriptPath", string, REQUIRED),
+        ("cwd", "cwd", string, REQUIRED),
+        ("permission_mode", "permissionMode", string, REQUIRED),
+        ("hook_event_name", "hookEventName", literal("UserPromptSubmit"), "UserPromptSubmit"),
+        ("prompt", "prompt", string, REQUIRED),
+    )
+
+    session_id: str
+    transcript_path: str
+    cwd: str
+    permission_mode: str
+    hook_event_name: str
+    prompt: str
+
+
+class UserPromptSubmitHookSpecific(LiteModel):
+    __slots__ = ("additional_context", "hook_event_name")
+    _fields = (
+        ("hook_event_name", "hookEventName", literal("UserPromptSubmit"), "UserPromptSubmit"),
+        ("additional_context", "additionalContext", optional(string), None),
+    )
+
+    hook_event_name: str
+    additional_context: str | None
+
+
+class UserPromptSubmitOutput(LiteModel):
+    __slots__ = (
+        "continue_",
+        "decision",
+        "hook_specific_output",
+        "reason",
+        "stop_reason",
+        "suppress_output",
+        "system_message",
+    )
+    _fields = (
+        ("continue_", "continue", optional(boolean), None),
+        ("stop_reason", "stopReason", optional(string), None),
+        ("suppress_output", "suppressOutput", optional(boolean), None),
+        ("system_message", "systemMessage", optional(string), None),
+        ("decision", "decision", optional(string), None),
+        ("reason", "reason", optional(string), None),
+        ("hook_specific_output", "hookSpecificOutput", optional(model(UserPromptSubmitHookSpecific)), None),
+    )
+
+    continue_: bool | None
+    stop_reason: str | None
+    suppress_output: bool | None
+    system_message: str | None
+    decision: str | None
+    reason: str | None
+    hook_specific_output: UserPromptSubmitHookSpecific | None
+
+    @classmethod
+    def stop_session(cls, reason: str) -> "UserPromptSubmitOutput":
+        return cls(continue_=False, stop_reason=reason)
+
+    @classmethod
+    def ok(cls) -> "UserPromptSubmitOutput":
+        return cls()
+
+    @classmethod
+    def block(cls, reason: str) -> "UserPromptSubmitOutput":
+        return cls(decision="block", reason=reason)
+
+    @classmethod
+    def add_context(cls, context: str) -> "UserPromptSubmitOutput":
+        return cls(hook_specific_output=UserPromptSubmitHookSpecific(additional_context=context))
+
+
+INPUT_MODELS: "dict[str, type[LiteModel]]" = {
+    "ConfigChange": ConfigChangeInput,
+    "Notification": NotificationInput,
+    "PermissionRequest": PermissionRequestInput,
+    "PostToolUseFailure": PostToolUseFailureInput,
+    "PostToolUse": PostToolUseInput,
+    "PreCompact": PreCompactInput,
+    "PreToolUse": PreToolUseInput,
+    "SessionEnd": SessionEndInput,
+    "SessionStart": SessionStartInput,
+    "Stop": StopInput,
+    "SubagentStart": SubagentStartInput,
+    "SubagentStop": SubagentStopInput,
+    "TaskCompleted": TaskCompletedInput,
+    "TeammateIdle": TeammateIdleInput,
+    "UserPromptSubmit": UserPromptSubmitInput,
+}
+
+__all__ = [
+    "INPUT_MODELS",
+    "ConfigChangeInput",
+    "ConfigChangeOutput",
+    "NotificationInput",
+    "NotificationOutput",
+    "PermissionRequestDecision",
+    "PermissionRequestHookSpecific",
+    "PermissionRequestInput",
+    "PermissionRequestOutput",
+    "PostToolUseFailureHookSpecific",
+    "PostToolUseFailureInput",
+    "PostToolUseFailureOutput",
+    "PostToolUseHookSpecific",
+    "PostToolUseInput",
+    "PostToolUseOutput",
+    "PreCompactInput",
+    "PreCompactOutput",
+    "PreToolUseHookSpecific",
+    "PreToolUseInput",
+    "PreToolUseOutput",
+    "SessionEndInput",
+    "SessionEndOutput",
+    "SessionStartHookSpecific",
+    "SessionStartInput",
+    "SessionStartOutput",
+    "StopInput",
+    "StopOutput",
+    "SubagentStartInput",
+    "SubagentStartOutput",
+    "SubagentStopInput",
+    "SubagentStopOutput",
+    "TaskCompletedInput",
+    "TaskCompletedOutput",
+    "TeammateIdleInput",
+    "TeammateIdleOutput",
+    "UserPromptSubmitHookSpecific",
+    "UserPromptSubmitInput",
+    "UserPromptSubmitOutput",
+]
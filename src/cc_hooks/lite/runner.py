@@ -0,0 +1,204 @@
+import json
+import sys
+
+from cc_hooks.lite._runtime import LiteModel
+from cc_hooks.lite.models import INPUT_MODELS
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from types import FrameType
+    from typing import Any
+
+    Handler = Callable[[Any], LiteModel | None | Awaitable[LiteModel | None]]
+
+_HANDLERS: "dict[tuple[str, str | None], list[Handler]]" = {}
+
+# cc_hooks.merge's rules, restated here because that module imports pydantic.
+SEPARATOR = "\n"
+PRECEDENCE = {
+    "permission_decision": ("deny", "ask", "allow"),
+    "behavior": ("deny", "ask", "allow"),
+    "decision": ("block",),
+}
+REASONS = {"permission_decision_reason": "permission_decision", "message": "behavior", "reason": "decision"}
+JOINED = frozenset({"additional_context", "system_message", "stop_reason"})
+STICKY = {"continue_": False, "suppress_output": True}
+
+
+def hook(event: str, tool: str | None = None, *, defer: bool | None = None) -> "Callable[[Handler], Handler]":
+    # Same contract as cc_hooks.runner.hook, with cc_hooks.lite models in and out.
+    # Handlers of one event run one after another rather than concurrently, and only
+    # the runner options shown here exist.
+    resolved_event = str(event)
+
+    def decorator(fn: "Handler") -> "Handler":
+        _register(_HANDLERS.setdefault((resolved_event, tool), []), fn)
+        caller = sys._getframe(1)
+        if caller.f_globals.get("__name__") == "__main__" and not _deferred(caller, defer):
+            _execute(fn, resolved_event, tool)
+
+        return fn
+
+    return decorator
+
+
+def _register(handlers: "list[Handler]", fn: "Handler") -> None:
+    key = (getattr(fn, "__module__", None), getattr(fn, "__qualname__", None))
+    for index, existing in enumerate(handlers):
+        if (getattr(existing, "__module__", None), getattr(existing, "__qualname__", None)) == key:
+            handlers[index] = fn
+            return
+    handlers.append(fn)
+
+
+def run() -> None:
+    code, stdout, stderr = _dispatch(_read_stdin())
+    _write_stdout(stdout)
+    sys.stderr.write(stderr)
+    raise SystemExit(code)
+
+
+def _read_stdin() -> bytes:
+    buffer = getattr(sys.stdin, "buffer", None)
+    if buffer is None:
+        return sys.stdin.read().encode("utf-8")
+    raw: bytes = buffer.read()
+    return raw
+
+
+def _write_stdout(data: bytes) -> None:
+    if not data:
+        return
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _deferred(frame: "FrameType", defer: bool | None) -> bool:
+    if defer is not None:
+        return defer
+    return frame.f_globals.get("run") is run
+
+
+def _load_payload(raw: bytes) -> "dict[str, Any]":
+    data = json.loads(raw)
+    if not isinstance(data, dict):
+        raise TypeError("payload is not a JSON object")
+    return data
+
+
+def _envelope(data: "dict[str, Any]", alias: str, name: str) -> str | None:
+    value = data.get(alias, data.get(name))
+    return value if isinstance(value, str) else None
+
+
+def _execute(fn: "Handler", event: str, tool: str | None = None) -> None:
+    try:
+        data = _load_payload(_read_stdin())
+    except Exception as exc:
+        sys.stderr.write(_format_error(exc, event, fn))
+        raise SystemExit(2) from exc
+
+    if tool is not None and _envelope(data, "toolName", "tool_name") != tool:
+        raise SystemExit(0)
+
+    code, stdout, stderr = _run_handlers([fn], event, data)
+    _write_stdout(stdout)
+    sys.stderr.write(stderr)
+    raise SystemExit(code)
+
+
+def _dispatch(raw: bytes) -> tuple[int, bytes, str]:
+    try:
+        data = _load_payload(raw)
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, "<unknown>", None)
+
+    event = _envelope(data, "hookEventName", "hook_event_name")
+    if event is None:
+        return 2, b"", f"ValueError in event={event} handler=<handler>: payload has no hook_event_name"
+
+    # Handlers registered without a tool come first, then the ones for this tool.
+    tool = _envelope(data, "toolName", "tool_name")
+    fns = _HANDLERS.get((event, None), []) + (_HANDLERS.get((event, tool), []) if tool is not None else [])
+    if not fns:
+        return 0, b"", ""
+    return _run_handlers(fns, event, data)
+
+
+def _run_handlers(fns: "list[Handler]", event: str, data: "dict[str, Any]") -> tuple[int, bytes, str]:
+    try:
+        input_model = INPUT_MODELS.get(event)
+        if input_model is None:
+            raise ValueError(f"Unsupported hook event: {event}")
+        parsed = input_model.from_dict(data)
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, event, fns[0])
+
+    # Every handler receives the same input instance, as with cc_hooks.runner.
+    outputs: list[LiteModel] = []
+    for fn in fns:
+        try:
+            result = fn(parsed)
+            if hasattr(result, "__await__"):
+                import asyncio
+
+                result = asyncio.run(result)  # type: ignore[arg-type]
+        except Exception as exc:  # noqa: BLE001
+            return 2, b"", _format_error(exc, event, fn)
+        if result is not None:
+            outputs.append(result)
+    try:
+        if not outputs:
+            return 0, b"", ""
+        return 0, (_merge(outputs) if len(outputs) > 1 else outputs[0]).to_json(), ""
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, event, fns[0])
+
+
+def _merge(outputs: "list[LiteModel]") -> LiteModel:
+    model = type(outputs[0])
+    if any(type(output) is not model for output in outputs):
+        names = sorted({type(output).__name__ for output in outputs})
+        raise TypeError(f"Cannot merge different output types: {', '.join(names)}")
+
+    values: dict[str, Any] = {}
+    for name in sorted((field[0] for field in model._fields), key=lambda field: field not in PRECEDENCE):
+        present = [output for output in outputs if getattr(output, name) is not None]
+        if not present:
+            continue
+        if isinstance(getattr(present[0], name), LiteModel):
+            values[name] = _merge([getattr(output, name) for output in present])
+        elif name in REASONS:
+            decision = values.get(REASONS[name])
+            deciding = [output for output in present if getattr(output, REASONS[name], None) == decision]
+            values[name] = SEPARATOR.join(getattr(output, name) for output in deciding or present)
+        elif name in PRECEDENCE:
+            order = PRECEDENCE[name]
+            values[name] = min(
+                (getattr(output, name) for output in present),
+                key=lambda value: order.index(value) if value in order else len(order),
+            )
+        elif name in JOINED:
+            values[name] = SEPARATOR.join(getattr(output, name) for output in present)
+        elif name in STICKY:
+            flags = [getattr(output, name) for output in present]
+            values[name] = STICKY[name] if STICKY[name] in flags else flags[0]
+        else:
+            values[name] = getattr(present[0], name)
+
+    extra: dict[str, Any] = {}
+    for output in reversed(outputs):
+        extra.update(output.extra)
+    return model(**values, **extra)
+
+
+def _format_error(exc: Exception, event: str, fn: "Handler | None") -> str:
+    handler_name = getattr(fn, "__name__", "<handler>")
+    return f"{type(exc).__name__} in event={event} handler={handler_name}: {exc}"
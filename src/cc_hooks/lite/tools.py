@@ -0,0 +1,153 @@
+# Generated by scripts/generate_schemas.py from schemas/tools/*.schema.json. Do not edit.
+
+from cc_hooks.lite._runtime import REQUIRED, LiteModel, boolean, integer, optional, string
+
+
+class BashInput(LiteModel):
+    __slots__ = ("command", "description", "run_in_background", "timeout")
+    _fields = (
+        ("command", "command", string, REQUIRED),
+        ("description", "description", optional(string), None),
+        ("timeout", "timeout", optional(integer), None),
+        ("run_in_background", "runInBackground", optional(boolean), None),
+    )
+
+    command: str
+    description: str | None
+    timeout: int | None
+    run_in_background: bool | None
+
+
+class EditInput(LiteModel):
+    __slots__ = ("file_path", "new_string", "old_string", "replace_all")
+    _fields = (
+        ("file_path", "filePath", string, REQUIRED),
+        ("old_string", "oldString", string, REQUIRED),
+        ("new_string", "newString", string, REQUIRED),
+        ("replace_all", "replaceAll", boolean, False),
+    )
+
+    file_path: str
+    old_string: str
+    new_string: str
+    replace_all: bool
+
+
+class GlobInput(LiteModel):
+    __slots__ = ("case_sensitive", "path", "pattern")
+    _fields = (
+        ("pattern", "pattern", string, REQUIRED),
+        ("path", "path", optional(string), None),
+        ("case_sensitive", "caseSensitive", optional(boolean), None),
+    )
+
+    pattern: str
+    path: str | None
+    case_sensitive: bool | None
+
+
+class GrepInput(LiteModel):
+    __slots__ = ("ignore_case", "include", "multiline", "path", "pattern")
+    _fields = (
+        ("pattern", "pattern", string, REQUIRED),
+        ("path", "path", optional(string), None),
+        ("include", "include", optional(string), None),
+        ("multiline", "multiline", optional(boolean), None),
+        ("ignore_case", "ignoreCase", optional(boolean), None),
+    )
+
+    pattern: str
+    path: str | None
+    include: str | None
+    multiline: bool | None
+    ignore_case: bool | None
+
+
+class NotebookEditInput(LiteModel):
+    __slots__ = ("cell_id", "content", "edit", "notebook_path")
+    _fields = (
+        ("notebook_path", "notebookPath", string, REQUIRED),
+        ("cell_id", "cellId", optional(string), None),
+        ("edit", "edit", optional(string), None),
+        ("content", "content", optional(string), None),
+    )
+
+    notebook_path: str
+    cell_id: str | None
+    edit: str | None
+    content: str | None
+
+
+class ReadInput(LiteModel):
+    __slots__ = ("file_path", "limit", "offset")
+    _fields = (
+        ("file_path", "filePath", string, REQUIRED),
+        ("offset", "offset", optional(integer), None),
+        ("limit", "limit", optional(integer), None),
+    )
+
+    file_path: str
+    offset: int | None
+    limit: int | None
+
+
+class TaskInput(LiteModel):
+    __slots__ = ("description", "prompt", "subagent_type")
+    _fields = (
+        ("description", "description", string, REQUIRED),
+        ("prompt", "prompt", string, REQUIRED),
+        ("subagent_type", "subagentType", optional(string), None),
+    )
+
+    description: str
+    prompt: str
+    subagent_type: str | None
+
+
+class WebFetchInput(LiteModel):
+    __slots__ = ("prompt", "timeout_ms", "url")
+    _fields = (
+        ("url", "url", string, REQUIRED),
+        ("prompt", "prompt", optional(string), None),
+        ("timeout_ms", "timeoutMs", optional(integer), None),
+    )
+
+    url: str
+    prompt: str | None
+    timeout_ms: int | None
+
+
+class WebSearchInput(LiteModel):
+    __slots__ = ("query", "recency_days")
+    _fields = (
+        ("query", "query", string, REQUIRED),
+        ("recency_days", "recencyDays", optional(integer), None),
+    )
+
+    query: str
+    recency_days: int | None
+
+
+class WriteInput(LiteModel):
+    __slots__ = ("content", "file_path")
+    _fields = (
+        ("file_path", "filePath", string, REQUIRED),
+        ("content", "content", string, REQUIRED),
+    )
+
+    file_path: str
+    content: str
+
+
+__all__ = [
+    "BashInput",
+    "EditInput",
+    "GlobInput",
+    "GrepInput",
+    "NotebookEditInput",
+    "ReadInput",
+    "TaskInput",
+    "WebFetchInput",
+    "WebSearchInput",
+    "WriteInput",
+]
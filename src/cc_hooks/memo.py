@@ -0,0 +1,150 @@
+import functools
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from cc_hooks._storage import cache_home, connect, owned
+from cc_hooks.chain import qualified_name
+
+ENV_DB = "CC_HOOKS_CACHE_DB"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Hits refresh their LRU position at most this often, so a hit stays a single read.
+TOUCH_INTERVAL = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memo (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    fingerprint TEXT NOT NULL,
+    expires REAL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS memo_accessed ON memo (accessed);
+"""
+
+Paths = Iterable[str | os.PathLike[str]]
+
+
+def default_cache_path() -> Path:
+    configured = os.environ.get(ENV_DB)
+    if configured:
+        return Path(configured)
+    return cache_home() / "memo" / "memo.sqlite3"
+
+
+def cached(
+    fn: Callable[..., Any] | None = None,
+    *,
+    key: Callable[..., Any] | None = None,
+    ttl: float | None = None,
+    invalidate_on: Paths | Callable[..., Paths] = (),
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    path: str | os.PathLike[str] | None = None,
+) -> Any:
+    # Results are shared by every hook process of the project. An entry is reused
+    # while it is younger than `ttl` and every `invalidate_on` path has the mtime
+    # and size it had when the value was computed.
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        name = qualified_name(fn)
+
+        def entry(args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[str, str]:
+            project = os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+            arguments = key(*args, **kwargs) if key is not None else (args, sorted(kwargs.items()))
+            digest = hashlib.sha256(f"{project}\0{name}\0{arguments!r}".encode()).hexdigest()[:32]
+            paths = invalidate_on(*args, **kwargs) if callable(invalidate_on) else invalidate_on
+            return digest, _fingerprint(paths)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            digest, fingerprint = entry(args, kwargs)
+            try:
+                db = _connect(Path(path) if path is not None else default_cache_path())
+                found = _lookup(db, digest, fingerprint)
+            except (OSError, sqlite3.Error):
+                return fn(*args, **kwargs)
+            if found is not None:
+                return found[0]
+            value = fn(*args, **kwargs)
+            try:
+                _store(db, digest, value, fingerprint, ttl, max_bytes)
+            except (OSError, sqlite3.Error, pickle.PicklingError, TypeError, AttributeError):
+                pass  # Unpicklable values and read-only caches are simply not cached.
+            return value
+
+        def cache_lookup(*args: Any, **kwargs: Any) -> tuple[Any] | None:
+            # A 1-tuple holding the cached value, or None on a miss; never calls fn.
+            try:
+                return _lookup(_connect(Path(path) if path is not None else default_cache_path()), *entry(args, kwargs))
+            except (OSError, sqlite3.Error):
+                return None
+
+        wrapper.cache_clear = lambda: clear_cache(path)  # type: ignore[attr-defined]
+        wrapper.cache_lookup = cache_lookup  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator if fn is None else decorator(fn)
+
+
+def clear_cache(path: str | os.PathLike[str] | None = None) -> None:
+    _connect(Path(path) if path is not None else default_cache_path()).execute("DELETE FROM memo")
+
+
+def _lookup(db: sqlite3.Connection, digest: str, fingerprint: str) -> tuple[Any] | None:
+    row = db.execute("SELECT value, fingerprint, expires, accessed FROM memo WHERE key = ?", (digest,)).fetchone()
+    if row is None:
+        return None
+    value, stored, expires, accessed = row
+    now = time.time()
+    if stored != fingerprint or (expires is not None and now >= expires):
+        return None
+    try:
+        result = pickle.loads(value)
+    except Exception:  # noqa: BLE001
+        return None
+    if now - accessed > TOUCH_INTERVAL:
+        db.execute("UPDATE memo SET accessed = ? WHERE key = ?", (now, digest))
+    return (result,)
+
+
+def _store(db: sqlite3.Connection, digest: str, value: Any, fingerprint: str, ttl: float | None, limit: int) -> None:
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    now = time.time()
+    db.execute(
+        "INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?, ?)",
+        (digest, data, fingerprint, now + ttl if ttl is not None else None, now, len(data)),
+    )
+    # Least recently used entries beyond `limit` bytes in total are evicted.
+    db.execute(
+        "DELETE FROM memo WHERE key IN (SELECT key FROM "
+        "(SELECT key, sum(size) OVER (ORDER BY accessed DESC) AS total FROM memo) WHERE total > ?)",
+        (limit,),
+    )
+
+
+def _fingerprint(paths: Paths) -> str:
+    parts = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            parts.append(f"{os.fspath(path)}:-")
+        else:
+            parts.append(f"{os.fspath(path)}:{stat.st_mtime_ns}:{stat.st_size}")
+    return "\0".join(parts)
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    db = connect(path, _SCHEMA)
+    # Values are unpickled on lookup, so the cache must be private like the schema cache.
+    if not owned(path.parent, 0o077) or not owned(path, 0o022):
+        raise PermissionError(f"{path} is not private to this user")
+    return db
+
+
+__all__ = ["cached", "clear_cache", "default_cache_path"]
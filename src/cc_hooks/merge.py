@@ -0,0 +1,70 @@
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+SEPARATOR = "\n"
+
+# Decision fields, most restrictive value first. Values not listed rank below the
+# listed ones, and ties go to the handler registered first.
+PRECEDENCE: dict[str, tuple[str, ...]] = {
+    "permission_decision": ("deny", "ask", "allow"),
+    "behavior": ("deny", "ask", "allow"),
+    "decision": ("block",),
+}
+# Text that explains a decision is joined only from outputs that made the winning one.
+REASONS: dict[str, str] = {
+    "permission_decision_reason": "permission_decision",
+    "message": "behavior",
+    "reason": "decision",
+}
+JOINED = frozenset({"additional_context", "system_message", "stop_reason"})
+# continue=False stops Claude and suppressOutput=True hides output, whichever handler asks.
+STICKY: dict[str, bool] = {"continue_": False, "suppress_output": True}
+
+
+def merge_outputs(outputs: Sequence[BaseModel]) -> BaseModel:
+    if not outputs:
+        raise ValueError("merge_outputs() needs at least one output")
+    model = type(outputs[0])
+    if any(type(output) is not model for output in outputs):
+        names = sorted({type(output).__name__ for output in outputs})
+        raise TypeError(f"Cannot merge different output types: {', '.join(names)}")
+    if len(outputs) == 1:
+        return outputs[0]
+
+    values: dict[str, Any] = {}
+    for name in sorted(model.model_fields, key=lambda field: field not in PRECEDENCE):
+        present = [output for output in outputs if getattr(output, name) is not None]
+        if not present:
+            continue
+        if isinstance(getattr(present[0], name), BaseModel):
+            values[name] = merge_outputs([getattr(output, name) for output in present])
+        elif name in REASONS:
+            decision = values.get(REASONS[name])
+            deciding = [output for output in present if getattr(output, REASONS[name], None) == decision]
+            values[name] = SEPARATOR.join(getattr(output, name) for output in deciding or present)
+        elif name in PRECEDENCE:
+            values[name] = min((getattr(output, name) for output in present), key=_rank(PRECEDENCE[name]))
+        elif name in JOINED:
+            values[name] = SEPARATOR.join(getattr(output, name) for output in present)
+        elif name in STICKY:
+            flags = [getattr(output, name) for output in present]
+            values[name] = STICKY[name] if STICKY[name] in flags else flags[0]
+        else:
+            values[name] = getattr(present[0], name)
+
+    extra: dict[str, Any] = {}
+    for output in reversed(outputs):
+        extra.update(output.__pydantic_extra__ or {})
+    return model(**values, **extra)
+
+
+def _rank(order: tuple[str, ...]) -> Any:
+    def rank(value: Any) -> int:
+        return order.index(value) if value in order else len(order)
+
+    return rank
+
+
+__all__ = ["merge_outputs"]
@@ -1,18 +1,69 @@
-from cc_hooks.models.config_change import ConfigChangeInput, ConfigChangeOutput
-from cc_hooks.models.notification import NotificationInput, NotificationOutput
-from cc_hooks.models.permission_request import PermissionRequestInput, PermissionRequestOutput
-from cc_hooks.models.post_tool_use import PostToolUseInput, PostToolUseOutput
-from cc_hooks.models.post_tool_use_failure import PostToolUseFailureInput, PostToolUseFailureOutput
-from cc_hooks.models.pre_compact import PreCompactInput, PreCompactOutput
-from cc_hooks.models.pre_tool_use import PreToolUseInput, PreToolUseOutput
-from cc_hooks.models.session_end import SessionEndInput, SessionEndOutput
-from cc_hooks.models.session_start import SessionStartInput, SessionStartOutput
-from cc_hooks.models.stop import StopInput, StopOutput
-from cc_hooks.models.subagent_start import SubagentStartInput, SubagentStartOutput
-from cc_hooks.models.subagent_stop import SubagentStopInput, SubagentStopOutput
-from cc_hooks.models.task_completed import TaskCompletedInput, TaskCompletedOutput
-from cc_hooks.models.teammate_idle import TeammateIdleInput, TeammateIdleOutput
-from cc_hooks.models.user_prompt_submit import UserPromptSubmitInput, UserPromptSubmitOutput
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cc_hooks.models.config_change import ConfigChangeInput, ConfigChangeOutput
+    from cc_hooks.models.notification import NotificationInput, NotificationOutput
+    from cc_hooks.models.permission_request import PermissionRequestInput, PermissionRequestOutput
+    from cc_hooks.models.post_tool_use import PostToolUseInput, PostToolUseOutput
+    from cc_hooks.models.post_tool_use_failure import PostToolUseFailureInput, PostToolUseFailureOutput
+    from cc_hooks.models.pre_compact import PreCompactInput, PreCompactOutput
+    from cc_hooks.models.pre_tool_use import PreToolUseInput, PreToolUseOutput
+    from cc_hooks.models.session_end import SessionEndInput, SessionEndOutput
+    from cc_hooks.models.session_start import SessionStartInput, SessionStartOutput
+    from cc_hooks.models.stop import StopInput, StopOutput
+    from cc_hooks.models.subagent_start import SubagentStartInput, SubagentStartOutput
+    from cc_hooks.models.subagent_stop import SubagentStopInput, SubagentStopOutput
+    from cc_hooks.models.task_completed import TaskCompletedInput, TaskCompletedOutput
+    from cc_hooks.models.teammate_idle import TeammateIdleInput, TeammateIdleOutput
+    from cc_hooks.models.user_prompt_submit import UserPromptSubmitInput, UserPromptSubmitOutput
+
+_LAZY_ATTRS: dict[str, str] = {
+    "SessionStartInput": "cc_hooks.models.session_start",
+    "SessionStartOutput": "cc_hooks.models.session_start",
+    "SessionEndInput": "cc_hooks.models.session_end",
+    "SessionEndOutput": "cc_hooks.models.session_end",
+    "UserPromptSubmitInput": "cc_hooks.models.user_prompt_submit",
+    "UserPromptSubmitOutput": "cc_hooks.models.user_prompt_submit",
+    "PreToolUseInput": "cc_hooks.models.pre_tool_use",
+    "PreToolUseOutput": "cc_hooks.models.pre_tool_use",
+    "PostToolUseInput": "cc_hooks.models.post_tool_use",
+    "PostToolUseOutput": "cc_hooks.models.post_tool_use",
+    "PostToolUseFailureInput": "cc_hooks.models.post_tool_use_failure",
+    "PostToolUseFailureOutput": "cc_hooks.models.post_tool_use_failure",
+    "PermissionRequestInput": "cc_hooks.models.permission_request",
+    "PermissionRequestOutput": "cc_hooks.models.permission_request",
+    "NotificationInput": "cc_hooks.models.notification",
+    "NotificationOutput": "cc_hooks.models.notification",
+    "SubagentStartInput": "cc_hooks.models.subagent_start",
+    "SubagentStartOutput": "cc_hooks.models.subagent_start",
+    "SubagentStopInput": "cc_hooks.models.subagent_stop",
+    "SubagentStopOutput": "cc_hooks.models.subagent_stop",
+    "StopInput": "cc_hooks.models.stop",
+    "StopOutput": "cc_hooks.models.stop",
+    "TeammateIdleInput": "cc_hooks.models.teammate_idle",
+    "TeammateIdleOutput": "cc_hooks.models.teammate_idle",
+    "TaskCompletedInput": "cc_hooks.models.task_completed",
+    "TaskCompletedOutput": "cc_hooks.models.task_completed",
+    "ConfigChangeInput": "cc_hooks.models.config_change",
+    "ConfigChangeOutput": "cc_hooks.models.config_change",
+    "PreCompactInput": "cc_hooks.models.pre_compact",
+    "PreCompactOutput": "cc_hooks.models.pre_compact",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "SessionStartInput",
@@ -1,10 +1,19 @@
-from pydantic import BaseModel, ConfigDict, Field
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, model_serializer
 
 from cc_hooks.enums import PermissionMode
 
+if TYPE_CHECKING:
+    from cc_hooks.lazy import LazyValue
+    from cc_hooks.transcript import Transcript
+
+# Instance attribute holding the values cc_hooks.lazy deferred, by field name.
+LAZY_ATTR = "_lazy_field_values"
+
 
 class BaseInput(BaseModel):
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
 
     session_id: str = Field(alias="sessionId")
     transcript_path: str = Field(alias="transcriptPath")
@@ -18,9 +27,48 @@ class BaseInput(BaseModel):
         except ValueError:
             return None
 
+    def transcript(self) -> "Transcript":
+        return _transcript(self, self.transcript_path)
+
+    def lazy_field(self, name: str) -> "LazyValue | None":
+        deferred: dict[str, LazyValue] = vars(self).get(LAZY_ATTR, {})
+        return deferred.get(name)
+
+    def load_lazy_fields(self) -> None:
+        for name in list(vars(self).get(LAZY_ATTR, {})):
+            getattr(self, name)
+
+    @model_serializer(mode="wrap")
+    def _serialize_lazy_fields(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        # Deferred fields are absent from __dict__, so they are loaded before a dump.
+        if vars(self).get(LAZY_ATTR):
+            self.load_lazy_fields()
+        result: dict[str, Any] = handler(self)
+        return result
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # Fields deferred by cc_hooks.lazy are absent from __dict__ until first access.
+            if name in self.__dict__.get(LAZY_ATTR, ()):
+                from cc_hooks.lazy import materialize
+
+                return materialize(self, name)
+            return super().__getattr__(name)
+
+
+def _transcript(instance: BaseModel, path: str) -> "Transcript":
+    # Memoized per instance and path, like the tool-input views.
+    from cc_hooks.transcript import Transcript
+
+    cached: dict[str, Transcript] = vars(instance).setdefault("_transcripts", {})
+    if path not in cached:
+        cached[path] = Transcript(path)
+    return cached[path]
+
 
 class BaseOutput(BaseModel):
-    model_config = ConfigDict(extra="allow", populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     continue_: bool | None = Field(None, alias="continue")
     stop_reason: str | None = Field(None, alias="stopReason")
@@ -1,34 +1,51 @@
-from typing import Any, TypeVar
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 
 from cc_hooks.enums import BuiltinToolName
-from cc_hooks.registry import get_tool_input_model
-from cc_hooks.tools import (
-    BashInput,
-    EditInput,
-    GlobInput,
-    GrepInput,
-    NotebookEditInput,
-    ReadInput,
-    TaskInput,
-    WebFetchInput,
-    WebSearchInput,
-    WriteInput,
-)
+from cc_hooks.registry import compile_tool_input_adapter, get_tool_input_adapter
+
+if TYPE_CHECKING:
+    from cc_hooks.tools import (
+        BashInput,
+        EditInput,
+        GlobInput,
+        GrepInput,
+        NotebookEditInput,
+        ReadInput,
+        TaskInput,
+        WebFetchInput,
+        WebSearchInput,
+        WriteInput,
+    )
 
 T = TypeVar("T", bound=BaseModel)
 
+_VIEWS = "_tool_input_view_cache"
+_REGISTERED = "registered"
+
 
 class ToolInputParsingMixin:
     tool_name: str
     tool_input: dict[str, Any]
 
     def as_tool_input(self, model: type[T]) -> T | None:
-        try:
-            return model(**self.tool_input)
-        except ValidationError:
-            return None
+        views = self._tool_input_views()
+        if model not in views:
+            views[model] = compile_tool_input_adapter(model)(self.tool_input)
+        return views[model]  # type: ignore[return-value]
+
+    def _tool_input_views(self) -> dict[Any, BaseModel | None]:
+        # Views are memoized per instance, including None for invalid input, and
+        # dropped when tool_input no longer equals the copy they were built from
+        # (reassigned or edited in place). Stored like functools.cached_property,
+        # which pydantic leaves out of fields, dumps and equality.
+        cached = vars(self).get(_VIEWS)
+        if cached is None or cached[0] != self.tool_input:
+            cached = vars(self)[_VIEWS] = (deepcopy(self.tool_input), {})
+        views: dict[Any, BaseModel | None] = cached[1]
+        return views
 
     def as_builtin_tool_name(self) -> BuiltinToolName | None:
         try:
@@ -37,37 +54,78 @@ class ToolInputParsingMixin:
             return None
 
     def as_registered_tool_input(self) -> BaseModel | None:
-        model = get_tool_input_model(self.tool_name)
-        if model is None:
+        views = self._tool_input_views()
+        if _REGISTERED not in views:
+            adapter = get_tool_input_adapter(self.tool_name)
+            views[_REGISTERED] = None if adapter is None else adapter(self.tool_input)
+        return views[_REGISTERED]
+
+    def as_bash_input(self) -> "BashInput | None":
+        if self.tool_name != "Bash":
             return None
-        return self.as_tool_input(model)
+        from cc_hooks.tools.bash import BashInput
 
-    def as_bash_input(self) -> BashInput | None:
-        return self.as_tool_input(BashInput) if self.tool_name == "Bash" else None
+        return self.as_tool_input(BashInput)
 
-    def as_write_input(self) -> WriteInput | None:
-        return self.as_tool_input(WriteInput) if self.tool_name == "Write" else None
+    def as_write_input(self) -> "WriteInput | None":
+        if self.tool_name != "Write":
+            return None
+        from cc_hooks.tools.write import WriteInput
 
-    def as_edit_input(self) -> EditInput | None:
-        return self.as_tool_input(EditInput) if self.tool_name == "Edit" else None
+        return self.as_tool_input(WriteInput)
 
-    def as_read_input(self) -> ReadInput | None:
-        return self.as_tool_input(ReadInput) if self.tool_name == "Read" else None
+    def as_edit_input(self) -> "EditInput | None":
+        if self.tool_name != "Edit":
+            return None
+        from cc_hooks.tools.edit import EditInput
 
-    def as_glob_input(self) -> GlobInput | None:
-        return self.as_tool_input(GlobInput) if self.tool_name == "Glob" else None
+        return self.as_tool_input(EditInput)
 
-    def as_grep_input(self) -> GrepInput | None:
-        return self.as_tool_input(GrepInput) if self.tool_name == "Grep" else None
+    def as_read_input(self) -> "ReadInput | None":
+        if self.tool_name != "Read":
+            return None
+        from cc_hooks.tools.read import ReadInput
 
-    def as_web_fetch_input(self) -> WebFetchInput | None:
-        return self.as_tool_input(WebFetchInput) if self.tool_name == "WebFetch" else None
+        return self.as_tool_input(ReadInput)
+
+    def as_glob_input(self) -> "GlobInput | None":
+        if self.tool_name != "Glob":
+            return None
+        from cc_hooks.tools.glob import GlobInput
+
+        return self.as_tool_input(GlobInput)
+
+    def as_grep_input(self) -> "GrepInput | None":
+        if self.tool_name != "Grep":
+            return None
+        from cc_hooks.tools.grep import GrepInput
 
-    def as_web_search_input(self) -> WebSearchInput | None:
-        return self.as_tool_input(WebSearchInput) if self.tool_name == "WebSearch" else None
+        return self.as_tool_input(GrepInput)
 
-    def as_task_input(self) -> TaskInput | None:
-        return self.as_tool_input(TaskInput) if self.tool_name == "Task" else None
+    def as_web_fetch_input(self) -> "WebFetchInput | None":
+        if self.tool_name != "WebFetch":
+            return None
+        from cc_hooks.tools.web_fetch import WebFetchInput
+
+        return self.as_tool_input(WebFetchInput)
+
+    def as_web_search_input(self) -> "WebSearchInput | None":
+        if self.tool_name != "WebSearch":
+            return None
+        from cc_hooks.tools.web_search import WebSearchInput
+
+        return self.as_tool_input(WebSearchInput)
+
+    def as_task_input(self) -> "TaskInput | None":
+        if self.tool_name != "Task":
+            return None
+        from cc_hooks.tools.task import TaskInput
+
+        return self.as_tool_input(TaskInput)
+
+    def as_notebook_edit_input(self) -> "NotebookEditInput | None":
+        if self.tool_name != "NotebookEdit":
+            return None
+        from cc_hooks.tools.notebook_edit import NotebookEditInput
 
-    def as_notebook_edit_input(self) -> NotebookEditInput | None:
-        return self.as_tool_input(NotebookEditInput) if self.tool_name == "NotebookEdit" else None
+        return self.as_tool_input(NotebookEditInput)
@@ -14,7 +14,7 @@ class PermissionRequestInput(BaseInput, ToolInputParsingMixin):
 
 
 class PermissionRequestDecision(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     behavior: Literal["allow", "deny", "ask"]
     message: str | None = None
@@ -22,7 +22,7 @@ class PermissionRequestDecision(BaseModel):
 
 
 class PermissionRequestHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["PermissionRequest"] = Field("PermissionRequest", alias="hookEventName")
     decision: PermissionRequestDecision | None = None
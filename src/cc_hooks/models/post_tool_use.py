@@ -15,7 +15,7 @@ class PostToolUseInput(BaseInput, ToolInputParsingMixin):
 
 
 class PostToolUseHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["PostToolUse"] = Field("PostToolUse", alias="hookEventName")
     additional_context: str | None = Field(None, alias="additionalContext")
@@ -16,7 +16,7 @@ class PostToolUseFailureInput(BaseInput, ToolInputParsingMixin):
 
 
 class PostToolUseFailureHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["PostToolUseFailure"] = Field("PostToolUseFailure", alias="hookEventName")
     additional_context: str | None = Field(None, alias="additionalContext")
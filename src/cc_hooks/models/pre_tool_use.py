@@ -15,7 +15,7 @@ class PreToolUseInput(BaseInput, ToolInputParsingMixin):
 
 
 class PreToolUseHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["PreToolUse"] = Field("PreToolUse", alias="hookEventName")
     permission_decision: PermissionDecision | None = Field(None, alias="permissionDecision")
@@ -20,7 +20,7 @@ class SessionStartInput(BaseInput):
 
 
 class SessionStartHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["SessionStart"] = Field("SessionStart", alias="hookEventName")
     additional_context: str | None = Field(None, alias="additionalContext")
@@ -1,8 +1,11 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import Field
 
-from cc_hooks.models._base import BaseInput, BaseOutput
+from cc_hooks.models._base import BaseInput, BaseOutput, _transcript
+
+if TYPE_CHECKING:
+    from cc_hooks.transcript import Transcript
 
 
 class SubagentStopInput(BaseInput):
@@ -13,6 +16,9 @@ class SubagentStopInput(BaseInput):
     agent_transcript_path: str = Field(alias="agentTranscriptPath")
     last_assistant_message: str | None = Field(None, alias="lastAssistantMessage")
 
+    def agent_transcript(self) -> "Transcript":
+        return _transcript(self, self.agent_transcript_path)
+
 
 class SubagentStopOutput(BaseOutput):
     decision: str | None = None
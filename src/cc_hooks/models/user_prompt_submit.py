@@ -11,7 +11,7 @@ class UserPromptSubmitInput(BaseInput):
 
 
 class UserPromptSubmitHookSpecific(BaseModel):
-    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True)
+    model_config = ConfigDict(populate_by_name=True, serialize_by_alias=True, defer_build=True)
 
     hook_event_name: Literal["UserPromptSubmit"] = Field("UserPromptSubmit", alias="hookEventName")
     additional_context: str | None = Field(None, alias="additionalContext")
@@ -0,0 +1,375 @@
+import fcntl
+import itertools
+import json
+import os
+import sys
+import time
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json
+
+from cc_hooks._storage import state_home
+
+if TYPE_CHECKING:
+    from http.client import HTTPConnection
+
+ENV_DIR = "CC_HOOKS_OUTBOX_DIR"
+ENV_IDLE_TIMEOUT = "CC_HOOKS_OUTBOX_IDLE_TIMEOUT"
+DEFAULT_IDLE_TIMEOUT = 30.0
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+LATENCY_WINDOW = 256
+
+# Envelope: {"url", "headers", "body" (JSON text), "batch", "created", "attempts"}.
+Envelope = dict[str, Any]
+
+_sequence = itertools.count()
+
+
+def default_spool_dir() -> Path:
+    configured = os.environ.get(ENV_DIR)
+    if configured:
+        return Path(configured)
+    return state_home() / "outbox"
+
+
+def send(
+    url: str,
+    payload: Any,
+    *,
+    headers: Mapping[str, str] | None = None,
+    batch: bool = False,
+    spool_dir: str | os.PathLike[str] | None = None,
+) -> Path:
+    # Spools the message (two small writes and a rename) and makes sure a flusher
+    # is running; the HTTP request happens in the flusher, never in the hook.
+    spool = Path(spool_dir) if spool_dir is not None else default_spool_dir()
+    body = payload if isinstance(payload, bytes) else to_json(payload)
+    envelope = {
+        "url": url,
+        "headers": dict(headers or {}),
+        "body": body.decode(),
+        "batch": batch,
+        "created": time.time(),
+        "attempts": 0,
+    }
+    name = f"{time.time_ns():020d}-{os.getpid()}-{next(_sequence)}.json"
+    _check_spool(spool)
+    try:
+        path = _write_atomic(spool, spool / "new" / name, to_json(envelope))
+    except FileNotFoundError:
+        _make_spool(spool)
+        path = _write_atomic(spool, spool / "new" / name, to_json(envelope))
+    if not _flusher_running(spool):
+        _spawn_flusher(spool)
+    return path
+
+
+@dataclass(frozen=True)
+class OutboxStats:
+    depth: int
+    oldest_age: float | None
+    failed: int
+    delivered: int
+    latency_p50: float | None
+    latency_p95: float | None
+    flusher_running: bool
+
+
+def outbox_stats(spool_dir: str | os.PathLike[str] | None = None) -> OutboxStats:
+    spool = Path(spool_dir) if spool_dir is not None else default_spool_dir()
+    pending = _listdir(spool / "new")
+    counters = _read_counters(spool)
+    latencies = sorted(counters["latencies"])
+    return OutboxStats(
+        depth=len(pending),
+        oldest_age=time.time() - int(pending[0].split("-", 1)[0]) / 1e9 if pending else None,
+        failed=len(_listdir(spool / "failed")),
+        delivered=counters["delivered"],
+        latency_p50=latencies[len(latencies) // 2] if latencies else None,
+        latency_p95=latencies[int(len(latencies) * 0.95)] if latencies else None,
+        flusher_running=_flusher_running(spool),
+    )
+
+
+class Flusher:
+    # Drains <spool>/new: messages are grouped per origin, each origin is served by
+    # one keep-alive connection in spool order, and a failing origin backs off as a
+    # whole so later messages do not overtake the one being retried.
+
+    def __init__(
+        self,
+        spool_dir: str | os.PathLike[str] | None = None,
+        *,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_attempts: int = 8,
+        backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        batch_size: int = 50,
+        timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.spool = Path(spool_dir) if spool_dir is not None else default_spool_dir()
+        self.idle_timeout = idle_timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._envelopes: dict[str, Envelope] = {}
+        self._connections: dict[tuple[str, str], HTTPConnection] = {}
+        self._origin_retry_at: dict[tuple[str, str], float] = {}
+        self._counters = _read_counters(self.spool)
+
+    def serve(self) -> int:
+        _make_spool(self.spool)
+        _check_spool(self.spool)
+        lock = open(self.spool / "flusher.lock", "a")  # noqa: SIM115 - held while serving
+        if not _try_lock(lock.fileno()):
+            lock.close()
+            return 0
+        last_activity = time.monotonic()
+        try:
+            while True:
+                if self.flush() or self._envelopes:
+                    last_activity = time.monotonic()
+                elif time.monotonic() - last_activity >= self.idle_timeout:
+                    # A sender that saw the lock held just before it is released has
+                    # not started a flusher: look once more after letting go.
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+                    if not _listdir(self.spool / "new") or not _try_lock(lock.fileno()):
+                        return 0
+                    last_activity = time.monotonic()
+                time.sleep(self.poll_interval)
+        finally:
+            for connection in self._connections.values():
+                connection.close()
+            lock.close()
+
+    def flush(self) -> int:
+        from urllib.parse import urlsplit
+
+        names = _listdir(self.spool / "new")
+        self._envelopes = {name: self._envelopes.get(name) or self._load(name) for name in names}
+        now = time.time()
+        origins: dict[tuple[str, str], list[tuple[str, Envelope]]] = {}
+        for name, envelope in self._envelopes.items():
+            if envelope:
+                split = urlsplit(envelope["url"])
+                origins.setdefault((split.scheme, split.netloc), []).append((name, envelope))
+        due = [(origin, items) for origin, items in origins.items() if self._origin_retry_at.get(origin, 0) <= now]
+        if len(due) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(len(due), 8), thread_name_prefix="cc-hooks-outbox") as pool:
+                handled = sum(pool.map(lambda args: self._deliver(*args), due))
+        else:
+            handled = sum(self._deliver(*args) for args in due)
+        self._envelopes = {name: envelope for name, envelope in self._envelopes.items() if envelope}
+        if handled:
+            _write_atomic(self.spool, self.spool / "stats.json", to_json(self._counters))
+        return handled
+
+    def _deliver(self, origin: tuple[str, str], items: list[tuple[str, Envelope]]) -> int:
+        handled = 0
+        for group in self._batches(items):
+            envelope = group[0][1]
+            body = envelope["body"].encode()
+            if envelope["batch"]:
+                body = b"[" + b",".join(item["body"].encode() for _, item in group) + b"]"
+            status, retry_after = self._post(origin, envelope, body)
+            if status is not None and 200 <= status < 300:
+                self._finish(group, None)
+            elif envelope["attempts"] + 1 < self.max_attempts and (status is None or status in RETRY_STATUSES):
+                import random
+
+                delay = min(self.backoff * 2 ** envelope["attempts"], self.max_backoff) * random.uniform(0.5, 1.0)
+                self._origin_retry_at[origin] = time.time() + max(delay, retry_after or 0.0)
+                for name, item in group:
+                    item["attempts"] += 1
+                    _write_atomic(self.spool, self.spool / "new" / name, to_json(item))
+                return handled
+            else:
+                self._finish(group, f"HTTP {status}" if status is not None else "connection failed")
+            handled += len(group)
+        return handled
+
+    def _batches(self, items: list[tuple[str, Envelope]]) -> list[list[tuple[str, Envelope]]]:
+        groups: list[list[tuple[str, Envelope]]] = []
+        for name, envelope in items:
+            last = groups[-1][-1][1] if groups else None
+            if (
+                last is not None
+                and envelope["batch"]
+                and last["batch"]
+                and (envelope["url"], envelope["headers"]) == (last["url"], last["headers"])
+                and len(groups[-1]) < self.batch_size
+            ):
+                groups[-1].append((name, envelope))
+            else:
+                groups.append([(name, envelope)])
+        return groups
+
+    def _post(self, origin: tuple[str, str], envelope: Envelope, body: bytes) -> tuple[int | None, float | None]:
+        import http.client
+        from urllib.parse import urlsplit
+
+        split = urlsplit(envelope["url"])
+        path = split.path or "/"
+        if split.query:
+            path += "?" + split.query
+        headers = {"Content-Type": "application/json", **envelope["headers"]}
+        for attempt in range(2):
+            connection = self._connections.get(origin)
+            reused = connection is not None
+            if connection is None:
+                scheme, netloc = origin
+                factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                connection = self._connections[origin] = factory(netloc, timeout=self.timeout)
+            try:
+                connection.request("POST", path, body, headers)
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                del self._connections[origin]
+                # A pooled connection the server closed while idle fails on first reuse.
+                stale = isinstance(exc, (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError))
+                if attempt == 0 and reused and stale:
+                    continue
+                return None, None
+            retry_after = response.getheader("Retry-After")
+            return response.status, float(retry_after) if retry_after and retry_after.isdigit() else None
+        return None, None
+
+    def _finish(self, group: list[tuple[str, Envelope]], error: str | None) -> None:
+        now = time.time()
+        for name, envelope in group:
+            if error is None:
+                (self.spool / "new" / name).unlink(missing_ok=True)
+                self._counters["delivered"] += 1
+                self._counters["latencies"].append(round(now - envelope["created"], 6))
+            else:
+                os.replace(self.spool / "new" / name, self.spool / "failed" / name)
+                sys.stderr.write(f"cc-hooks outbox: giving up on {envelope['url']}: {error}\n")
+            self._envelopes[name] = {}
+        del self._counters["latencies"][:-LATENCY_WINDOW]
+
+    def _load(self, name: str) -> Envelope:
+        path = self.spool / "new" / name
+        try:
+            envelope = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            envelope = None
+        if not isinstance(envelope, dict) or not {"url", "body"} <= envelope.keys():
+            os.replace(path, self.spool / "failed" / name)
+            return {}
+        return {"headers": {}, "batch": False, "created": time.time(), "attempts": 0, **envelope}
+
+
+def _make_spool(spool: Path) -> None:
+    # Envelopes hold webhook URLs and auth headers, so the spool is private to its owner.
+    spool.mkdir(parents=True, exist_ok=True, mode=0o700)
+    for directory in ("tmp", "new", "failed"):
+        (spool / directory).mkdir(exist_ok=True, mode=0o700)
+
+
+def _check_spool(spool: Path) -> None:
+    try:
+        stat = os.stat(spool)
+    except FileNotFoundError:
+        return
+    if stat.st_uid != os.getuid():
+        raise PermissionError(f"outbox spool {spool} is owned by another user")
+    if stat.st_mode & 0o077:
+        os.chmod(spool, 0o700)
+
+
+def _write_atomic(spool: Path, target: Path, data: bytes) -> Path:
+    temp = spool / "tmp" / f"{target.name}.{os.getpid()}.{next(_sequence)}"
+    with open(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(data)
+    os.replace(temp, target)
+    return target
+
+
+def _listdir(directory: Path) -> list[str]:
+    try:
+        return sorted(name for name in os.listdir(directory) if name.endswith(".json"))
+    except FileNotFoundError:
+        return []
+
+
+def _read_counters(spool: Path) -> dict[str, Any]:
+    try:
+        data = json.loads((spool / "stats.json").read_bytes())
+        return {"delivered": int(data["delivered"]), "latencies": list(data["latencies"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return {"delivered": 0, "latencies": []}
+
+
+def _try_lock(fd: int, attempts: int = 5) -> bool:
+    # A few tries: a sender probing the lock holds it for microseconds.
+    for attempt in range(attempts):
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            if attempt + 1 < attempts:
+                time.sleep(0.01)
+        else:
+            return True
+    return False
+
+
+def _flusher_running(spool: Path) -> bool:
+    try:
+        with open(spool / "flusher.lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+def _spawn_flusher(spool: Path) -> None:
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "cc_hooks.outbox", "--spool", str(spool)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Deliver spooled cc-hooks webhook messages.")
+    parser.add_argument("--spool", help="Spool directory (default: $CC_HOOKS_OUTBOX_DIR or the XDG state dir)")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=float(os.environ.get(ENV_IDLE_TIMEOUT) or DEFAULT_IDLE_TIMEOUT),
+        help="Exit after N seconds with an empty spool",
+    )
+    parser.add_argument("--stats", action="store_true", help="Print spool depth and delivery latency, then exit")
+    args = parser.parse_args(argv)
+
+    if args.stats:
+        print(json.dumps(asdict(outbox_stats(args.spool)), indent=2))
+        return 0
+    return Flusher(args.spool, idle_timeout=args.idle_timeout).serve()
+
+
+__all__ = ["Flusher", "OutboxStats", "default_spool_dir", "outbox_stats", "send"]
+
+if __name__ == "__main__":
+    raise SystemExit(main())
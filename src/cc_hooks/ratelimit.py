@@ -0,0 +1,137 @@
+import hashlib
+import os
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from cc_hooks import background
+from cc_hooks._storage import locked_json, remove_stale, state_home
+
+ENV_DIR = "CC_HOOKS_RATELIMIT_DIR"
+# Per-session state files untouched for this long are removed when a session starts.
+STALE_AFTER = 24 * 3600.0
+# A window whose closer has not delivered this long after it ended (the closing
+# process was killed) is closed by the next event for the key.
+TAKEOVER_AFTER = 10.0
+
+# {"buckets": {key: {"tokens", "updated"}}, "windows": {key: {"id", "opened", "count", "items"}}}
+State = dict[str, dict[str, dict[str, Any]]]
+
+
+@dataclass(frozen=True)
+class Window:
+    key: str
+    items: list[Any]
+    count: int
+    opened: float
+    closed: float
+
+
+def default_state_dir() -> Path:
+    configured = os.environ.get(ENV_DIR)
+    if configured:
+        return Path(configured)
+    return state_home() / "ratelimit"
+
+
+def allow(
+    session: BaseModel | str,
+    key: str,
+    *,
+    rate: float,
+    burst: float = 1.0,
+    cost: float = 1.0,
+    state_dir: str | os.PathLike[str] | None = None,
+) -> bool:
+    # Token bucket shared by every hook process of the session: `rate` tokens per
+    # second, at most `burst` saved up.
+    with _locked(_state_path(session, state_dir)) as state:
+        now = time.time()
+        bucket = state.setdefault("buckets", {}).get(key) or {"tokens": burst, "updated": now}
+        tokens = min(burst, bucket["tokens"] + max(now - bucket["updated"], 0.0) * rate)
+        allowed = bool(tokens >= cost)
+        state["buckets"][key] = {"tokens": tokens - cost if allowed else tokens, "updated": now}
+    return allowed
+
+
+def coalesce(
+    session: BaseModel | str,
+    key: str,
+    item: Any,
+    deliver: Callable[[Window], Any],
+    *,
+    window: float = 5.0,
+    max_items: int = 100,
+    state_dir: str | os.PathLike[str] | None = None,
+) -> bool:
+    # Adds `item` to the key's open window. The process that opens a window closes
+    # it `window` seconds later and calls `deliver` once with everything collected
+    # (after the hook response when called from a handler, before returning
+    # otherwise); returns True there.
+    path = _state_path(session, state_dir)
+    now = time.time()
+    abandoned = None
+    with _locked(path) as state:
+        windows = state.setdefault("windows", {})
+        entry = windows.get(key)
+        if entry is not None and now > entry["opened"] + window + TAKEOVER_AFTER:
+            abandoned = _window(key, windows.pop(key), now)
+            entry = None
+        if entry is not None:
+            entry["count"] += 1
+            if len(entry["items"]) < max_items:
+                entry["items"].append(item)
+            return False
+        window_id = f"{os.getpid()}-{time.time_ns()}"
+        windows[key] = {"id": window_id, "opened": now, "count": 1, "items": [item]}
+
+    def close_window() -> None:
+        time.sleep(max(now + window - time.time(), 0.0))
+        with _locked(path) as state:
+            entry = state.get("windows", {}).get(key)
+            if entry is None or entry["id"] != window_id:
+                return
+            del state["windows"][key]
+        deliver(_window(key, entry, time.time()))
+
+    def close() -> None:
+        # A failing delivery of the abandoned window must not leave the new one open.
+        try:
+            if abandoned is not None:
+                deliver(abandoned)
+        finally:
+            close_window()
+
+    try:
+        background.hook_context().defer(close)
+    except RuntimeError:
+        close()
+    return True
+
+
+def _window(key: str, entry: dict[str, Any], closed: float) -> Window:
+    return Window(key, entry["items"], entry["count"], entry["opened"], closed)
+
+
+def _state_path(session: BaseModel | str, state_dir: str | os.PathLike[str] | None) -> Path:
+    session_id = session if isinstance(session, str) else str(getattr(session, "session_id", ""))
+    project = os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+    digest = hashlib.sha256(f"{project}\0{session_id}".encode()).hexdigest()[:24]
+    return (Path(state_dir) if state_dir is not None else default_state_dir()) / f"{digest}.json"
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[State]:
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        remove_stale(path.parent, "*.json", STALE_AFTER)
+    with locked_json(path) as state:
+        yield state
+
+
+__all__ = ["Window", "allow", "coalesce", "default_state_dir"]
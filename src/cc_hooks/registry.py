@@ -1,42 +1,70 @@
-from pydantic import BaseModel
-
-from cc_hooks.tools import (
-    BashInput,
-    EditInput,
-    GlobInput,
-    GrepInput,
-    NotebookEditInput,
-    ReadInput,
-    TaskInput,
-    WebFetchInput,
-    WebSearchInput,
-    WriteInput,
-)
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from cc_hooks.schema_cache import prepare_model
+
+ToolInputAdapter = Callable[[dict[str, Any]], BaseModel | None]
 
 _tool_registry: dict[str, type[BaseModel]] = {}
+_compiled: dict[type[BaseModel], ToolInputAdapter] = {}
+_adapters: dict[str, ToolInputAdapter | None] = {}
+
+_BUILTIN_TOOL_INPUTS: dict[str, tuple[str, str]] = {
+    "Bash": ("cc_hooks.tools.bash", "BashInput"),
+    "Write": ("cc_hooks.tools.write", "WriteInput"),
+    "Edit": ("cc_hooks.tools.edit", "EditInput"),
+    "Read": ("cc_hooks.tools.read", "ReadInput"),
+    "Glob": ("cc_hooks.tools.glob", "GlobInput"),
+    "Grep": ("cc_hooks.tools.grep", "GrepInput"),
+    "WebFetch": ("cc_hooks.tools.web_fetch", "WebFetchInput"),
+    "WebSearch": ("cc_hooks.tools.web_search", "WebSearchInput"),
+    "Task": ("cc_hooks.tools.task", "TaskInput"),
+    "NotebookEdit": ("cc_hooks.tools.notebook_edit", "NotebookEditInput"),
+}
 
 
 def register_tool_input(tool_name: str, model: type[BaseModel]) -> None:
     _tool_registry[tool_name] = model
+    _adapters.pop(tool_name, None)
 
 
 def get_tool_input_model(tool_name: str) -> type[BaseModel] | None:
-    return _tool_registry.get(tool_name)
+    model = _tool_registry.get(tool_name)
+    if model is None and tool_name in _BUILTIN_TOOL_INPUTS:
+        module_name, attr = _BUILTIN_TOOL_INPUTS[tool_name]
+        model = getattr(import_module(module_name), attr)
+        _tool_registry[tool_name] = model
+    return model
+
+
+def compile_tool_input_adapter(model: type[BaseModel]) -> ToolInputAdapter:
+    adapter = _compiled.get(model)
+    if adapter is None:
+        prepare_model(model)
+        validate = model.__pydantic_validator__.validate_python
+
+        def adapter(data: dict[str, Any]) -> BaseModel | None:
+            try:
+                return validate(data)  # type: ignore[no-any-return]
+            except ValidationError:
+                return None
 
+        _compiled[model] = adapter
+    return adapter
 
-def _register_builtins() -> None:
-    register_tool_input("Bash", BashInput)
-    register_tool_input("Write", WriteInput)
-    register_tool_input("Edit", EditInput)
-    register_tool_input("Read", ReadInput)
-    register_tool_input("Glob", GlobInput)
-    register_tool_input("Grep", GrepInput)
-    register_tool_input("WebFetch", WebFetchInput)
-    register_tool_input("WebSearch", WebSearchInput)
-    register_tool_input("Task", TaskInput)
-    register_tool_input("NotebookEdit", NotebookEditInput)
 
+def get_tool_input_adapter(tool_name: str) -> ToolInputAdapter | None:
+    try:
+        return _adapters[tool_name]
+    except KeyError:
+        pass
+    model = get_tool_input_model(tool_name)
+    adapter = None if model is None else compile_tool_input_adapter(model)
+    _adapters[tool_name] = adapter
+    return adapter
 
-_register_builtins()
 
-__all__ = ["register_tool_input", "get_tool_input_model"]
+__all__ = ["register_tool_input", "get_tool_input_model", "get_tool_input_adapter", "compile_tool_input_adapter"]
@@ -0,0 +1,159 @@
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+from cc_hooks.digest import EDIT_TOOLS, clip_text
+from cc_hooks.memo import cached
+from cc_hooks.state import SessionState
+from cc_hooks.transcript import Transcript
+
+KEY = "cc_hooks.subagents"
+MAX_ERRORS = 50
+# Uncached transcripts smaller than this in total are scanned in-process: starting
+# workers costs more than it saves.
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+Paths = Iterable[str | os.PathLike[str]]
+
+_prewarm = True
+
+
+@dataclass
+class TranscriptSummary:
+    transcripts: int = 0
+    records: int = 0
+    # Tool name -> calls.
+    tools: dict[str, int] = field(default_factory=dict)
+    # Edited paths in order of first edit.
+    files_changed: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    output_tokens: int = 0
+
+    @classmethod
+    def merge(cls, parts: Iterable["TranscriptSummary"]) -> "TranscriptSummary":
+        total = cls()
+        for part in parts:
+            total.transcripts += part.transcripts
+            total.records += part.records
+            for name, calls in part.tools.items():
+                total.tools[name] = total.tools.get(name, 0) + calls
+            total.files_changed = list(dict.fromkeys([*total.files_changed, *part.files_changed]))
+            total.errors = [*total.errors, *part.errors][:MAX_ERRORS]
+            total.output_tokens += part.output_tokens
+        return total
+
+
+@cached(key=os.fspath, invalidate_on=lambda path: [path])  # type: ignore[untyped-decorator]
+def summarize_transcript(path: str | os.PathLike[str]) -> TranscriptSummary:
+    # Cached per path while the file keeps its mtime and size; the first scan streams
+    # the file line by line through mmap.
+    summary = TranscriptSummary(transcripts=1)
+    files: dict[str, None] = {}
+    # Claude Code writes one record per content block, each repeating the message's usage.
+    counted: set[str] = set()
+    with Transcript(path) as transcript:
+        for _, record in transcript.since(0):
+            summary.records += 1
+            message = record.get("message")
+            if not isinstance(message, dict):
+                continue
+            usage, message_id = message.get("usage"), message.get("id")
+            if isinstance(usage, dict) and message_id not in counted:
+                summary.output_tokens += int(usage.get("output_tokens") or 0)
+                if isinstance(message_id, str):
+                    counted.add(message_id)
+            content = message.get("content")
+            for block in content if isinstance(content, list) else ():
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "tool_use" and isinstance(block.get("name"), str):
+                    name, tool_input = block["name"], block.get("input")
+                    summary.tools[name] = summary.tools.get(name, 0) + 1
+                    edited = (
+                        tool_input.get(EDIT_TOOLS[name])
+                        if name in EDIT_TOOLS and isinstance(tool_input, dict)
+                        else None
+                    )
+                    if isinstance(edited, str):
+                        files[edited] = None
+                elif block.get("type") == "tool_result" and block.get("is_error") and len(summary.errors) < MAX_ERRORS:
+                    summary.errors.append(clip_text(_text(block.get("content"))))
+    summary.files_changed = list(files)
+    return summary
+
+
+def summarize_transcripts(paths: Paths, *, workers: int | None = None) -> TranscriptSummary:
+    # Cached transcripts are read from the memo cache; the rest are scanned in a
+    # process pool when there is enough of them to pay for it.
+    names = [os.fspath(path) for path in paths]
+    parts: dict[str, TranscriptSummary] = {}
+    missing = []
+    for path in names:
+        found = summarize_transcript.cache_lookup(path)
+        if found is not None:
+            parts[path] = found[0]
+        else:
+            missing.append(path)
+    if len(missing) > 1 and workers != 1 and sum(_size(path) for path in missing) >= PARALLEL_MIN_BYTES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(min(workers or os.cpu_count() or 1, len(missing))) as pool:
+            parts.update(zip(missing, pool.map(summarize_transcript, missing), strict=True))
+    else:
+        parts.update((path, summarize_transcript(path)) for path in missing)
+    return TranscriptSummary.merge(parts[path] for path in names)
+
+
+def subagent_transcripts(session: BaseModel | str) -> list[str]:
+    return list(SessionState(session).get(KEY, []))
+
+
+def subagent_summary(session: BaseModel | str, *, workers: int | None = None) -> TranscriptSummary:
+    return summarize_transcripts(subagent_transcripts(session), workers=workers)
+
+
+def enable_subagent_rollup(*, prewarm: bool = True) -> None:
+    # Registers a SubagentStop handler that remembers each subagent transcript and,
+    # with prewarm, summarizes it in the background so the Stop rollup hits the cache.
+    from cc_hooks.runner import hook
+
+    global _prewarm
+    _prewarm = prewarm
+    hook("SubagentStop")(_record_subagent)
+
+
+def _record_subagent(input: BaseModel) -> None:
+    from cc_hooks.background import hook_context
+
+    path: str = getattr(input, "agent_transcript_path", "")
+    if not path:
+        return
+    SessionState(input).update(KEY, lambda paths: paths if path in paths else [*paths, path], [])
+    if _prewarm:
+        hook_context().defer(summarize_transcript, path)
+
+
+def _size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _text(content: Any) -> str:
+    if isinstance(content, list):
+        return "\n".join(str(block.get("text", "")) for block in content if isinstance(block, dict))
+    return str(content or "")
+
+
+__all__ = [
+    "TranscriptSummary",
+    "enable_subagent_rollup",
+    "subagent_summary",
+    "subagent_transcripts",
+    "summarize_transcript",
+    "summarize_transcripts",
+]
@@ -1,92 +1,394 @@
-import asyncio
 import inspect
-import json
+import os
+import signal
 import sys
-from collections.abc import Awaitable, Callable
-from typing import Any
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+from importlib import import_module
+from types import FrameType
+from typing import TYPE_CHECKING, Any, NoReturn
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from cc_hooks.enums import HookEvent
-from cc_hooks.models import (
-    ConfigChangeInput,
-    NotificationInput,
-    PermissionRequestInput,
-    PostToolUseFailureInput,
-    PostToolUseInput,
-    PreCompactInput,
-    PreToolUseInput,
-    SessionEndInput,
-    SessionStartInput,
-    StopInput,
-    SubagentStartInput,
-    SubagentStopInput,
-    TaskCompletedInput,
-    TeammateIdleInput,
-    UserPromptSubmitInput,
-)
+from cc_hooks.schema_cache import prepare_model, schema_cache_dir
+
+if TYPE_CHECKING:
+    from cc_hooks.lazy import LazyPayload
 
 InputModel = type[BaseModel]
 Handler = Callable[[Any], BaseModel | None | Awaitable[BaseModel | None]]
 
-_EVENT_INPUT_MODEL: dict[str, InputModel] = {
-    HookEvent.SESSION_START.value: SessionStartInput,
-    HookEvent.SESSION_END.value: SessionEndInput,
-    HookEvent.USER_PROMPT_SUBMIT.value: UserPromptSubmitInput,
-    HookEvent.PRE_TOOL_USE.value: PreToolUseInput,
-    HookEvent.POST_TOOL_USE.value: PostToolUseInput,
-    HookEvent.POST_TOOL_USE_FAILURE.value: PostToolUseFailureInput,
-    HookEvent.PERMISSION_REQUEST.value: PermissionRequestInput,
-    HookEvent.NOTIFICATION.value: NotificationInput,
-    HookEvent.SUBAGENT_START.value: SubagentStartInput,
-    HookEvent.SUBAGENT_STOP.value: SubagentStopInput,
-    HookEvent.STOP.value: StopInput,
-    HookEvent.TEAMMATE_IDLE.value: TeammateIdleInput,
-    HookEvent.TASK_COMPLETED.value: TaskCompletedInput,
-    HookEvent.CONFIG_CHANGE.value: ConfigChangeInput,
-    HookEvent.PRE_COMPACT.value: PreCompactInput,
+_EVENT_MODULE: dict[str, str] = {
+    HookEvent.SESSION_START.value: "cc_hooks.models.session_start",
+    HookEvent.SESSION_END.value: "cc_hooks.models.session_end",
+    HookEvent.USER_PROMPT_SUBMIT.value: "cc_hooks.models.user_prompt_submit",
+    HookEvent.PRE_TOOL_USE.value: "cc_hooks.models.pre_tool_use",
+    HookEvent.POST_TOOL_USE.value: "cc_hooks.models.post_tool_use",
+    HookEvent.POST_TOOL_USE_FAILURE.value: "cc_hooks.models.post_tool_use_failure",
+    HookEvent.PERMISSION_REQUEST.value: "cc_hooks.models.permission_request",
+    HookEvent.NOTIFICATION.value: "cc_hooks.models.notification",
+    HookEvent.SUBAGENT_START.value: "cc_hooks.models.subagent_start",
+    HookEvent.SUBAGENT_STOP.value: "cc_hooks.models.subagent_stop",
+    HookEvent.STOP.value: "cc_hooks.models.stop",
+    HookEvent.TEAMMATE_IDLE.value: "cc_hooks.models.teammate_idle",
+    HookEvent.TASK_COMPLETED.value: "cc_hooks.models.task_completed",
+    HookEvent.CONFIG_CHANGE.value: "cc_hooks.models.config_change",
+    HookEvent.PRE_COMPACT.value: "cc_hooks.models.pre_compact",
+}
+
+
+_HANDLERS: dict[tuple[str, str | None], list[Handler]] = {}
+_ENVELOPE_KEYS = ("hook_event_name", "hookEventName", "tool_name", "toolName")
+# Optional features are imported only once something turns them on: their enable_*()
+# function, a hook() argument, a handler module, or the variables read on import.
+_FEATURE_ENV: dict[str, tuple[str, ...]] = {
+    "cc_hooks.breaker": ("CC_HOOKS_BREAKER",),
+    "cc_hooks.chain": ("CC_HOOKS_CHAIN",),
+    "cc_hooks.deadlines": ("CC_HOOKS_BUDGET", "CC_HOOKS_STDIN_TIMEOUT"),
+    "cc_hooks.lazy": ("CC_HOOKS_LAZY_FIELDS",),
 }
+# What to answer if SIGTERM arrives while handlers are running.
+_answer: Callable[[], tuple[int, bytes, str]] | None = None
+
+
+class _Envelope(BaseModel):
+    # Only the routing keys are read; every other payload field is skipped by the
+    # JSON validator without being materialized as Python objects.
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
+    hook_event_name: Any = Field(None, alias="hookEventName")
+    tool_name: Any = Field(None, alias="toolName")
 
-def hook(event: str | HookEvent) -> Callable[[Handler], Handler]:
+
+def hook(
+    event: str | HookEvent,
+    tool: str | None = None,
+    *,
+    after: Iterable[str] = (),
+    timeout: float | None = None,
+    fallback: BaseModel | None = None,
+    defer: bool | None = None,
+) -> Callable[[Handler], Handler]:
     resolved_event = event.value if isinstance(event, HookEvent) else event
 
     def decorator(fn: Handler) -> Handler:
-        caller_globals = inspect.stack()[1].frame.f_globals
-        if caller_globals.get("__name__") == "__main__":
-            _execute(fn, resolved_event)
+        _register(_HANDLERS.setdefault((resolved_event, tool), []), fn)
+        if after:
+            from cc_hooks import chain
+
+            chain.run_after(fn, after)
+        if timeout is not None or fallback is not None:
+            from cc_hooks import deadlines
+
+            deadlines.set_limit(fn, timeout, fallback)
+        caller = sys._getframe(1)
+        if caller.f_globals.get("__name__") == "__main__" and not _deferred(caller, defer):
+            _execute(fn, resolved_event, tool)
 
         return fn
 
     return decorator
 
 
+def _handlers_for(event: str, tool: str | None = None) -> list[Handler]:
+    # Handlers registered without a tool see every payload of the event and come
+    # first, followed by the ones registered for this tool.
+    generic = _HANDLERS.get((event, None), [])
+    return generic + _HANDLERS.get((event, tool), []) if tool is not None else list(generic)
+
+
+def _register(handlers: list[Handler], fn: Handler) -> None:
+    # Re-registering the same function (a reloaded module) replaces it in place.
+    key = (getattr(fn, "__module__", None), getattr(fn, "__qualname__", None))
+    for index, existing in enumerate(handlers):
+        if (getattr(existing, "__module__", None), getattr(existing, "__qualname__", None)) == key:
+            handlers[index] = fn
+            return
+    handlers.append(fn)
+
+
+def _feature(name: str) -> Any:
+    module = sys.modules.get(name)
+    if module is None and any(os.environ.get(var) for var in _FEATURE_ENV.get(name, ())):
+        module = import_module(name)
+    return module
+
+
+def _invocation_deadline() -> float | None:
+    deadlines = _feature("cc_hooks.deadlines")
+    return deadlines.invocation_deadline() if deadlines is not None else None
+
+
+def run() -> None:
+    deadline = _invocation_deadline()
+    _handle_sigterm()
+    try:
+        raw = _read_stdin(deadline)
+    except Exception as exc:
+        sys.stderr.write(_format_error(exc, "<unknown>", None))
+        raise SystemExit(2) from exc
+
+    code, stdout, stderr = _dispatch(raw, deadline)
+    _respond(code, stdout, stderr)
+
+
+def _read_stdin(deadline: float | None = None) -> "bytes | LazyPayload":
+    buffer = getattr(sys.stdin, "buffer", None)
+    lazy = _feature("cc_hooks.lazy")
+    config = lazy.lazy_fields_config() if lazy is not None else None
+    if buffer is None:
+        data = sys.stdin.read().encode("utf-8")
+        return data if config is None else lazy.LazyPayload(data, config)
+    deadlines = _feature("cc_hooks.deadlines")
+    timeout = deadlines.stdin_timeout(deadline) if deadlines is not None else None
+    if config is not None:
+        payload: LazyPayload = lazy.read_payload(
+            buffer if timeout is None else deadlines.timed_reader(buffer, timeout), config
+        )
+        return payload
+    raw: bytes = buffer.read() if timeout is None else deadlines.read_with_timeout(buffer, timeout)
+    return raw
+
+
+def _validate_envelope(raw: "bytes | str | LazyPayload") -> "_Envelope":
+    # Anything but bytes or str is a LazyPayload, which only exists once lazy is loaded.
+    return _Envelope.model_validate_json(raw if isinstance(raw, bytes | str) else raw.subset(_ENVELOPE_KEYS))
+
+
+def _validate_input(input_model: InputModel, raw: "bytes | str | LazyPayload") -> BaseModel:
+    return input_model.model_validate_json(raw) if isinstance(raw, bytes | str) else raw.validate(input_model)
+
+
+def _write_stdout(data: bytes) -> None:
+    if not data:
+        return
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _respond(code: int, stdout: bytes, stderr: str) -> NoReturn:
+    _write_stdout(stdout)
+    sys.stderr.write(stderr)
+    background = sys.modules.get("cc_hooks.background")
+    if background is not None:
+        background.spawn(background.take_tasks())
+    raise SystemExit(code)
+
+
+def _handle_sigterm() -> None:
+    # Claude Code terminates hooks that exceed its timeout; answer with whatever the
+    # handlers have produced so far (or their fallbacks) instead of dying silently.
+    try:
+        signal.signal(signal.SIGTERM, _on_sigterm)
+    except ValueError:
+        pass  # Not the main thread.
+
+
+def _on_sigterm(signum: int, frame: FrameType | None) -> None:
+    answer = _answer
+    if answer is None:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.kill(os.getpid(), signal.SIGTERM)
+        return
+    code, stdout, stderr = answer()
+    _write_stdout(stdout)
+    sys.stderr.write(stderr)
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def _deferred(frame: FrameType, defer: bool | None) -> bool:
+    # A handler in a script's __main__ runs on decoration (the single-handler
+    # contract) unless registered with defer=True, or with the default when the
+    # script has imported this run() by name to dispatch itself.
+    if defer is not None:
+        return defer
+    return frame.f_globals.get("run") is run
+
+
 def _resolve_input_model(event: str) -> InputModel:
-    if event not in _EVENT_INPUT_MODEL:
+    if event not in _EVENT_MODULE:
         raise ValueError(f"Unsupported hook event: {event}")
-    return _EVENT_INPUT_MODEL[event]
+    model: InputModel = getattr(import_module(_EVENT_MODULE[event]), f"{event}Input")
+    return model
+
+
+def _resolve_output_model(event: str) -> type[BaseModel]:
+    model: type[BaseModel] = getattr(import_module(_EVENT_MODULE[event]), f"{event}Output")
+    return model
+
 
+def _prepare_models(event: str, input_model: InputModel) -> None:
+    if schema_cache_dir() is not None:
+        prepare_model(input_model)
+        prepare_model(_resolve_output_model(event))
 
-def _execute(fn: Handler, event: str) -> None:
+
+def _execute(fn: Handler, event: str, tool: str | None = None) -> None:
+    deadline = _invocation_deadline()
+    _handle_sigterm()
     input_model = _resolve_input_model(event)
+    _prepare_models(event, input_model)
     try:
-        raw = sys.stdin.read()
-        payload = json.loads(raw) if raw else {}
-        parsed_input = input_model(**payload)
+        raw = _read_stdin(deadline)
+        envelope = _validate_envelope(raw) if tool is not None else None
+    except Exception as exc:
+        sys.stderr.write(_format_error(exc, event, fn))
+        raise SystemExit(2) from exc
+
+    if envelope is not None and envelope.tool_name != tool:
+        raise SystemExit(0)
+
+    code, stdout, stderr = _run_handlers([fn], event, input_model, raw, deadline)
+    _respond(code, stdout, stderr)
+
+
+def _dispatch(raw: "bytes | str | LazyPayload", deadline: float | None = None) -> tuple[int, bytes, str]:
+    if deadline is None:
+        deadline = _invocation_deadline()
+    try:
+        envelope = _validate_envelope(raw)
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, "<unknown>", None)
+
+    event = envelope.hook_event_name
+    if not isinstance(event, str):
+        return 2, b"", f"ValueError in event={event} handler=<handler>: payload has no hook_event_name"
+
+    tool_name = envelope.tool_name if isinstance(envelope.tool_name, str) else None
+    fns = _handlers_for(event, tool_name)
+    if not fns:
+        return 0, b"", ""
 
-        if asyncio.iscoroutinefunction(fn):
-            result = asyncio.run(fn(parsed_input))
+    input_model = _resolve_input_model(event)
+    _prepare_models(event, input_model)
+    return _run_handlers(fns, event, input_model, raw, deadline)
+
+
+def _run_handlers(
+    fns: list[Handler],
+    event: str,
+    input_model: InputModel,
+    raw: "bytes | str | LazyPayload",
+    deadline: float | None = None,
+) -> tuple[int, bytes, str]:
+    global _answer
+    background = sys.modules.get("cc_hooks.background")
+    if background is not None:
+        background.begin(event)
+    try:
+        parsed_input = _validate_input(input_model, raw)
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, event, fns[0])
+
+    breaker, chain = _feature("cc_hooks.breaker"), _feature("cc_hooks.chain")
+    deadlines = _feature("cc_hooks.deadlines")  # Also loaded by breaker and chain.
+    if deadlines is None and len(fns) == 1 and not inspect.iscoroutinefunction(fns[0]):
+        return _call_directly(fns[0], event, parsed_input)
+    if deadlines is None:
+        deadlines = import_module("cc_hooks.deadlines")
+
+    # One slot per handler: its output, the exception it raised, or PENDING while it
+    # has not finished (timeouts are settled to fallbacks by _finish). Handlers whose
+    # circuit breaker is open get their fallback up front and are not called.
+    results: list[Any] = [deadlines.PENDING] * len(fns)
+    breakers = breaker.gate(event, parsed_input) if breaker is not None else None
+    if breakers is not None:
+        for index, fn in enumerate(fns):
+            if not breakers.allow(fn):
+                results[index] = deadlines.fallback_for(fn)
+
+    _answer = partial(_finish, fns, event, results)
+    # Indexes of the handlers a chain actually called; None when every allowed handler ran.
+    called: set[int] | None = None
+    try:
+        if len(fns) == 1:
+            if results[0] is deadlines.PENDING:
+                results[0] = deadlines.call(fns[0], parsed_input, deadline)
+        elif chain is not None and chain.chain_enabled(event):
+            called = chain.run_chain(fns, event, parsed_input, results, deadline)
         else:
-            result = fn(parsed_input)
+            _call_concurrently(fns, parsed_input, results, deadline)
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, event, fns[0])
+    finally:
+        _answer = None
+    notes = breakers.record(fns, results, called) if breakers is not None else ""
+    code, stdout, stderr = _finish(fns, event, results)
+    return code, stdout, notes + stderr
 
-        if result is not None:
-            serialized = result.model_dump(by_alias=True, exclude_none=True)
-            sys.stdout.write(json.dumps(serialized))
 
-        raise SystemExit(0)
-    except SystemExit:
-        raise
+def _call_directly(fn: Handler, event: str, parsed_input: BaseModel) -> tuple[int, bytes, str]:
+    global _answer
+    # A lone sync handler without limits, breaker or chain runs on this thread, and the
+    # deadline machinery is loaded only if SIGTERM arrives while it runs.
+    _answer = partial(_terminated, fn, event)
+    try:
+        result: Any = fn(parsed_input)
     except Exception as exc:  # noqa: BLE001
-        handler_name = getattr(fn, "__name__", "<handler>")
-        sys.stderr.write(f"{type(exc).__name__} in event={event} handler={handler_name}: {exc}")
-        raise SystemExit(2) from exc
+        result = exc
+    finally:
+        _answer = None
+    return _finish([fn], event, [result])
+
+
+def _terminated(fn: Handler, event: str) -> tuple[int, bytes, str]:
+    from cc_hooks.deadlines import PENDING
+
+    return _finish([fn], event, [PENDING])
+
+
+def _call_concurrently(fns: list[Handler], parsed_input: BaseModel, results: list[Any], deadline: float | None) -> None:
+    # Async handlers share one event loop, sync handlers run on threads; all of them
+    # receive the same input instance. Results keep registration order.
+    import asyncio
+
+    from cc_hooks import deadlines
+
+    async def call(index: int, fn: Handler) -> None:
+        if results[index] is deadlines.PENDING:
+            results[index] = await deadlines.call_async(fn, parsed_input, deadlines.handler_timeout(fn, deadline))
+
+    async def gather() -> None:
+        await asyncio.gather(*(call(index, fn) for index, fn in enumerate(fns)))
+
+    asyncio.run(gather())
+
+
+def _finish(fns: list[Handler], event: str, results: list[Any]) -> tuple[int, bytes, str]:
+    deadlines = sys.modules.get("cc_hooks.deadlines")
+    outputs = []
+    for fn, item in zip(fns, results, strict=True):
+        if deadlines is not None:
+            item = deadlines.settle(fn, item)
+        if isinstance(item, Exception):
+            return 2, b"", _format_error(item, event, fn)
+        if item is not None:
+            outputs.append(item)
+    try:
+        result = outputs[0] if len(outputs) == 1 else None
+        if len(outputs) > 1:
+            from cc_hooks.merge import merge_outputs
+
+            result = merge_outputs(outputs)
+        if result is None:
+            return 0, b"", ""
+        return 0, _to_json(result), ""
+    except Exception as exc:  # noqa: BLE001
+        return 2, b"", _format_error(exc, event, fns[0])
+
+
+def _to_json(output: BaseModel) -> bytes:
+    encoded: bytes = output.__pydantic_serializer__.to_json(output, by_alias=True, exclude_none=True)
+    return encoded
+
+
+def _format_error(exc: Exception, event: str, fn: Handler | None) -> str:
+    handler_name = getattr(fn, "__name__", "<handler>")
+    return f"{type(exc).__name__} in event={event} handler={handler_name}: {exc}"
@@ -0,0 +1,202 @@
+import os
+import sys
+from pathlib import Path
+from typing import Any, get_args
+
+from pydantic import BaseModel
+from pydantic_core import SchemaSerializer, SchemaValidator
+
+from cc_hooks.__about__ import __version__
+from cc_hooks._storage import cache_home, owned
+
+ENV_VAR = "CC_HOOKS_SCHEMA_CACHE"
+
+_cache_dir: Path | None = None
+_prepared: set[type[BaseModel]] = set()
+_OPAQUE_KEYS = frozenset({"default", "expected"})
+
+
+def default_cache_dir() -> Path:
+    return cache_home() / "schemas"
+
+
+def enable_schema_cache(cache_dir: str | os.PathLike[str] | None = None) -> Path:
+    global _cache_dir
+    _cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    return _cache_dir
+
+
+def disable_schema_cache() -> None:
+    global _cache_dir
+    _cache_dir = None
+    _prepared.clear()
+
+
+def schema_cache_dir() -> Path | None:
+    return _cache_dir
+
+
+def clear_schema_cache() -> int:
+    if _cache_dir is None or not _cache_dir.is_dir():
+        return 0
+    removed = 0
+    for path in _cache_dir.glob("*.pickle"):
+        path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+def prepare_model(model: type[BaseModel]) -> None:
+    if _cache_dir is None or model in _prepared:
+        return
+    _prepared.add(model)
+    for nested in _nested_models(model):
+        prepare_model(nested)
+    if model.__pydantic_complete__ or isinstance(model.__pydantic_validator__, SchemaValidator):
+        return
+
+    fingerprint = _definition_hash(model)
+    if fingerprint is None:
+        return
+    path = _cache_dir / f"{model.__module__}.{model.__qualname__}-{fingerprint[:24]}.pickle"
+    if not _load(model, path):
+        _store(model, path)
+
+
+def _load(model: type[BaseModel], path: Path) -> bool:
+    import pickle
+
+    # Unpickling runs code, so entries are only read if no other user could have written them.
+    if not owned(path.parent, 0o077) or not owned(path, 0o022):
+        return False
+    try:
+        schema = pickle.loads(path.read_bytes())
+        config = schema.get("config")
+        validator = SchemaValidator(schema, config)
+        serializer = SchemaSerializer(schema, config)
+    except FileNotFoundError:
+        return False
+    except Exception:  # noqa: BLE001
+        path.unlink(missing_ok=True)
+        return False
+
+    # __pydantic_complete__ stays False so anything that needs the full core
+    # schema (JSON schema, nesting in a new model) still triggers a real build.
+    model.__pydantic_validator__ = validator
+    model.__pydantic_serializer__ = serializer
+    return True
+
+
+def _store(model: type[BaseModel], path: Path) -> None:
+    import pickle
+
+    model.model_rebuild()
+    try:
+        data = pickle.dumps(_strip_metadata(model.__pydantic_core_schema__), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:  # noqa: BLE001 - schemas with lambdas or local validators are not cacheable
+        return
+
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not owned(path.parent, 0o077):
+            return
+        for stale in path.parent.glob(f"{model.__module__}.{model.__qualname__}-*.pickle"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        return
+
+
+def _strip_metadata(schema: Any) -> Any:
+    # Core schema metadata only feeds JSON schema generation and holds closures
+    # that cannot be pickled; validators and serializers never read it. Only
+    # schema dicts (str "type") lose the key, never field maps or default values.
+    if isinstance(schema, dict):
+        is_schema = isinstance(schema.get("type"), str)
+        return {
+            key: value if key in _OPAQUE_KEYS else _strip_metadata(value)
+            for key, value in schema.items()
+            if not (is_schema and key == "metadata")
+        }
+    if isinstance(schema, list):
+        return [_strip_metadata(value) for value in schema]
+    return schema
+
+
+def _nested_models(model: type[BaseModel]) -> list[type[BaseModel]]:
+    found: list[type[BaseModel]] = []
+    pending = [field.annotation for field in model.__pydantic_fields__.values()]
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            found.append(annotation)
+        else:
+            pending.extend(get_args(annotation))
+    return found
+
+
+def _definition_hash(model: type[BaseModel], seen: frozenset[type[BaseModel]] = frozenset()) -> str | None:
+    import hashlib
+
+    import pydantic
+    import pydantic_core
+
+    digest = hashlib.sha256()
+    for part in (__version__, pydantic.VERSION, pydantic_core.__version__, sys.version):
+        digest.update(part.encode())
+
+    for cls in model.__mro__:
+        if cls is BaseModel or not issubclass(cls, BaseModel):
+            continue
+        source = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if source is None:
+            return None
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        digest.update(f"{cls.__module__}:{cls.__qualname__}:{source}:{stat.st_mtime_ns}:{stat.st_size}".encode())
+        digest.update(repr(sorted(cls.model_config.items(), key=lambda item: item[0])).encode())
+
+    for name, field in model.__pydantic_fields__.items():
+        factory = field.default_factory
+        digest.update(
+            repr(
+                (
+                    name,
+                    field.annotation,
+                    field.alias,
+                    field.validation_alias,
+                    field.serialization_alias,
+                    field.default,
+                    getattr(factory, "__qualname__", factory),
+                    field.metadata,
+                )
+            ).encode()
+        )
+    for nested in _nested_models(model):
+        if nested in seen or nested is model:
+            continue
+        nested_hash = _definition_hash(nested, seen | {model})
+        if nested_hash is None:
+            return None
+        digest.update(nested_hash.encode())
+    return digest.hexdigest()
+
+
+if os.environ.get(ENV_VAR, "").strip().lower() not in ("", "0", "false", "no", "off"):
+    _value = os.environ[ENV_VAR].strip()
+    enable_schema_cache(None if _value.lower() in ("1", "true", "yes", "on") else _value)
+
+__all__ = [
+    "clear_schema_cache",
+    "default_cache_dir",
+    "disable_schema_cache",
+    "enable_schema_cache",
+    "prepare_model",
+    "schema_cache_dir",
+]
@@ -0,0 +1,157 @@
+import argparse
+import fcntl
+import hashlib
+import io
+import os
+import socket
+import socketserver
+import struct
+import sys
+import time
+from importlib import import_module
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+
+from cc_hooks import background, client, runner
+from cc_hooks.runner import _dispatch
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+
+def load_handlers(specs: list[str]) -> None:
+    for spec in specs:
+        if spec.endswith(".py") or os.sep in spec:
+            path = Path(spec).resolve()
+            module_name = f"_cc_hooks_handler_{path.stem}_{hashlib.sha1(str(path).encode()).hexdigest()[:8]}"
+            module_spec = spec_from_file_location(module_name, path)
+            if module_spec is None or module_spec.loader is None:
+                raise ImportError(f"Cannot load hook handlers from {spec}")
+            module = module_from_spec(module_spec)
+            sys.modules[module_name] = module
+            module_spec.loader.exec_module(module)
+        else:
+            import_module(spec)
+
+
+def build_models() -> None:
+    # Built once in the parent, so forked request children inherit validators and
+    # serializers instead of each rebuilding them for its first payload. Handlers of
+    # tool events without tool= may ask for any tool's input view.
+    from pydantic import BaseModel
+
+    from cc_hooks import registry
+    from cc_hooks.schema_cache import _nested_models
+
+    models: list[type[BaseModel]] = [runner._Envelope]
+    tools: set[str] = set()
+    for event, tool in list(runner._HANDLERS):
+        input_model = runner._resolve_input_model(event)
+        runner._prepare_models(event, input_model)
+        models += [input_model, runner._resolve_output_model(event)]
+        if "tool_name" in input_model.model_fields:
+            tools.update([tool] if tool is not None else [*registry._BUILTIN_TOOL_INPUTS, *registry._tool_registry])
+    for name in tools:
+        registry.get_tool_input_adapter(name)
+    seen: set[type[BaseModel]] = set()
+    while models:
+        model = models.pop()
+        if model not in seen:
+            seen.add(model)
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+            models.extend(_nested_models(model))
+
+
+def handle_request(meta: bytes | None, stdin: bytes) -> tuple[int, bytes, bytes]:
+    if meta is not None:
+        cwd, env = client.decode_meta(meta)
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+
+    captured_out, captured_err = io.StringIO(), io.StringIO()
+    sys.stdout, sys.stderr = captured_out, captured_err
+    try:
+        code, out, err = _dispatch(stdin)
+    except SystemExit as exc:
+        code, out, err = _exit_status(exc)
+    finally:
+        sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    stdout = captured_out.getvalue().encode("utf-8") + out
+    stderr = (captured_err.getvalue() + err).encode("utf-8")
+    return code, stdout, stderr
+
+
+def _exit_status(exc: SystemExit) -> tuple[int, bytes, str]:
+    if exc.code is None:
+        return 0, b"", ""
+    if isinstance(exc.code, int):
+        return exc.code, b"", ""
+    return 1, b"", str(exc.code)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        conn: socket.socket = self.request
+        data = client.recv_all(conn)
+        (meta_len,) = struct.unpack_from("!I", data)
+        code, stdout, stderr = handle_request(data[4 : 4 + meta_len], data[4 + meta_len :])
+        conn.sendall(struct.pack(client.RESPONSE_HEADER, code, len(stdout), len(stderr)) + stdout + stderr)
+        tasks = background.take_tasks()
+        if tasks:
+            # The client reads until EOF: end the response before deferred work starts.
+            conn.shutdown(socket.SHUT_WR)
+            background.spawn(tasks)
+
+
+class HookServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    # Each request runs in a forked child: handler modules and pydantic models are
+    # already imported, and per-invocation state never leaks between payloads.
+    timeout = 1.0
+
+    def __init__(self, socket_path: str) -> None:
+        self.last_request = time.monotonic()
+        super().__init__(socket_path, _RequestHandler)
+
+    def process_request(self, request: socket.socket, client_address: object) -> None:  # type: ignore[override]
+        self.last_request = time.monotonic()
+        super().process_request(request, client_address)
+
+
+def serve(specs: list[str], socket_path: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> int:
+    lock_file = open(f"{socket_path}.lock", "w")  # noqa: SIM115 - held for the daemon lifetime
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return 0
+
+    load_handlers(specs)
+    build_models()
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    try:
+        with HookServer(socket_path) as server:
+            while time.monotonic() - server.last_request < idle_timeout:
+                server.handle_request()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        lock_file.close()
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve @hook handlers over a per-project Unix socket.")
+    parser.add_argument("handlers", nargs="+", help="Hook script paths or importable module names")
+    parser.add_argument("--socket", help="Socket path (default: derived from project dir and handlers)")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT, help="Exit after N idle seconds")
+    args = parser.parse_args(argv)
+
+    socket_path = args.socket or client.socket_path(args.handlers)
+    return serve(args.handlers, socket_path, args.idle_timeout)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
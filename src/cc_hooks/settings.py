@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import re
+import shlex
+import sys
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from cc_hooks import runner
+from cc_hooks.enums import HookEvent
+from cc_hooks.server import load_handlers
+
+TOOL_EVENTS = frozenset(
+    {
+        HookEvent.PRE_TOOL_USE.value,
+        HookEvent.POST_TOOL_USE.value,
+        HookEvent.POST_TOOL_USE_FAILURE.value,
+        HookEvent.PERMISSION_REQUEST.value,
+    }
+)
+
+Registrations = dict[str, set[str | None]]
+
+
+def collect_registrations(spec: str) -> Registrations:
+    saved, runner._HANDLERS = runner._HANDLERS, {}
+    try:
+        load_handlers([spec])
+        loaded = runner._HANDLERS
+    finally:
+        for key, fns in runner._HANDLERS.items():
+            for fn in fns:
+                runner._register(saved.setdefault(key, []), fn)
+        runner._HANDLERS = saved
+
+    registrations: Registrations = {}
+    for event, tool in loaded:
+        registrations.setdefault(event, set()).add(tool)
+    return registrations
+
+
+def default_command(spec: str) -> str:
+    # The generating interpreter is the one that has cc_hooks and the scripts' imports.
+    python = shlex.quote(sys.executable)
+    if spec.endswith(".py") or "/" in spec:
+        return f"{python} {shlex.quote(str(Path(spec).resolve()))}"
+    return f"{python} -m {spec}"
+
+
+def matcher_for(event: str, tools: set[str | None]) -> str | None:
+    if event not in TOOL_EVENTS or None in tools:
+        return None
+    return "|".join(re.escape(tool) for tool in sorted(t for t in tools if t is not None))
+
+
+def generate_hooks(entries: Iterable[tuple[str, Registrations]]) -> dict[str, list[dict[str, Any]]]:
+    hooks: dict[str, list[dict[str, Any]]] = {}
+    for command, registrations in entries:
+        for event in sorted(registrations, key=_event_order):
+            group: dict[str, Any] = {}
+            matcher = matcher_for(event, registrations[event])
+            if matcher is not None:
+                group["matcher"] = matcher
+            group["hooks"] = [{"type": "command", "command": command}]
+            hooks.setdefault(event, []).append(group)
+    return hooks
+
+
+def merge_hooks(settings: dict[str, Any], generated: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+    targets = {_target(hook["command"]) for groups in generated.values() for group in groups for hook in group["hooks"]}
+    merged_hooks: dict[str, list[dict[str, Any]]] = {}
+    for event, groups in settings.get("hooks", {}).items():
+        kept = []
+        for group in groups:
+            remaining = [hook for hook in group.get("hooks", []) if _target(hook.get("command")) not in targets]
+            if remaining:
+                kept.append({**group, "hooks": remaining})
+        if kept:
+            merged_hooks[event] = kept
+    for event, groups in generated.items():
+        merged_hooks.setdefault(event, []).extend(groups)
+    return {**settings, "hooks": merged_hooks}
+
+
+def spawn_report(hooks: dict[str, list[dict[str, Any]]], payloads: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    spawns_without_matchers: Counter[str] = Counter()
+    spawns: Counter[str] = Counter()
+    total = 0
+    for payload in payloads:
+        total += 1
+        event = payload.get("hook_event_name") or payload.get("hookEventName")
+        groups = hooks.get(event, []) if isinstance(event, str) else []
+        if not groups:
+            continue
+        tool_name = payload.get("tool_name") or payload.get("toolName") or ""
+        key = f"{event}:{tool_name}" if event in TOOL_EVENTS else str(event)
+        spawns_without_matchers[key] += len(groups)
+        spawns[key] += sum(1 for group in groups if _matches(group.get("matcher"), tool_name, str(event)))
+
+    before = sum(spawns_without_matchers.values())
+    after = sum(spawns.values())
+    return {
+        "payloads": total,
+        "spawns_without_matchers": before,
+        "spawns_with_matchers": after,
+        "spawns_avoided": before - after,
+        "avoided_by_target": {
+            key: count - spawns[key] for key, count in sorted(spawns_without_matchers.items()) if count > spawns[key]
+        },
+    }
+
+
+def _target(command: object) -> object:
+    # What a command runs, regardless of the interpreter that runs it, so entries written
+    # as `python hook.py` are replaced by `/path/to/venv/bin/python /abs/hook.py`.
+    try:
+        words = shlex.split(command) if isinstance(command, str) else []
+    except ValueError:
+        return command
+    if len(words) < 2 or not re.fullmatch(r"python[\d.]*", Path(words[0]).name):
+        return command
+    if len(words) == 3 and words[1] == "-m":
+        return ("-m", words[2])
+    if len(words) == 2:
+        return str(Path(os.path.expandvars(words[1])).resolve())
+    return command
+
+
+def _matches(matcher: str | None, tool_name: str, event: str) -> bool:
+    if event not in TOOL_EVENTS or matcher in (None, "", "*"):
+        return True
+    return re.fullmatch(matcher, tool_name) is not None
+
+
+def _event_order(event: str) -> int:
+    order = [member.value for member in HookEvent]
+    return order.index(event) if event in order else len(order)
+
+
+def _read_corpus(path: Path) -> list[dict[str, Any]]:
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate Claude Code hook settings from registered @hook handlers.")
+    parser.add_argument("handlers", nargs="+", help="Hook script paths or importable module names")
+    parser.add_argument("--command", action="append", help="Command per handler (default: python <script>)")
+    parser.add_argument("--merge", type=Path, help="Existing settings.json to merge the hooks block into")
+    parser.add_argument("--write", action="store_true", help="Write the merged result back to --merge")
+    parser.add_argument("--corpus", type=Path, help="JSONL payload corpus for the spawns-avoided report")
+    args = parser.parse_args(argv)
+
+    if args.command and len(args.command) != len(args.handlers):
+        parser.error("--command must be given once per handler")
+    commands = args.command or [default_command(spec) for spec in args.handlers]
+    generated = generate_hooks((command, collect_registrations(spec)) for spec, command in zip(args.handlers, commands))
+
+    settings: dict[str, Any] = {"hooks": generated}
+    if args.merge is not None:
+        existing = json.loads(args.merge.read_text(encoding="utf-8")) if args.merge.exists() else {}
+        settings = merge_hooks(existing, generated)
+
+    rendered = json.dumps(settings, indent=2, ensure_ascii=False) + "\n"
+    if args.write:
+        if args.merge is None:
+            parser.error("--write requires --merge")
+        args.merge.write_text(rendered, encoding="utf-8")
+    else:
+        sys.stdout.write(rendered)
+
+    if args.corpus is not None:
+        report = spawn_report(generated, _read_corpus(args.corpus))
+        sys.stderr.write(json.dumps(report, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
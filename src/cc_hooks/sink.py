@@ -0,0 +1,206 @@
+import atexit
+import fcntl
+import os
+import time
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any, Self
+
+from pydantic import BaseModel
+from pydantic_core import from_json, to_json
+
+from cc_hooks import background
+from cc_hooks._storage import state_home
+from cc_hooks.lazy import LazyValue
+from cc_hooks.models._base import LAZY_ATTR
+
+# Batches are flushed at this size, so each write(2) stays one modest, complete chunk.
+BATCH_BYTES = 64 * 1024
+
+
+def default_sink_path() -> Path:
+    return state_home() / "events.jsonl"
+
+
+class EventSink:
+    # Appends one JSON object per line. Every record (or batch of records) goes out in
+    # a single write(2) on an O_APPEND descriptor, so concurrent hook processes never
+    # interleave partial lines; rotation is serialized through flock on `<path>.lock`.
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        *,
+        max_bytes: int | None = 10 * 1024 * 1024,
+        max_age: float | None = None,
+        backups: int = 5,
+        compress: bool = False,
+        redact: Iterable[str] = (),
+        max_field_bytes: int | None = 4096,
+        batch: bool = False,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_sink_path()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self.compress = compress
+        self.redact = frozenset(redact)
+        self.max_field_bytes = max_field_bytes
+        self.batch = batch
+        self._fd: int | None = None
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        if batch:
+            atexit.register(self.flush)
+
+    def emit(self, record: BaseModel | Mapping[str, Any], /, **extra: Any) -> None:
+        line = self.encode(record, extra)
+        if not self.batch:
+            self._write(line)
+            return
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        if self._pending_bytes >= BATCH_BYTES:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            data = b"".join(self._pending)
+            self._pending.clear()
+            self._pending_bytes = 0
+            self._write(data)
+
+    def close(self) -> None:
+        self.flush()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def encode(self, record: BaseModel | Mapping[str, Any], extra: Mapping[str, Any] | None = None) -> bytes:
+        parts = [b'"ts":' + to_json(round(time.time(), 6))]
+        for name, value in [*_fields(record), *(extra or {}).items()]:
+            parts.append(to_json(name) + b":" + self._encode_value(name, value))
+        return b"{" + b",".join(parts) + b"}\n"
+
+    def _encode_value(self, name: str, value: Any) -> bytes:
+        # Lazy payload fields (cc_hooks.lazy) are measured without being parsed.
+        if isinstance(value, LazyValue):
+            if name in self.redact or (self.max_field_bytes is not None and value.size > self.max_field_bytes):
+                return to_json({"redacted": True, "bytes": value.size})
+            raw = value.raw()
+            # Newlines can only be whitespace between tokens (strings escape them), but
+            # they would split the record; pretty-printed input is re-encoded compactly.
+            return to_json(from_json(raw)) if b"\n" in raw or b"\r" in raw else raw
+        encoded = to_json(value, by_alias=True, exclude_none=True, fallback=repr)
+        if name in self.redact or (self.max_field_bytes is not None and len(encoded) > self.max_field_bytes):
+            return to_json({"redacted": True, "bytes": len(encoded)})
+        return encoded
+
+    def _write(self, data: bytes) -> None:
+        os.write(self._descriptor(), data)
+
+    def _descriptor(self) -> int:
+        try:
+            current = os.stat(self.path)
+        except FileNotFoundError:
+            current = None
+        if self._fd is not None and (current is None or not os.path.samestat(current, os.fstat(self._fd))):
+            # Rotated (or removed) by another process: follow the path to the new segment.
+            os.close(self._fd)
+            self._fd = None
+        if current is not None and self._due(current.st_size):
+            self._rotate()
+        if self._fd is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        return self._fd
+
+    def _due(self, size: int) -> bool:
+        if self.max_bytes is not None and size >= self.max_bytes:
+            return True
+        return self.max_age is not None and time.time() - self._segment_started() >= self.max_age
+
+    def _segment_started(self) -> float:
+        # The lock file is touched whenever a segment is closed, so its mtime is the
+        # start of the current one.
+        lock = self._lock_path()
+        try:
+            return os.stat(lock).st_mtime
+        except FileNotFoundError:
+            lock.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            lock.touch(mode=0o600)
+            return time.time()
+
+    def _rotate(self) -> None:
+        closed = None
+        with open(self._lock_path(), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                size = os.stat(self.path).st_size
+            except FileNotFoundError:
+                size = None
+            if size is not None and self._due(size):
+                closed = self.path.with_name(f"{self.path.name}.{time.strftime('%Y%m%dT%H%M%S')}.{time.time_ns()}")
+                os.rename(self.path, closed)
+                os.utime(self._lock_path())
+                self._prune()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if closed is not None and self.compress:
+            # Inside a handler the segment is compressed after the response is sent.
+            try:
+                background.hook_context().defer(_gzip, closed)
+            except RuntimeError:
+                _gzip(closed)
+
+    def _prune(self) -> None:
+        segments = sorted(
+            path
+            for path in self.path.parent.glob(f"{self.path.name}.*")
+            if path.suffix not in (".lock", ".tmp") and path != self._lock_path()
+        )
+        for path in segments[: max(len(segments) - self.backups, 0)]:
+            path.unlink(missing_ok=True)
+
+    def _lock_path(self) -> Path:
+        return self.path.with_name(f"{self.path.name}.lock")
+
+
+def _fields(record: BaseModel | Mapping[str, Any]) -> list[tuple[str, Any]]:
+    if not isinstance(record, BaseModel):
+        return list(record.items())
+    deferred: dict[str, LazyValue] = vars(record).get(LAZY_ATTR, {})
+    fields = type(record).model_fields
+    values = [(name, deferred[name] if name in deferred else getattr(record, name)) for name in fields]
+    values += [*(record.__pydantic_extra__ or {}).items(), *((n, v) for n, v in deferred.items() if n not in fields)]
+    return [(name, value) for name, value in values if value is not None]
+
+
+def _gzip(path: Path) -> None:
+    import gzip
+    import shutil
+
+    target = path.with_name(f"{path.name}.gz")
+    temp = path.with_name(f"{path.name}.gz.tmp")
+    try:
+        with (
+            open(os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as raw,
+            open(path, "rb") as source,
+            gzip.GzipFile(fileobj=raw, mode="wb") as compressed,
+        ):
+            shutil.copyfileobj(source, compressed)
+    except FileNotFoundError:
+        temp.unlink(missing_ok=True)
+        return  # Pruned by another writer before it was compressed.
+    os.replace(temp, target)
+    path.unlink()
+
+
+__all__ = ["BATCH_BYTES", "EventSink", "default_sink_path"]
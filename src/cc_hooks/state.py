@@ -0,0 +1,155 @@
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from cc_hooks._storage import connect, state_home
+
+ENV_DB = "CC_HOOKS_STATE_DB"
+# Sessions that never reached SessionEnd are dropped once untouched for this long.
+DEFAULT_TTL = 7 * 24 * 3600.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    session TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (session, key)
+) WITHOUT ROWID;
+"""
+
+_path: Path | None = None
+_ttl = DEFAULT_TTL
+
+
+def default_db_path() -> Path:
+    configured = os.environ.get(ENV_DB)
+    if configured:
+        return Path(configured)
+    return state_home() / "state.sqlite3"
+
+
+def enable_session_state(path: str | os.PathLike[str] | None = None, *, ttl: float = DEFAULT_TTL) -> Path:
+    # Registers a SessionEnd handler that drops the ending session's state and any
+    # session untouched for `ttl` seconds, after the hook has answered.
+    from cc_hooks.runner import hook
+
+    global _path, _ttl
+    _path = Path(path) if path is not None else None
+    _ttl = ttl
+    hook("SessionEnd")(_end_session)
+    return _path or default_db_path()
+
+
+class SessionState:
+    __slots__ = ("_path", "session_id")
+
+    def __init__(self, session: BaseModel | str, path: str | os.PathLike[str] | None = None) -> None:
+        self.session_id = session if isinstance(session, str) else str(getattr(session, "session_id", ""))
+        self._path = Path(path) if path is not None else _path or default_db_path()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # Looked up per call: the instance may be shared by handlers on other threads.
+        return _connect(self._path)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        row = self._db.execute(
+            "SELECT value FROM state WHERE session = ? AND key = ?", (self.session_id, key)
+        ).fetchone()
+        return json.loads(row[0]) if row is not None else default
+
+    def set(self, key: str, value: Any) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO state VALUES (?, ?, ?, ?)", (self.session_id, key, _dumps(value), time.time())
+        )
+
+    def update(self, key: str, fn: Callable[[Any], Any], default: Any = None) -> Any:
+        # Atomic read-modify-write: `fn` gets the current value (or `default`) and
+        # returns the one to store.
+        with self._transaction():
+            value = fn(self.get(key, default))
+            self.set(key, value)
+        return value
+
+    def increment(self, key: str, by: float = 1) -> Any:
+        return self.update(key, lambda value: value + by, 0)
+
+    def append(self, key: str, item: Any, *, max_items: int | None = None) -> list[Any]:
+        def add(items: list[Any]) -> list[Any]:
+            items = [*items, item]
+            return items[-max_items:] if max_items is not None else items
+
+        result: list[Any] = self.update(key, add, [])
+        return result
+
+    def delete(self, key: str) -> None:
+        self._db.execute("DELETE FROM state WHERE session = ? AND key = ?", (self.session_id, key))
+
+    def clear(self) -> None:
+        self._db.execute("DELETE FROM state WHERE session = ?", (self.session_id,))
+
+    def to_dict(self) -> dict[str, Any]:
+        rows = self._db.execute("SELECT key, value FROM state WHERE session = ?", (self.session_id,))
+        return {key: json.loads(value) for key, value in rows}
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # BEGIN IMMEDIATE takes the write lock up front, so read-modify-write
+        # sequences from concurrent hook processes serialize instead of deadlocking.
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+
+def session_state(session: BaseModel | str) -> SessionState:
+    return SessionState(session)
+
+
+def expire_sessions(ttl: float | None = None, *, path: str | os.PathLike[str] | None = None) -> int:
+    db = _connect(Path(path) if path is not None else _path or default_db_path())
+    cutoff = time.time() - (_ttl if ttl is None else ttl)
+    # A session expires as a whole, by its most recent write.
+    stale = "DELETE FROM state WHERE session IN (SELECT session FROM state GROUP BY session HAVING max(updated) < ?)"
+    return db.execute(stale, (cutoff,)).rowcount
+
+
+def _end_session(input: BaseModel) -> None:
+    # Deferred, so the session's other SessionEnd handlers still see its state.
+    from cc_hooks.background import hook_context
+
+    hook_context().defer(_clear_session, session_state(input))
+
+
+def _clear_session(session: SessionState) -> None:
+    session.clear()
+    expire_sessions()
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    return connect(path, _SCHEMA)
+
+
+def _dumps(value: Any) -> str:
+    return to_json(value).decode()
+
+
+__all__ = [
+    "SessionState",
+    "default_db_path",
+    "enable_session_state",
+    "expire_sessions",
+    "session_state",
+]
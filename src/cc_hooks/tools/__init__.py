@@ -1,13 +1,44 @@
-from cc_hooks.tools.bash import BashInput
-from cc_hooks.tools.edit import EditInput
-from cc_hooks.tools.glob import GlobInput
-from cc_hooks.tools.grep import GrepInput
-from cc_hooks.tools.notebook_edit import NotebookEditInput
-from cc_hooks.tools.read import ReadInput
-from cc_hooks.tools.task import TaskInput
-from cc_hooks.tools.web_fetch import WebFetchInput
-from cc_hooks.tools.web_search import WebSearchInput
-from cc_hooks.tools.write import WriteInput
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cc_hooks.tools.bash import BashInput
+    from cc_hooks.tools.edit import EditInput
+    from cc_hooks.tools.glob import GlobInput
+    from cc_hooks.tools.grep import GrepInput
+    from cc_hooks.tools.notebook_edit import NotebookEditInput
+    from cc_hooks.tools.read import ReadInput
+    from cc_hooks.tools.task import TaskInput
+    from cc_hooks.tools.web_fetch import WebFetchInput
+    from cc_hooks.tools.web_search import WebSearchInput
+    from cc_hooks.tools.write import WriteInput
+
+_LAZY_ATTRS: dict[str, str] = {
+    "BashInput": "cc_hooks.tools.bash",
+    "WriteInput": "cc_hooks.tools.write",
+    "EditInput": "cc_hooks.tools.edit",
+    "ReadInput": "cc_hooks.tools.read",
+    "GlobInput": "cc_hooks.tools.glob",
+    "GrepInput": "cc_hooks.tools.grep",
+    "WebFetchInput": "cc_hooks.tools.web_fetch",
+    "WebSearchInput": "cc_hooks.tools.web_search",
+    "TaskInput": "cc_hooks.tools.task",
+    "NotebookEditInput": "cc_hooks.tools.notebook_edit",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+
 
 __all__ = [
     "BashInput",
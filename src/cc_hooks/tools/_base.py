@@ -2,4 +2,4 @@ from pydantic import BaseModel, ConfigDict
 
 
 class ToolInputBase(BaseModel):
-    model_config = ConfigDict(extra="allow", populate_by_name=True)
+    model_config = ConfigDict(extra="allow", populate_by_name=True, defer_build=True)
@@ -0,0 +1,185 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Self
+
+from pydantic_core import from_json
+
+from cc_hooks._storage import cache_home, remove_stale
+
+ENV_INDEX_DIR = "CC_HOOKS_TRANSCRIPT_INDEX_DIR"
+# Index files untouched for this long are removed when a new one is created.
+STALE_AFTER = 7 * 24 * 3600.0
+
+# Index file: header (magic, device, inode, indexed bytes, line count), then one
+# little-endian uint64 per line: the offset just past its newline.
+_HEADER = struct.Struct("<4sQQQQ")
+_MAGIC = b"CCT1"
+
+
+def default_index_dir() -> Path:
+    configured = os.environ.get(ENV_INDEX_DIR)
+    if configured:
+        return Path(configured)
+    return cache_home() / "transcripts"
+
+
+class Transcript:
+    # A JSONL transcript read through mmap. Only newline-terminated lines count as
+    # records, so a line Claude Code is still writing is never returned half-done.
+
+    def __init__(self, path: str | os.PathLike[str], *, index_dir: str | os.PathLike[str] | None = None) -> None:
+        self.path = Path(path)
+        self.index_dir = Path(index_dir) if index_dir is not None else default_index_dir()
+        self._ends: array[int] = array("Q")
+        self._map: mmap.mmap | None = None
+        self._size = 0
+
+    def tail(self, n: int) -> list[dict[str, Any]]:
+        # Scans backwards from the end; no index needed.
+        data, end = self._data(), self._complete_end()
+        records: list[dict[str, Any]] = []
+        while end > 0 and len(records) < n:
+            start = data.rfind(b"\n", 0, end - 1) + 1
+            record = _parse(data, start, end)
+            if record is not None:
+                records.append(record)
+            end = start
+        records.reverse()
+        return records
+
+    def records(self, start: int = 0) -> Iterator[dict[str, Any]]:
+        # Streams records from line `start` (negative counts from the end).
+        ends = self.line_ends()
+        if start < 0:
+            start = max(len(ends) + start, 0)
+        data = self._data()
+        for index in range(start, len(ends)):
+            record = _parse(data, ends[index - 1] if index else 0, ends[index])
+            if record is not None:
+                yield record
+
+    def since(self, offset: int) -> Iterator[tuple[int, dict[str, Any]]]:
+        # Records that start at or after byte `offset`, each with the offset just past
+        # it, for readers that keep their own position in the file.
+        data, end = self._data(), self._complete_end()
+        while offset < end:
+            next_offset = data.find(b"\n", offset, end) + 1
+            record = _parse(data, offset, next_offset)
+            if record is not None:
+                yield next_offset, record
+            offset = next_offset
+
+    @property
+    def complete_size(self) -> int:
+        return self._complete_end()
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self.records()
+
+    def __len__(self) -> int:
+        return len(self.line_ends())
+
+    def __getitem__(self, index: int) -> dict[str, Any] | None:
+        ends = self.line_ends()
+        index = range(len(ends))[index]
+        return _parse(self._data(), ends[index - 1] if index else 0, ends[index])
+
+    def line_ends(self) -> "array[int]":
+        # The persisted index is extended from its last offset, so a hook late in a
+        # long session only scans the bytes appended since the previous one.
+        data, complete = self._data(), self._complete_end()
+        if self._ends and self._ends[-1] == complete:
+            return self._ends
+        try:
+            self._ends = self._update_index(data, complete)
+        except OSError:
+            self._ends = _scan(data, self._ends[-1] if self._ends else 0, complete, array("Q", self._ends))
+        return self._ends
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _data(self) -> mmap.mmap | bytes:
+        try:
+            size = os.stat(self.path).st_size
+        except FileNotFoundError:
+            return b""
+        if self._map is None or size != self._size:
+            # The previous map is left to the garbage collector: records() generators
+            # may still be reading from it.
+            self._map = None
+            if size == 0:
+                return b""
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._size = size
+        return self._map
+
+    def _complete_end(self) -> int:
+        data = self._data()
+        return data.rfind(b"\n") + 1
+
+    def _update_index(self, data: mmap.mmap | bytes, complete: int) -> "array[int]":
+        stat = os.stat(self.path)
+        digest = hashlib.sha256(os.fsencode(os.path.abspath(self.path))).hexdigest()[:24]
+        index_path = self.index_dir / f"{digest}.idx"
+        if not index_path.exists():
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            remove_stale(self.index_dir, "*.idx", STALE_AFTER)
+        with open(os.open(index_path, os.O_RDWR | os.O_CREAT, 0o644), "r+b") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            header = f.read(_HEADER.size)
+            ends, indexed = array("Q"), 0
+            if len(header) == _HEADER.size:
+                magic, device, inode, indexed, count = _HEADER.unpack(header)
+                ends.frombytes(f.read(count * ends.itemsize))
+                # A rewritten or truncated transcript restarts the index from scratch.
+                same = (magic, device, inode) == (_MAGIC, stat.st_dev, stat.st_ino) and len(ends) == count
+                if not same or indexed > complete or (indexed and data[indexed - 1 : indexed] != b"\n"):
+                    ends, indexed = array("Q"), 0
+            if indexed == complete:
+                return ends
+            known = len(ends)
+            _scan(data, indexed, complete, ends)
+            f.seek(_HEADER.size + known * ends.itemsize)
+            f.truncate()
+            f.write(ends[known:].tobytes())
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, stat.st_dev, stat.st_ino, complete, len(ends)))
+        return ends
+
+
+def _scan(data: mmap.mmap | bytes, start: int, end: int, ends: "array[int]") -> "array[int]":
+    position = data.find(b"\n", start, end)
+    while position != -1:
+        ends.append(position + 1)
+        position = data.find(b"\n", position + 1, end)
+    return ends
+
+
+def _parse(data: mmap.mmap | bytes, start: int, end: int) -> dict[str, Any] | None:
+    line = data[start:end].strip()
+    if not line:
+        return None
+    try:
+        record = from_json(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
+
+
+__all__ = ["Transcript", "default_index_dir"]
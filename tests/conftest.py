@@ -1,5 +1,29 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
 import pytest
 
+from cc_hooks import background, breaker, chain, deadlines, runner, state
+
+
+@pytest.fixture(autouse=True)
+def _isolate_runner_config(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Any:
+    # README snippets and hook scripts enable these features in-process, and dispatched
+    # handlers leave their background context behind.
+    monkeypatch.setattr(background, "_current", None)
+    monkeypatch.setattr(breaker, "_policy", None)
+    monkeypatch.setattr(chain, "_events", set())
+    monkeypatch.setattr(chain, "_stats_path", None)
+    monkeypatch.setattr(deadlines, "_budget", None)
+    monkeypatch.setattr(deadlines, "_stdin_timeout", None)
+    monkeypatch.setattr(deadlines, "_limits", {})
+    monkeypatch.setattr(state, "_path", None)
+    monkeypatch.setattr(state, "_ttl", state.DEFAULT_TTL)
+    monkeypatch.setenv(state.ENV_DB, str(tmp_path / "state.sqlite3"))
+    yield
+
 
 @pytest.fixture
 def base_payload() -> dict[str, str]:
@@ -10,3 +34,16 @@ def base_payload() -> dict[str, str]:
         "permission_mode": "default",
         "hook_event_name": "PreToolUse",
     }
+
+
+@pytest.fixture
+def dispatch(monkeypatch: pytest.MonkeyPatch, base_payload: dict[str, str]) -> Callable[..., tuple[int, Any, str]]:
+    # Sends events through the runner with only the handlers the test registers.
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    def send(event: str, **fields: Any) -> tuple[int, Any, str]:
+        payload = {**base_payload, "hook_event_name": event, **fields}
+        code, stdout, stderr = runner._dispatch(json.dumps(payload).encode())
+        return code, json.loads(stdout) if stdout else None, stderr
+
+    return send
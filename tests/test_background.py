@@ -0,0 +1,116 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import background
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HOOK = """\
+import asyncio, sys, time
+from pathlib import Path
+from cc_hooks import PostToolUseInput, PostToolUseOutput, hook, hook_context, run
+
+def index(path: str) -> None:
+    time.sleep(1.5)
+    Path(path).write_text("indexed")
+
+async def notify(path: str) -> None:
+    await asyncio.sleep(1.5)
+    Path(path).write_text("notified")
+
+@hook("PostToolUse")
+def handle(input: PostToolUseInput) -> PostToolUseOutput:
+    context = hook_context()
+    context.defer(index, sys.argv[1] + ".index")
+    context.defer(notify, path=sys.argv[1] + ".notify")
+    return PostToolUseOutput.ok()
+
+if __name__ == "__main__":
+    run()
+"""
+
+PAYLOAD = {
+    "session_id": "s1",
+    "transcript_path": "/tmp/t.jsonl",
+    "cwd": "/tmp",
+    "permission_mode": "default",
+    "hook_event_name": "PostToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "ls"},
+    "tool_response": {"stdout": ""},
+    "tool_use_id": "t1",
+}
+
+
+def _wait_for(*paths: Path) -> None:
+    deadline = time.monotonic() + 10
+    while not all(path.exists() for path in paths) and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _run(args: list[str], tmp_path: Path, **env: str) -> tuple[subprocess.CompletedProcess[str], float]:
+    environ = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "CC_HOOKS_SOCKET_DIR": str(tmp_path / "sockets"), **env}
+    start = time.monotonic()
+    result = subprocess.run(
+        args, input=json.dumps(PAYLOAD), capture_output=True, text=True, env=environ, cwd=ROOT, check=False
+    )
+    return result, time.monotonic() - start
+
+
+def test_deferred_tasks_run_after_the_response(tmp_path: Path) -> None:
+    script = tmp_path / "hook.py"
+    script.write_text(HOOK, encoding="utf-8")
+    marker = tmp_path / "direct"
+
+    result, elapsed = _run([sys.executable, str(script), str(marker)], tmp_path)
+
+    assert (result.returncode, result.stdout, result.stderr) == (0, "{}", "")
+    assert elapsed < 1.5
+    _wait_for(tmp_path / "direct.index", tmp_path / "direct.notify")
+    assert (tmp_path / "direct.index").read_text() == "indexed"
+    assert (tmp_path / "direct.notify").read_text() == "notified"
+
+
+def test_daemon_ends_response_before_deferred_tasks(tmp_path: Path) -> None:
+    script = tmp_path / "hook.py"
+    script.write_text(HOOK.replace("sys.argv[1]", repr(str(tmp_path / "daemon"))), encoding="utf-8")
+    args = [sys.executable, "-m", "cc_hooks.client", str(script)]
+
+    _run(args, tmp_path, CC_HOOKS_DAEMON_IDLE_TIMEOUT="5")
+    _wait_for(tmp_path / "daemon.index")
+    (tmp_path / "daemon.index").unlink()
+    result, elapsed = _run(args, tmp_path)
+
+    assert list((tmp_path / "sockets").glob("*.sock")), "daemon was not spawned"
+    assert (result.returncode, result.stdout) == (0, "{}")
+    assert elapsed < 1.5
+    _wait_for(tmp_path / "daemon.index")
+    assert (tmp_path / "daemon.index").exists()
+
+
+def test_run_tasks_reports_failures_and_timeouts(capsys: pytest.CaptureFixture[str]) -> None:
+    done: list[Any] = []
+
+    def broken() -> None:
+        raise ValueError("webhook rejected")
+
+    background.run_tasks([broken, lambda: done.append(1)])
+    err = capsys.readouterr().err
+    assert done == [1]
+    assert err.startswith("cc-hooks: background task broken failed\n")
+    assert "ValueError: webhook rejected" in err
+
+    background.run_tasks([lambda: time.sleep(5)], timeout=0.05)
+    assert capsys.readouterr().err == "cc-hooks: background tasks did not finish within 0.05s\n"
+
+
+def test_hook_context_outside_a_handler() -> None:
+    with pytest.raises(RuntimeError, match="only available while a hook handler runs"):
+        background.hook_context()
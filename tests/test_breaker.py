@@ -0,0 +1,135 @@
+import asyncio
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from cc_hooks import breaker, chain, runner
+from cc_hooks.models import PreToolUseOutput
+from cc_hooks.runner import hook
+
+
+@pytest.fixture
+def clock(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(breaker, "time", SimpleNamespace(time=lambda: clock.now))
+    breaker.enable_breaker(failures=2, window=60, cooldown=300, state_dir=tmp_path / "breakers")
+    return clock
+
+
+def _dispatch(base_payload: dict[str, str], session: str = "s1") -> tuple[int, dict[str, Any] | None, str]:
+    payload = {**base_payload, "session_id": session, "tool_name": "Bash", "tool_input": {}, "tool_use_id": "t1"}
+    code, stdout, stderr = runner._dispatch(json.dumps(payload).encode())
+    return code, json.loads(stdout) if stdout else None, stderr
+
+
+def test_failures_open_the_circuit_until_a_probe_succeeds(clock: Any, base_payload: dict[str, str]) -> None:
+    calls = []
+    healthy = False
+
+    @hook("PreToolUse", fallback=PreToolUseOutput.allow())
+    def flaky(_: Any) -> None:
+        calls.append(clock.now)
+        if not healthy:
+            raise ConnectionError("policy service down")
+
+    assert _dispatch(base_payload) == (
+        2,
+        None,
+        "ConnectionError in event=PreToolUse handler=flaky: policy service down",
+    )
+    clock.now += 10
+    code, _, stderr = _dispatch(base_payload)
+    assert code == 2
+    assert stderr.startswith("cc-hooks: PreToolUse handler=flaky: 2 failures in 60s, skipping for 300s\n")
+
+    clock.now += 10
+    assert _dispatch(base_payload) == (
+        0,
+        {"hookSpecificOutput": {"hookEventName": "PreToolUse", "permissionDecision": "allow"}},
+        "",
+    )
+    assert _dispatch(base_payload, session="s2")[0] == 2
+    assert len(calls) == 3
+
+    clock.now += 300
+    code, _, stderr = _dispatch(base_payload)
+    assert code == 2
+    assert stderr.startswith(
+        "cc-hooks: PreToolUse handler=flaky: cool-down over, probing\n"
+        "cc-hooks: PreToolUse handler=flaky: probe failed, skipping for 300s\n"
+    )
+
+    healthy = True
+    clock.now += 301
+    code, output, stderr = _dispatch(base_payload)
+    assert (code, output) == (0, None)
+    assert stderr == (
+        "cc-hooks: PreToolUse handler=flaky: cool-down over, probing\n"
+        "cc-hooks: PreToolUse handler=flaky: probe succeeded, circuit closed\n"
+    )
+    assert len(calls) == 5
+    assert _dispatch(base_payload) == (0, None, "")
+
+
+def test_timeouts_count_as_failures(clock: Any, base_payload: dict[str, str]) -> None:
+    @hook("PreToolUse", timeout=0.01, fallback=PreToolUseOutput.ask("scanner unavailable"))
+    async def scanner(_: Any) -> None:
+        await asyncio.sleep(5)
+
+    @hook("PreToolUse")
+    def context(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.add_context("ok")
+
+    _dispatch(base_payload)
+    code, output, stderr = _dispatch(base_payload)
+
+    assert code == 0 and output is not None
+    assert output["hookSpecificOutput"]["permissionDecision"] == "ask"
+    assert stderr == "cc-hooks: PreToolUse handler=scanner: 2 failures in 60s, skipping for 300s\n"
+    policy = breaker.breaker_policy()
+    assert policy is not None
+    state = json.loads(next(policy.state_dir.glob("*.json")).read_text())
+    assert [entry["state"] for entry in state.values()] == ["open"]
+
+
+def test_chain_skipped_probe_does_not_close_the_circuit(
+    clock: Any, tmp_path: Path, base_payload: dict[str, str]
+) -> None:
+    chain.enable_chain("PreToolUse", stats_path=tmp_path / "stats.json")
+    calls = []
+    blocking = False
+
+    @hook("PreToolUse")
+    def gate(_: Any) -> PreToolUseOutput | None:
+        return PreToolUseOutput.deny("blocked") if blocking else None
+
+    @hook("PreToolUse", after=["gate"], fallback=PreToolUseOutput.allow())
+    def flaky(_: Any) -> None:
+        calls.append(clock.now)
+        raise ConnectionError("policy service down")
+
+    _dispatch(base_payload)
+    _dispatch(base_payload)
+    assert len(calls) == 2
+
+    blocking = True
+    clock.now += 301
+    code, output, stderr = _dispatch(base_payload)
+    assert code == 0 and output is not None
+    assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+    assert stderr == "cc-hooks: PreToolUse handler=flaky: cool-down over, probing\n"
+    policy = breaker.breaker_policy()
+    assert policy is not None
+    state = json.loads(next(policy.state_dir.glob("*.json")).read_text())
+    assert [entry["state"] for entry in state.values()] == ["half_open"]
+
+    blocking = False
+    clock.now += 301
+    code, _, stderr = _dispatch(base_payload)
+    assert code == 2
+    assert "probe failed" in stderr
+    assert len(calls) == 3
@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import chain, runner
+from cc_hooks.models import PermissionRequestOutput, PreToolUseOutput, StopOutput, UserPromptSubmitOutput
+from cc_hooks.runner import hook
+
+
+@pytest.fixture
+def stats_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    monkeypatch.setattr(chain, "_after", {})
+    return chain.enable_chain("PreToolUse", stats_path=tmp_path / "stats.json")
+
+
+def _dispatch(base_payload: dict[str, str], command: str) -> tuple[int, dict[str, Any] | None, str]:
+    payload = {**base_payload, "tool_name": "Bash", "tool_input": {"command": command}, "tool_use_id": "t1"}
+    code, stdout, stderr = runner._dispatch(json.dumps(payload).encode())
+    return code, json.loads(stdout) if stdout else None, stderr
+
+
+def test_chain_stops_at_first_deny_and_learns_order(stats_path: Path, base_payload: dict[str, str]) -> None:
+    calls: list[str] = []
+
+    @hook("PreToolUse")
+    def context(_: Any) -> PreToolUseOutput:
+        calls.append("context")
+        return PreToolUseOutput.add_context("3 calls")
+
+    @hook("PreToolUse")
+    def secrets(input: Any) -> PreToolUseOutput | None:
+        calls.append("secrets")
+        return PreToolUseOutput.deny("secret") if "AKIA" in input.tool_input["command"] else None
+
+    @hook("PreToolUse")
+    async def network(_: Any) -> None:
+        calls.append("network")
+
+    code, output, _ = _dispatch(base_payload, "echo AKIA")
+    assert code == 0 and calls == ["context", "secrets"]
+    assert output is not None and output["hookSpecificOutput"] == {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "deny",
+        "permissionDecisionReason": "secret",
+        "additionalContext": "3 calls",
+    }
+
+    stats = json.loads(stats_path.read_text())
+    stats[chain.handler_id("PreToolUse", context)] = [10, 0, 1.0]
+    stats[chain.handler_id("PreToolUse", network)] = [10, 0, 0.01]
+    stats_path.write_text(json.dumps(stats))
+    assert [entry.name for entry in chain.chain_order("PreToolUse")] == ["secrets", "network", "context"]
+
+    calls.clear()
+    code, output, _ = _dispatch(base_payload, "ls")
+    assert code == 0 and calls == ["secrets", "network", "context"]
+    assert output is not None and output["hookSpecificOutput"]["additionalContext"] == "3 calls"
+    runs = json.loads(stats_path.read_text())[chain.handler_id("PreToolUse", secrets)]
+    assert runs[:2] == [2, 1]
+
+
+def test_after_constraints_override_statistics(stats_path: Path, base_payload: dict[str, str]) -> None:
+    @hook("PreToolUse", after=["cheap"])
+    def audit(_: Any) -> None:
+        return None
+
+    @hook("PreToolUse")
+    def cheap(_: Any) -> None:
+        return None
+
+    stats_path.write_text(json.dumps({chain.handler_id("PreToolUse", cheap): [10, 0, 5.0]}))
+    assert [entry.name for entry in chain.chain_order("PreToolUse")] == ["cheap", "audit"]
+
+    @hook("PreToolUse", after=["audit"])
+    def cheap(_: Any) -> None:
+        return None
+
+    code, _, stderr = _dispatch(base_payload, "ls")
+    assert code == 2
+    assert stderr.startswith("ValueError in event=PreToolUse handler=audit: Handler ordering constraints form a cycle")
+
+
+def test_decisive_outputs() -> None:
+    assert chain.is_decisive(PreToolUseOutput.deny("x"))
+    assert not chain.is_decisive(PreToolUseOutput.ask("x"))
+    assert chain.is_decisive(PermissionRequestOutput.deny("x"))
+    assert not chain.is_decisive(PermissionRequestOutput.allow())
+    assert chain.is_decisive(UserPromptSubmitOutput.block("x"))
+    assert not chain.is_decisive(StopOutput.ok())
+
+
+def test_cli_prints_chain_order(stats_path: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    script = tmp_path / "guards.py"
+    script.write_text(
+        "from cc_hooks import hook, run\n"
+        "@hook('PreToolUse', tool='Bash')\n"
+        "def slow(_): return None\n"
+        "@hook('PreToolUse', tool='Bash')\n"
+        "def fast(_): return None\n"
+        "if __name__ == '__main__':\n"
+        "    run()\n",
+        encoding="utf-8",
+    )
+
+    assert chain.main([str(script)]) == 0
+    out = capsys.readouterr().out
+    assert out.splitlines()[0] == "PreToolUse (Bash):"
+    assert "1. slow  runs=0 mean=0.00ms decisive=50%" in out
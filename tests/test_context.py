@@ -0,0 +1,92 @@
+import json
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import context
+
+
+@pytest.fixture
+def transcript(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("CC_HOOKS_TRANSCRIPT_INDEX_DIR", str(tmp_path / "index"))
+    path = tmp_path / "transcript.jsonl"
+    path.touch()
+    return path
+
+
+@pytest.fixture
+def session(dispatch: Any, transcript: Path, monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(context, "_limit", context.DEFAULT_LIMIT)
+    monkeypatch.setattr(context, "_compact_at", context.DEFAULT_COMPACT_AT)
+    context.enable_context_tracker(limit=10_000, compact_at=0.9)
+    return partial(dispatch, transcript_path=str(transcript))
+
+
+def _append(path: Path, *records: dict[str, Any]) -> None:
+    with path.open("a") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+
+
+def _assistant(input_tokens: int, cache_read: int, output_tokens: int) -> dict[str, Any]:
+    usage = {"input_tokens": input_tokens, "cache_read_input_tokens": cache_read, "output_tokens": output_tokens}
+    return {"type": "assistant", "message": {"role": "assistant", "content": [], "usage": usage}}
+
+
+def test_estimate_tokens_by_character_class() -> None:
+    assert context.estimate_tokens("") == 0
+    assert context.estimate_tokens("abcd" * 100) == 100
+    assert context.estimate_tokens("{}" * 50) == 50
+    assert context.estimate_tokens("日本語") == 3
+    assert context.estimate_tokens(b"word " * 40) == context.estimate_tokens("word " * 40) == 40
+
+
+def test_tracker_follows_usage_and_projects_turns(session: Any, transcript: Path) -> None:
+    session("UserPromptSubmit", prompt="abcd" * 250)
+    assert context.context_estimate("sess_123").tokens == 250
+
+    # The prompt reaches the transcript with the model's usage; event estimates are replaced.
+    _append(transcript, {"type": "user", "message": {"content": "abcd" * 250}}, _assistant(10, 2_000, 90))
+    response = {"content": "x" * 400}
+    session("PostToolUse", tool_name="Read", tool_input={}, tool_use_id="t1", tool_response=response)
+    assert context.context_estimate("sess_123").tokens == 2_100 + context.estimate_tokens(json.dumps(response))
+
+    _append(transcript, {"type": "user", "message": {"content": [{"type": "tool_result", "content": "x" * 400}]}})
+    session("UserPromptSubmit", prompt="next")
+    estimate = context.context_estimate("sess_123")
+    assert estimate.tokens == 2_100 + 100 + 1
+    assert estimate.turns_left is not None
+    assert estimate.turns_left == pytest.approx((9_000 - estimate.tokens) / (estimate.tokens - 250))
+    assert estimate.compact_at == 9_000
+
+    session("SessionStart", source="compact", model="m")
+    assert context.context_estimate("sess_123").tokens == 0
+
+
+def test_first_event_starts_from_the_transcript_tail(session: Any, transcript: Path) -> None:
+    _append(transcript, *[_assistant(1, n, 1) for n in range(500)], {"type": "user", "message": {"content": "abcd"}})
+    session("Stop", stop_hook_active=False)
+    assert context.context_estimate("sess_123").tokens == 499 + 2 + 1
+    assert context.context_estimate("other").tokens == 0
+
+
+def test_counters_moved_during_read_are_reread(session: Any, transcript: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    session("Stop", stop_hook_active=False)
+    _append(transcript, _assistant(10, 1_000, 90))
+    read = context._read
+    calls = []
+
+    def racing(seen: dict[str, Any], transcript: Any) -> tuple[dict[str, Any], bool]:
+        calls.append(seen["offset"])
+        if len(calls) == 1:
+            # Another hook records the same new records between this read and the write.
+            monkeypatch.setattr(context, "_read", read)
+            session("Stop", stop_hook_active=False)
+            monkeypatch.setattr(context, "_read", racing)
+        return read(seen, transcript)
+
+    monkeypatch.setattr(context, "_read", racing)
+    session("UserPromptSubmit", prompt="abcd")
+    assert len(calls) == 2 and calls[0] != calls[1]
+    assert context.context_estimate("sess_123").tokens == 1_100 + 1
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import chain, deadlines, runner
+from cc_hooks.models import PreToolUseOutput
+from cc_hooks.runner import hook
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(autouse=True)
+def _handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+
+def _dispatch(base_payload: dict[str, str]) -> tuple[int, dict[str, Any] | None, str]:
+    payload = {**base_payload, "tool_name": "Bash", "tool_input": {"command": "ls"}, "tool_use_id": "t1"}
+    code, stdout, stderr = runner._dispatch(json.dumps(payload).encode())
+    return code, json.loads(stdout) if stdout else None, stderr
+
+
+def test_sync_handler_is_abandoned_for_its_fallback(base_payload: dict[str, str]) -> None:
+    release = threading.Event()
+
+    @hook("PreToolUse", timeout=0.05, fallback=PreToolUseOutput.deny("policy check timed out"))
+    def slow(_: Any) -> PreToolUseOutput:
+        release.wait(5)
+        return PreToolUseOutput.allow()
+
+    start = time.monotonic()
+    code, output, _ = _dispatch(base_payload)
+    release.set()
+
+    assert time.monotonic() - start < 1
+    assert code == 0 and output is not None
+    assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+
+
+def test_async_handler_is_cancelled_and_reported_without_fallback(base_payload: dict[str, str]) -> None:
+    cancelled = []
+
+    @hook("PreToolUse", timeout=0.05)
+    async def slow(_: Any) -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    code, output, stderr = _dispatch(base_payload)
+
+    assert cancelled == [True]
+    assert (code, output) == (2, None)
+    assert stderr == "TimeoutError in event=PreToolUse handler=slow: handler did not finish before its deadline"
+
+
+def test_budget_keeps_finished_outputs_and_falls_back_for_the_rest(base_payload: dict[str, str]) -> None:
+    deadlines.enable_deadlines(0.1)
+
+    @hook("PreToolUse")
+    def fast(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.add_context("fast check ran")
+
+    @hook("PreToolUse", fallback=PreToolUseOutput.allow())
+    async def slow(_: Any) -> PreToolUseOutput:
+        await asyncio.sleep(5)
+        return PreToolUseOutput.deny("too late")
+
+    @hook("PreToolUse")
+    def failing(_: Any) -> None:
+        raise TimeoutError("upstream timed out")
+
+    code, _, stderr = _dispatch(base_payload)
+    assert code == 2
+    assert stderr == "TimeoutError in event=PreToolUse handler=failing: upstream timed out"
+
+    runner._HANDLERS[("PreToolUse", None)].pop()
+    code, output, _ = _dispatch(base_payload)
+    assert code == 0 and output is not None
+    assert output["hookSpecificOutput"] == {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "allow",
+        "additionalContext": "fast check ran",
+    }
+
+
+def test_chain_treats_decisive_fallback_as_a_stop(base_payload: dict[str, str], tmp_path: Path) -> None:
+    chain.enable_chain("PreToolUse", stats_path=tmp_path / "stats.json")
+    calls = []
+
+    @hook("PreToolUse", timeout=0.01, fallback=PreToolUseOutput.deny("scanner timed out"))
+    async def scanner(_: Any) -> None:
+        calls.append("scanner")
+        await asyncio.sleep(5)
+
+    @hook("PreToolUse")
+    def audit(_: Any) -> None:
+        calls.append("audit")
+
+    code, output, _ = _dispatch(base_payload)
+
+    assert calls == ["scanner"]
+    assert code == 0 and output is not None
+    assert output["hookSpecificOutput"]["permissionDecisionReason"] == "scanner timed out"
+
+
+SLOW_HOOK = """\
+import sys, time
+from cc_hooks import PreToolUseInput, PreToolUseOutput, deadlines, hook, run, runner
+
+@hook("PreToolUse")
+def fast(input: PreToolUseInput) -> PreToolUseOutput:
+    return PreToolUseOutput.add_context("fast")
+
+@hook("PreToolUse", fallback=PreToolUseOutput.ask("review: check did not finish"))
+def slow(input: PreToolUseInput) -> None:
+    # Signal the test only once `fast`'s result is in its slot, so SIGTERM always
+    # finds it there.
+    results = runner._answer.args[2]
+    while results[0] is deadlines.PENDING:
+        time.sleep(0.001)
+    sys.stderr.write("started\\n")
+    sys.stderr.flush()
+    time.sleep(30)
+
+if __name__ == "__main__":
+    run()
+"""
+
+
+def test_sigterm_flushes_best_answer(tmp_path: Path, base_payload: dict[str, str]) -> None:
+    script = tmp_path / "slow_hook.py"
+    script.write_text(SLOW_HOOK, encoding="utf-8")
+    payload = {**base_payload, "tool_name": "Bash", "tool_input": {"command": "ls"}, "tool_use_id": "t1"}
+    process = _spawn(script)
+    assert process.stdin is not None and process.stderr is not None
+    process.stdin.write(json.dumps(payload).encode())
+    process.stdin.close()
+    assert process.stderr.readline() == b"started\n"
+
+    process.send_signal(signal.SIGTERM)
+
+    assert process.wait(timeout=10) == 0
+    assert process.stdout is not None
+    assert json.loads(process.stdout.read())["hookSpecificOutput"] == {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "ask",
+        "permissionDecisionReason": "review: check did not finish",
+        "additionalContext": "fast",
+    }
+
+
+def test_stdin_read_times_out(tmp_path: Path) -> None:
+    script = tmp_path / "slow_hook.py"
+    script.write_text(SLOW_HOOK, encoding="utf-8")
+    process = _spawn(script, CC_HOOKS_STDIN_TIMEOUT="0.2")
+    assert process.stdin is not None and process.stderr is not None
+    process.stdin.write(b'{"hook_event_name": ')
+    process.stdin.flush()
+
+    assert process.wait(timeout=10) == 2
+    process.stdin.close()
+    assert (
+        process.stderr.read().decode()
+        == "TimeoutError in event=<unknown> handler=<handler>: stdin was not closed within 0.2s"
+    )
+
+
+def _spawn(script: Path, **env: str) -> subprocess.Popen[bytes]:
+    environ = {**os.environ, "PYTHONPATH": str(ROOT / "src"), **env}
+    pipe = subprocess.PIPE
+    return subprocess.Popen([sys.executable, str(script)], stdin=pipe, stdout=pipe, stderr=pipe, env=environ)
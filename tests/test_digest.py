@@ -0,0 +1,49 @@
+from typing import Any
+
+import pytest
+
+from cc_hooks import digest
+
+
+@pytest.fixture
+def session(dispatch: Any, monkeypatch: pytest.MonkeyPatch) -> Any:
+    monkeypatch.setattr(digest, "_max_items", digest.DEFAULT_MAX_ITEMS)
+    digest.enable_session_digest(max_items=3)
+    return dispatch
+
+
+def _tool(tool: str, tool_input: dict[str, Any], **fields: Any) -> dict[str, Any]:
+    return {"tool_name": tool, "tool_input": tool_input, "tool_use_id": "t1", **fields}
+
+
+def test_events_fold_into_a_bounded_digest(session: Any) -> None:
+    session("UserPromptSubmit", prompt="Fix the flaky login test\nDetails follow")
+    for name in ("a.py", "b.py", "a.py", "c.py", "d.py"):
+        session("PostToolUse", **_tool("Edit", {"file_path": name}, tool_response={}))
+    failing = "FAILED tests/test_login.py::test_retry - AssertionError\n1 failed"
+    session("PostToolUse", **_tool("Bash", {"command": "pytest -q"}, tool_response={"stdout": failing}))
+    session("PostToolUseFailure", **_tool("Bash", {"command": "make lint"}, error="exit 2"))
+    session("PostToolUse", **_tool("Read", {"file_path": "e.py"}, tool_response={}))
+    digest.note_decision("sess_123", "Keep the retry loop, raise the timeout")
+
+    result = digest.session_digest("sess_123")
+    assert result.files == {"a.py": 2, "c.py": 1, "d.py": 1}
+    assert result.commands == [["pytest -q", True], ["make lint", False]]
+    assert result.failing_tests == ["tests/test_login.py::test_retry"]
+    assert result.prompts == ["Fix the flaky login test"]
+
+    passing = "5 passed in 0.1s"
+    session("PostToolUse", **_tool("Bash", {"command": "pytest"}, tool_response={"stdout": passing}))
+    assert digest.session_digest("sess_123").failing_tests == []
+
+
+def test_compact_resume_injects_the_digest(session: Any) -> None:
+    assert session("SessionStart", source="compact", model="m") == (0, None, "")
+    session("PostToolUse", **_tool("Write", {"file_path": "notes.md"}, tool_response={}))
+
+    assert session("SessionStart", source="startup", model="m") == (0, None, "")
+    code, output, _ = session("SessionStart", source="compact", model="m")
+    assert code == 0
+    assert output["hookSpecificOutput"]["additionalContext"] == (
+        "Session digest (maintained by hooks):\n- Files changed: notes.md"
+    )
@@ -0,0 +1,132 @@
+import io
+import json
+import os
+from typing import Any
+
+import pytest
+
+from cc_hooks import deadlines, lazy
+from cc_hooks.lazy import LazyPayload, read_payload
+from cc_hooks.models import PostToolUseInput, PostToolUseOutput, UserPromptSubmitInput
+from cc_hooks.runner import _execute, _read_stdin
+
+TOOL_RESPONSE = {"content": 'line with "quotes", {braces} and [brackets]\n' * 50, "ok": True}
+
+
+@pytest.fixture
+def config() -> Any:
+    yield lazy.enable_lazy_fields(min_bytes=256, spill_bytes=1024, preview_chars=16)
+    lazy.disable_lazy_fields()
+
+
+def _post_tool_use(**extra: Any) -> dict[str, Any]:
+    return {
+        "session_id": "lazy_1",
+        "transcript_path": "/tmp/t.jsonl",
+        "cwd": "/tmp",
+        "permission_mode": "default",
+        "hook_event_name": "PostToolUse",
+        "tool_name": "Read",
+        "tool_input": {"file_path": "/tmp/a.txt"},
+        "tool_response": TOOL_RESPONSE,
+        "tool_use_id": "toolu_lazy",
+        **extra,
+    }
+
+
+def test_large_fields_stay_raw_until_accessed(config: lazy.LazyConfig) -> None:
+    raw = json.dumps(_post_tool_use(), indent=2).encode()
+    data = LazyPayload(raw, config).validate(PostToolUseInput)
+
+    assert isinstance(data, PostToolUseInput)
+    deferred = data.lazy_field("tool_response")
+    assert deferred is not None
+    assert deferred.size > 256
+    assert deferred.preview() == '{\n    "content":…'
+    assert data.tool_input == {"file_path": "/tmp/a.txt"}
+
+    assert data.tool_response == TOOL_RESPONSE
+    assert data.lazy_field("tool_response") is None
+
+
+def test_dumps_load_deferred_fields(config: lazy.LazyConfig) -> None:
+    raw = json.dumps(_post_tool_use()).encode()
+    data = LazyPayload(raw, config).validate(PostToolUseInput)
+    assert data.model_dump()["tool_response"] == TOOL_RESPONSE
+    assert data.lazy_field("tool_response") is None
+
+    data = LazyPayload(raw, config).validate(PostToolUseInput)
+    assert json.loads(data.model_dump_json(by_alias=True))["toolResponse"] == TOOL_RESPONSE
+
+
+def test_aliases_strings_and_unknown_fields(config: lazy.LazyConfig) -> None:
+    lazy.enable_lazy_fields(["prompt", "attachment"], min_bytes=8)
+    payload = {
+        "sessionId": "lazy_2",
+        "transcriptPath": "/tmp/t.jsonl",
+        "cwd": "/tmp",
+        "permissionMode": "default",
+        "hookEventName": "UserPromptSubmit",
+        "prompt": "é" * 100,
+        "attachment": {"name": "x" * 20},
+    }
+    active = lazy.lazy_fields_config()
+    assert active is not None
+
+    data = LazyPayload(json.dumps(payload).encode(), active).validate(UserPromptSubmitInput)
+
+    assert isinstance(data, UserPromptSubmitInput)
+    assert data.lazy_field("prompt") is not None
+    assert data.prompt == "é" * 100
+    assert data.attachment == {"name": "x" * 20}  # type: ignore[attr-defined]
+    data.load_lazy_fields()
+    assert data.model_dump()["attachment"] == {"name": "x" * 20}
+
+
+def test_oversized_payload_spills_to_mapped_file(config: lazy.LazyConfig) -> None:
+    payload = read_payload(io.BytesIO(json.dumps(_post_tool_use()).encode()), config)
+
+    assert payload.spilled
+    data = payload.validate(PostToolUseInput)
+    deferred = data.lazy_field("tool_response")  # type: ignore[attr-defined]
+    assert deferred is not None and deferred.spilled
+    assert deferred.load() == TOOL_RESPONSE
+
+
+def test_incomplete_payload_is_rejected(config: lazy.LazyConfig) -> None:
+    with pytest.raises(ValueError, match="complete JSON object"):
+        LazyPayload(json.dumps(_post_tool_use()).encode()[:-1], config)
+
+
+def test_runner_defers_fields_for_logging_handler(config: lazy.LazyConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(json.dumps(_post_tool_use()).encode())))
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    def handler(input: PostToolUseInput) -> PostToolUseOutput:
+        deferred = input.lazy_field("tool_response")
+        assert deferred is not None
+        return PostToolUseOutput.add_context(f"{input.tool_name} {deferred.size}")
+
+    with pytest.raises(SystemExit) as exc:
+        _execute(handler, "PostToolUse")
+
+    assert exc.value.code == 0
+    output = json.loads(stdout.buffer.getvalue())  # type: ignore[attr-defined]
+    assert output["hookSpecificOutput"]["additionalContext"] == f"Read {len(json.dumps(TOOL_RESPONSE))}"
+
+
+def test_stdin_timeout_keeps_spill_path(config: lazy.LazyConfig, monkeypatch: pytest.MonkeyPatch) -> None:
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "wb") as pipe:
+        pipe.write(json.dumps(_post_tool_use()).encode())
+    stdin = io.TextIOWrapper(os.fdopen(read_fd, "rb"))
+    monkeypatch.setattr("sys.stdin", stdin)
+    monkeypatch.setattr(deadlines, "_stdin_timeout", 5.0)
+
+    with stdin:
+        payload = _read_stdin()
+
+    assert isinstance(payload, LazyPayload) and payload.spilled
+    deferred = payload.validate(PostToolUseInput).lazy_field("tool_response")  # type: ignore[attr-defined]
+    assert deferred is not None and deferred.load() == TOOL_RESPONSE
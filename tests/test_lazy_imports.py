@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import cc_hooks
+import cc_hooks.models
+import cc_hooks.tools
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _loaded_modules(code: str) -> set[str]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+    return set(json.loads(result.stdout))
+
+
+def test_importing_one_event_loads_only_its_module() -> None:
+    loaded = _loaded_modules("from cc_hooks import PreToolUseInput, PreToolUseOutput, hook")
+
+    assert "cc_hooks.models.pre_tool_use" in loaded
+    assert "cc_hooks.models.stop" not in loaded
+    assert "cc_hooks.models.session_start" not in loaded
+    assert not any(name.startswith("cc_hooks.tools.") for name in loaded)
+
+
+def test_plain_hook_loads_no_optional_features() -> None:
+    loaded = _loaded_modules(
+        "import json\n"
+        "from cc_hooks import PreToolUseInput, PreToolUseOutput, hook, run\n"
+        "from cc_hooks.runner import _dispatch\n"
+        "@hook('PreToolUse')\n"
+        "def check(input: PreToolUseInput) -> PreToolUseOutput:\n"
+        "    return PreToolUseOutput.allow()\n"
+        "payload = {'session_id': 's', 'transcript_path': '/t', 'cwd': '/', 'permission_mode': 'default',"
+        " 'hook_event_name': 'PreToolUse', 'tool_name': 'Bash', 'tool_input': {'command': 'ls'}, 'tool_use_id': 't1'}\n"
+        "assert _dispatch(json.dumps(payload).encode())[0] == 0"
+    )
+
+    features = ("background", "breaker", "chain", "deadlines", "lazy", "merge")
+    assert not {f"cc_hooks.{name}" for name in features} & loaded
+    assert "sqlite3" not in loaded
+
+
+def test_tool_helper_loads_tool_model_on_demand() -> None:
+    loaded = _loaded_modules(
+        "from cc_hooks import PreToolUseInput\n"
+        "PreToolUseInput(session_id='s', transcript_path='/t', cwd='/', permission_mode='default',"
+        " tool_name='Bash', tool_input={'command': 'ls'}, tool_use_id='t1').as_bash_input()"
+    )
+
+    assert "cc_hooks.tools.bash" in loaded
+    assert "cc_hooks.tools.write" not in loaded
+
+
+def test_lazy_exports_resolve_every_public_name() -> None:
+    for module in (cc_hooks, cc_hooks.models, cc_hooks.tools):
+        for name in module.__all__:
+            assert getattr(module, name) is not None, f"{module.__name__}.{name}"
+        assert set(module.__all__) <= set(dir(module))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="DoesNotExist"):
+        cc_hooks.DoesNotExist  # noqa: B018
@@ -0,0 +1,194 @@
+import inspect
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from cc_hooks import lite, models, runner, tools
+from cc_hooks.lite import runner as lite_runner
+
+ROOT = Path(__file__).resolve().parent.parent
+SCHEMAS = ROOT / "schemas"
+EVENTS = sorted(lite.INPUT_MODELS)
+TOOLS = sorted(path.name.removesuffix(".schema.json") for path in (SCHEMAS / "tools").glob("*.schema.json"))
+
+SAMPLES = {"string": "välue", "boolean": True, "integer": 7, "object": {"k": ["v", None]}, "array": [{"k": 1}]}
+# Values pydantic's lax mode rejects too, so both flavors must fail on them.
+INVALID = {"string": 123, "boolean": "maybe", "integer": "seven", "object": ["k"], "array": {"k": 1}}
+OUTPUT_ARGS: dict[str, Any] = {
+    "reason": "blocked — policy",
+    "context": "extra context",
+    "message": "message",
+    "updated_input": {"command": "echo safe", "nested": {"none": None}},
+    "updated_output": {"content": "redacted"},
+}
+
+
+def _schema(kind: str, name: str) -> dict[str, Any]:
+    schema: dict[str, Any] = json.loads((SCHEMAS / kind / f"{name}.schema.json").read_text(encoding="utf-8"))
+    return schema
+
+
+def _kind(prop: dict[str, Any]) -> str:
+    options = [option for option in prop.get("anyOf", [prop]) if option.get("type") != "null"]
+    return str(options[0].get("type"))
+
+
+def _sample(schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        alias: prop["const"] if "const" in prop else SAMPLES[_kind(prop)]
+        for alias, prop in schema["properties"].items()
+    }
+
+
+def _pair(kind: str, name: str) -> tuple[type[BaseModel], type[lite.LiteModel]]:
+    module = models if kind == "models" else tools
+    return getattr(module, name), getattr(lite, name)
+
+
+@pytest.mark.parametrize("name", [f"{event}Input" for event in EVENTS] + TOOLS)
+def test_inputs_validate_like_pydantic(name: str) -> None:
+    kind = "models" if name.removesuffix("Input") in EVENTS else "tools"
+    schema = _schema(kind, name)
+    pydantic_model, lite_model = _pair(kind, name)
+    payload = {**_sample(schema), "futureField": {"x": 1}}
+    by_name = {pydantic_model.model_fields[key].alias or key: key for key in pydantic_model.model_fields}
+    by_name = {by_name.get(alias, alias): value for alias, value in payload.items()}
+
+    expected = pydantic_model.model_validate(payload).model_dump(by_alias=True, exclude_none=True)
+    assert lite_model.from_dict(payload).to_dict() == expected
+    assert lite_model.from_json(json.dumps(payload)).to_dict() == expected
+    assert lite_model(**by_name).to_dict() == expected
+
+    for alias in schema.get("required", []):
+        missing = {key: value for key, value in payload.items() if key != alias}
+        with pytest.raises(ValidationError):
+            pydantic_model.model_validate(missing)
+        with pytest.raises(lite.ValidationError, match=f"{alias}: field required"):
+            lite_model.from_dict(missing)
+
+    for alias, prop in schema["properties"].items():
+        invalid = {**payload, alias: "Other" if "const" in prop else INVALID[_kind(prop)]}
+        with pytest.raises(ValidationError):
+            pydantic_model.model_validate(invalid)
+        with pytest.raises(lite.ValidationError, match=alias):
+            lite_model.from_dict(invalid)
+
+
+def _factories(model: type[BaseModel]) -> list[str]:
+    return ["stop_session"] + [
+        name for name, attr in vars(model).items() if isinstance(attr, classmethod) and not name.startswith("_")
+    ]
+
+
+@pytest.mark.parametrize("event", EVENTS)
+def test_outputs_encode_identical_bytes(event: str) -> None:
+    pydantic_model, lite_model = _pair("models", f"{event}Output")
+    assert runner._to_json(pydantic_model()) == lite_model().to_json()
+
+    for name in _factories(pydantic_model):
+        parameters = inspect.signature(getattr(pydantic_model, name)).parameters.values()
+        every = {param.name: OUTPUT_ARGS[param.name] for param in parameters}
+        required = {param.name: every[param.name] for param in parameters if param.default is inspect.Parameter.empty}
+        for kwargs in (every, required):
+            expected = runner._to_json(getattr(pydantic_model, name)(**kwargs))
+            assert getattr(lite_model, name)(**kwargs).to_json() == expected, name
+
+    fields = {"continue_": False, "system_message": "ß", "suppress_output": None, "custom": {"a": None}}
+    assert lite_model(**fields).to_json() == runner._to_json(pydantic_model(**fields))
+
+
+def test_nested_outputs_accept_dicts_and_reject_bad_literals() -> None:
+    output = lite.PreToolUseOutput(hook_specific_output={"permissionDecision": "deny", "permissionDecisionReason": "x"})
+
+    assert output == lite.PreToolUseOutput.deny("x")
+    with pytest.raises(lite.ValidationError, match="permissionDecision"):
+        lite.PreToolUseHookSpecific(permission_decision="maybe")
+
+
+def test_tool_helpers_parse_matching_tools_only() -> None:
+    payload = {**_sample(_schema("models", "PreToolUseInput")), "toolName": "Bash", "toolInput": {"command": "ls"}}
+    data = lite.PreToolUseInput.from_dict(payload)
+
+    bash = data.as_bash_input()
+    assert isinstance(bash, lite.BashInput) and bash.command == "ls"
+    assert data.as_write_input() is None
+    assert data.as_tool_input(lite.WriteInput) is None
+
+
+def test_lite_runner_merges_like_the_pydantic_runner(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    monkeypatch.setattr(lite_runner, "_HANDLERS", {})
+    for flavor, register in ((models, runner.hook), (lite, lite_runner.hook)):
+        output = flavor.PreToolUseOutput
+
+        @register("PreToolUse")
+        def allow(input: Any, output: Any = output) -> Any:
+            return output.allow()
+
+        @register("PreToolUse", tool="Bash")
+        def deny(input: Any, output: Any = output) -> Any:
+            command = input.tool_input["command"]
+            return output.deny(f"no {command}") if command.startswith("rm") else None
+
+        @register("PreToolUse", tool="Bash")
+        def context(input: Any, output: Any = output) -> Any:
+            return output.add_context("checked")
+
+        @register("PreToolUse")
+        def quiet(input: Any, output: Any = output) -> Any:
+            return output(system_message="first", custom=1)
+
+    payload = {**_sample(_schema("models", "PreToolUseInput")), "toolName": "Bash"}
+    for command in ("rm -rf /", "ls"):
+        raw = json.dumps({**payload, "toolInput": {"command": command}}).encode()
+        assert lite_runner._dispatch(raw) == runner._dispatch(raw)
+        assert lite_runner._dispatch(raw)[0] == 0
+    write = json.dumps({**payload, "toolName": "Write"}).encode()
+    assert lite_runner._dispatch(write) == runner._dispatch(write)
+
+
+def test_generated_package_is_up_to_date() -> None:
+    result = _run([sys.executable, str(ROOT / "scripts" / "generate_schemas.py"), "--check"])
+
+    assert result.returncode == 0, result.stderr
+
+
+HOOK = """\
+import sys
+from cc_hooks.lite import PreToolUseInput, PreToolUseOutput, hook
+
+
+@hook("PreToolUse", tool="Bash")
+def guard(input: PreToolUseInput) -> PreToolUseOutput | None:
+    assert "pydantic" not in sys.modules
+    bash = input.as_bash_input()
+    return PreToolUseOutput.deny(f"no {bash.command}") if bash and "rm" in bash.command else None
+"""
+
+
+def test_lite_hook_runs_without_pydantic(tmp_path: Path) -> None:
+    script = tmp_path / "guard.py"
+    script.write_text(HOOK, encoding="utf-8")
+    payload = {**_sample(_schema("models", "PreToolUseInput")), "toolName": "Bash", "toolInput": {"command": "rm -rf"}}
+
+    denied = _run([sys.executable, str(script)], json.dumps(payload))
+    assert denied.returncode == 0, denied.stderr
+    assert denied.stdout == runner._to_json(models.PreToolUseOutput.deny("no rm -rf")).decode()
+
+    other_tool = _run([sys.executable, str(script)], json.dumps({**payload, "toolName": "Write"}))
+    assert (other_tool.returncode, other_tool.stdout) == (0, "")
+
+    invalid = _run([sys.executable, str(script)], json.dumps({**payload, "sessionId": None}))
+    assert invalid.returncode == 2
+    assert invalid.stderr.startswith("ValidationError in event=PreToolUse handler=guard: ")
+
+
+def _run(args: list[str], stdin: str = "") -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    return subprocess.run(args, input=stdin, capture_output=True, text=True, env=env, check=False)
@@ -0,0 +1,114 @@
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import memo
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(memo.ENV_DB, str(tmp_path / "memo.sqlite3"))
+    return tmp_path / "memo.sqlite3"
+
+
+def test_results_are_reused_until_a_watched_file_changes(tmp_path: Path, db: Path) -> None:
+    config = tmp_path / "pyproject.toml"
+    config.write_text("[project]\nname = 'a'\n")
+    calls: list[str] = []
+
+    @memo.cached(invalidate_on=lambda path: [path])
+    def project_name(path: Path) -> str:
+        calls.append(path.read_text())
+        return path.read_text().split("'")[1]
+
+    assert project_name.cache_lookup(config) is None  # type: ignore[attr-defined]
+    assert project_name(config) == "a"
+    assert project_name(config) == "a"
+    assert project_name.cache_lookup(config) == ("a",)  # type: ignore[attr-defined]
+    assert len(calls) == 1
+
+    config.write_text("[project]\nname = 'bb'\n")
+    assert project_name(config) == "bb"
+    assert len(calls) == 2
+
+    pid = os.fork()
+    if pid == 0:
+        os._exit(0 if project_name(config) == "bb" and len(calls) == 2 else 1)
+    assert os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0, "another process should hit the cache"
+
+
+def test_cache_must_be_private(tmp_path: Path, db: Path) -> None:
+    calls: list[int] = []
+
+    @memo.cached
+    def double(value: int) -> int:
+        calls.append(value)
+        return value * 2
+
+    assert double(2) == 4 and double(2) == 4
+    assert len(calls) == 1
+    assert db.stat().st_mode & 0o777 == 0o600
+
+    db.chmod(0o620)
+    assert double(2) == 4 and double(2) == 4
+    assert len(calls) == 3
+    assert double.cache_lookup(2) is None  # type: ignore[attr-defined]
+
+    db.chmod(0o600)
+    tmp_path.chmod(0o750)
+    assert double.cache_lookup(2) is None  # type: ignore[attr-defined]
+    tmp_path.chmod(0o700)
+    assert double.cache_lookup(2) == (4,)  # type: ignore[attr-defined]
+
+
+def test_ttl_key_and_unpicklable_values(db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Any] = []
+
+    @memo.cached(ttl=0.05, key=lambda request, verbose=False: request["id"])
+    def lookup(request: dict[str, Any], verbose: bool = False) -> int:
+        calls.append(request)
+        return len(calls)
+
+    assert lookup({"id": 1, "noise": 1}) == lookup({"id": 1, "noise": 2}) == 1
+    time.sleep(0.06)
+    assert lookup({"id": 1}) == 2
+
+    @memo.cached
+    def handle() -> Any:
+        calls.append(None)
+        return lambda: None
+
+    handle()
+    handle()
+    assert calls[-2:] == [None, None]
+
+
+def test_least_recently_used_entries_are_evicted(db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(memo, "TOUCH_INTERVAL", 0.0)
+    calls: list[int] = []
+
+    @memo.cached(max_bytes=3000)
+    def blob(n: int) -> bytes:
+        calls.append(n)
+        return bytes(1000)
+
+    for n in (1, 2, 1, 3, 1, 2):
+        blob(n)
+        time.sleep(0.001)
+    # 1 stays hot; 2 is evicted by 3 and recomputed.
+    assert calls == [1, 2, 3, 2]
+
+
+def test_hits_cost_microseconds(db: Path) -> None:
+    @memo.cached(invalidate_on=[__file__])
+    def branch() -> str:
+        return "main"
+
+    branch()
+    start = time.perf_counter()
+    for _ in range(1000):
+        branch()
+    assert (time.perf_counter() - start) / 1000 < 0.0005
@@ -0,0 +1,59 @@
+import pytest
+
+from cc_hooks.merge import merge_outputs
+from cc_hooks.models import PermissionRequestOutput, PostToolUseOutput, PreToolUseOutput, StopOutput
+
+
+def test_pre_tool_use_decisions_merge_by_precedence() -> None:
+    merged = merge_outputs(
+        [
+            PreToolUseOutput.allow(),
+            PreToolUseOutput.ask("network access"),
+            PreToolUseOutput.modify({"command": "ls"}, "rewritten"),
+            PreToolUseOutput.deny("secret in command"),
+            PreToolUseOutput.add_context("cost: 3 calls"),
+            PreToolUseOutput.deny("path outside repo"),
+            PreToolUseOutput.modify({"command": "ls -la"}),
+        ]
+    )
+
+    assert isinstance(merged, PreToolUseOutput)
+    specific = merged.hook_specific_output
+    assert specific is not None
+    assert specific.permission_decision == "deny"
+    assert specific.permission_decision_reason == "secret in command\npath outside repo"
+    assert specific.updated_input == {"command": "ls"}
+    assert specific.additional_context == "cost: 3 calls"
+
+
+def test_permission_request_and_base_fields_merge() -> None:
+    allow = PermissionRequestOutput.allow("fine")
+    allow.system_message = "first"
+    ask = PermissionRequestOutput.ask("check with user")
+    ask.system_message = "second"
+    stop = PermissionRequestOutput.stop_session("quota exceeded")
+
+    merged = merge_outputs([allow, ask, stop])
+
+    assert merged.model_dump(by_alias=True, exclude_none=True) == {
+        "continue": False,
+        "stopReason": "quota exceeded",
+        "systemMessage": "first\nsecond",
+        "hookSpecificOutput": {
+            "hookEventName": "PermissionRequest",
+            "decision": {"behavior": "ask", "message": "check with user"},
+        },
+    }
+
+
+def test_block_decisions_and_extra_fields() -> None:
+    merged = merge_outputs([StopOutput.ok(), StopOutput.block("tests fail"), StopOutput(note="a", other=1)])
+    assert merged.model_dump(by_alias=True, exclude_none=True) == {
+        "decision": "block",
+        "reason": "tests fail",
+        "note": "a",
+        "other": 1,
+    }
+
+    with pytest.raises(TypeError, match="different output types"):
+        merge_outputs([StopOutput.ok(), PostToolUseOutput.add_context("x")])
@@ -1,3 +1,6 @@
+import pytest
+
+from cc_hooks import registry
 from cc_hooks.enums import PermissionDecision
 from cc_hooks.models import PreToolUseInput, PreToolUseOutput
 
@@ -16,6 +19,34 @@ def test_pre_tool_use_input_and_bash_helper(base_payload: dict[str, str]) -> Non
     assert bash.command == "echo hello"
 
 
+def test_tool_input_views_are_memoized(base_payload: dict[str, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[dict[str, object]] = []
+    compile_adapter = registry.compile_tool_input_adapter
+
+    def counting_compile(model: type) -> object:
+        adapter = compile_adapter(model)
+        return lambda data: calls.append(data) or adapter(data)
+
+    monkeypatch.setattr("cc_hooks.models._tool_mixin.compile_tool_input_adapter", counting_compile)
+    data = PreToolUseInput(**base_payload, tool_name="Bash", tool_input={"timeout": "x"}, tool_use_id="t1")
+
+    assert data.as_bash_input() is None
+    assert data.as_bash_input() is None
+    assert len(calls) == 1
+
+    data.tool_input = {"command": "ls"}
+    bash = data.as_bash_input()
+    assert bash is not None and bash.command == "ls"
+    assert data.as_bash_input() is bash
+    assert data.as_registered_tool_input() is data.as_registered_tool_input()
+    assert data.model_dump(by_alias=True)["toolInput"] == {"command": "ls"}
+
+    data.tool_input["command"] = "pwd"
+    bash = data.as_bash_input()
+    assert bash is not None and bash.command == "pwd"
+    assert data.as_bash_input() is bash
+
+
 def test_pre_tool_use_allow_output() -> None:
     output = PreToolUseOutput.allow()
     dumped = output.model_dump(by_alias=True, exclude_none=True)
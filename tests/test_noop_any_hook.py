@@ -84,3 +84,9 @@ def test_noop_any_hook_accepts_remaining_supported_events() -> None:
         result = _run(payload)
         assert result.returncode == 0, result.stderr
         assert result.stdout == ""
+
+
+def test_noop_any_hook_rejects_unsupported_events() -> None:
+    result = _run({"session_id": "noop_0", "hook_event_name": "NotAnEvent"})
+    assert result.returncode == 1
+    assert "Unsupported hook event: 'NotAnEvent'" in result.stderr
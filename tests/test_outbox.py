@@ -0,0 +1,147 @@
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import outbox
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class StandIn(ThreadingHTTPServer):
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.received: list[tuple[str, Any]] = []
+        self.connections: set[int] = set()
+        self.failures = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandIn
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.server.failures:
+            self.server.failures -= 1
+            status = 503
+        else:
+            self.server.received.append((self.path, body))
+            self.server.connections.add(self.client_address[1])
+            status = 204
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[StandIn]:
+    server = StandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _spool(tmp_path: Path, server: StandIn, messages: int, **options: Any) -> Path:
+    spool = tmp_path / "outbox"
+    spool.mkdir()
+    # A held lock stands in for a running flusher, so send() does not spawn one.
+    (spool / "flusher.lock").touch()
+    with open(spool / "flusher.lock") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        for i in range(messages):
+            outbox.send(f"{server.url}/hook?n={i % 2}", {"i": i}, spool_dir=spool, **options)
+    return spool
+
+
+def test_flusher_reuses_connections_and_batches(tmp_path: Path, server: StandIn) -> None:
+    spool = _spool(tmp_path, server, 4)
+    outbox.send(f"{server.url}/batch", {"i": 10}, batch=True, spool_dir=spool)
+    outbox.send(f"{server.url}/batch", {"i": 11}, batch=True, spool_dir=spool)
+    assert outbox.outbox_stats(spool).depth == 6
+
+    assert outbox.Flusher(spool).flush() == 6
+
+    assert server.received == [
+        ("/hook?n=0", {"i": 0}),
+        ("/hook?n=1", {"i": 1}),
+        ("/hook?n=0", {"i": 2}),
+        ("/hook?n=1", {"i": 3}),
+        ("/batch", [{"i": 10}, {"i": 11}]),
+    ]
+    assert len(server.connections) == 1
+    stats = outbox.outbox_stats(spool)
+    assert (stats.depth, stats.delivered, stats.failed) == (0, 6, 0)
+    assert stats.latency_p50 is not None and stats.latency_p50 >= 0
+
+
+def test_failures_back_off_and_give_up(tmp_path: Path, server: StandIn) -> None:
+    spool = _spool(tmp_path, server, 2)
+    server.failures = 2
+    flusher = outbox.Flusher(spool, backoff=0.05, max_attempts=3)
+
+    assert flusher.flush() == 0
+    assert flusher.flush() == 0, "origin is backing off"
+    time.sleep(0.2)
+    assert flusher.flush() == 0
+    time.sleep(0.2)
+    assert flusher.flush() == 2
+    assert [body for _, body in server.received] == [{"i": 0}, {"i": 1}]
+
+    server.failures = 10
+    outbox.send(f"{server.url}/hook", {"i": 2}, spool_dir=spool)
+    for _ in range(3):
+        flusher.flush()
+        time.sleep(0.25)
+    stats = outbox.outbox_stats(spool)
+    assert (stats.depth, stats.failed, stats.delivered) == (0, 1, 2)
+
+
+def test_send_starts_a_flusher_that_exits_when_idle(tmp_path: Path, server: StandIn) -> None:
+    spool = tmp_path / "outbox"
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "CC_HOOKS_OUTBOX_IDLE_TIMEOUT": "0.5"}
+    code = f"from cc_hooks import outbox; outbox.send({server.url + '/x'!r}, {{'ok': True}}, spool_dir={str(spool)!r})"
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline and (not server.received or outbox.outbox_stats(spool).flusher_running):
+        time.sleep(0.05)
+    assert server.received == [("/x", {"ok": True})]
+    assert not outbox.outbox_stats(spool).flusher_running
+    assert {path.stat().st_mode & 0o777 for path in (spool, spool / "new", spool / "tmp")} == {0o700}
+
+
+def test_spool_is_private_to_its_owner(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    spool = tmp_path / "outbox"
+    spool.mkdir()
+    spool.chmod(0o755)
+    (spool / "flusher.lock").touch()
+    with open(spool / "flusher.lock") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        path = outbox.send("https://hooks.example.com/x", {"ok": True}, headers={"Authorization": "t"}, spool_dir=spool)
+    assert spool.stat().st_mode & 0o777 == 0o700
+    assert path.stat().st_mode & 0o777 == 0o600
+
+    monkeypatch.setattr(os, "getuid", lambda: spool.stat().st_uid + 1)
+    with pytest.raises(PermissionError, match="owned by another user"):
+        outbox.send("https://hooks.example.com/x", {"ok": True}, spool_dir=spool)
+    with pytest.raises(PermissionError):
+        outbox.Flusher(spool).serve()
@@ -0,0 +1,108 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import background, ratelimit, runner
+from cc_hooks.models import NotificationInput
+from cc_hooks.runner import hook
+
+ROOT = Path(__file__).resolve().parent.parent
+
+COALESCE = """\
+import json, os, sys, time
+from cc_hooks import ratelimit
+
+def deliver(window):
+    with open(sys.argv[2], "a") as f:
+        f.write(json.dumps({"items": window.items, "count": window.count}) + "\\n")
+
+# Start together once every process is up, so interpreter start-up cannot outlast the window.
+open(os.path.join(sys.argv[3], f"ready-{sys.argv[1]}"), "w").close()
+while not os.path.exists(os.path.join(sys.argv[3], "go")):
+    time.sleep(0.005)
+ratelimit.coalesce("s1", "notify", int(sys.argv[1]), deliver, window=1.0, max_items=5, state_dir=sys.argv[3])
+"""
+
+
+def test_token_bucket_is_shared_across_processes(tmp_path: Path) -> None:
+    children = []
+    for _ in range(8):
+        pid = os.fork()
+        if pid == 0:
+            allowed = sum(ratelimit.allow("s1", "notify", rate=0.001, burst=5, state_dir=tmp_path) for _ in range(3))
+            os._exit(allowed)
+        children.append(pid)
+    assert sum(os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) for pid in children) == 5
+    assert ratelimit.allow("s2", "notify", rate=0.001, burst=5, state_dir=tmp_path)
+    assert not ratelimit.allow("s1", "notify", rate=0.001, burst=5, state_dir=tmp_path)
+    time.sleep(0.01)
+    assert ratelimit.allow("s1", "notify", rate=1000, burst=5, state_dir=tmp_path)
+
+
+def test_concurrent_events_are_delivered_once_per_window(tmp_path: Path) -> None:
+    script = tmp_path / "coalesce.py"
+    script.write_text(COALESCE, encoding="utf-8")
+    out = tmp_path / "delivered.jsonl"
+    state_dir = tmp_path / "state"
+    state_dir.mkdir()
+    env = {**os.environ, "PYTHONPATH": str(ROOT / "src")}
+    processes = [
+        subprocess.Popen([sys.executable, str(script), str(i), str(out), str(state_dir)], env=env) for i in range(8)
+    ]
+    deadline = time.monotonic() + 30
+    while len(list(state_dir.glob("ready-*"))) < 8 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    (state_dir / "go").touch()
+    assert [process.wait(timeout=30) for process in processes] == [0] * 8
+
+    (window,) = [json.loads(line) for line in out.read_text().splitlines()]
+    assert window["count"] == 8
+    assert len(window["items"]) == 5
+
+
+def test_coalesce_in_a_handler_delivers_after_the_response(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, base_payload: dict[str, str]
+) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    monkeypatch.setattr(ratelimit, "TAKEOVER_AFTER", 0.0)
+    delivered: list[ratelimit.Window] = []
+
+    def deliver(window: ratelimit.Window) -> None:
+        if window.items == ["lost"]:
+            raise OSError("webhook down")
+        delivered.append(window)
+
+    @hook("Notification")
+    def notify(input: NotificationInput) -> None:
+        ratelimit.coalesce(input, "notify", input.message, deliver, window=0.0, state_dir=tmp_path)
+
+    payload = {
+        **base_payload,
+        "hook_event_name": "Notification",
+        "message": "waiting",
+        "notification_type": "idle_prompt",
+    }
+    assert runner._dispatch(json.dumps(payload).encode()) == (0, b"", "")
+    tasks: list[Any] = background.take_tasks()
+    assert len(tasks) == 1 and not delivered
+
+    # The closer of the first window never ran (killed): the next event closes it.
+    runner._dispatch(json.dumps({**payload, "message": "again"}).encode())
+    for task in background.take_tasks():
+        task()
+    assert [(window.items, window.count) for window in delivered] == [(["waiting"], 1), (["again"], 1)]
+
+    # A failed delivery of an abandoned window still closes the new one.
+    runner._dispatch(json.dumps({**payload, "message": "lost"}).encode())
+    background.take_tasks()
+    runner._dispatch(json.dumps({**payload, "message": "last"}).encode())
+    (task,) = background.take_tasks()
+    with pytest.raises(OSError, match="webhook down"):
+        task()
+    assert delivered[-1].items == ["last"]
@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 
-from cc_hooks.registry import get_tool_input_model, register_tool_input
+from cc_hooks.registry import get_tool_input_adapter, get_tool_input_model, register_tool_input
 
 
 class CustomInput(BaseModel):
@@ -16,3 +16,22 @@ def test_register_custom_tool() -> None:
     register_tool_input("mcp__custom__tool", CustomInput)
     model = get_tool_input_model("mcp__custom__tool")
     assert model is CustomInput
+
+
+class CustomInputV2(BaseModel):
+    value: int
+
+
+def test_tool_input_adapter_validates_and_follows_registration() -> None:
+    register_tool_input("mcp__custom__adapter", CustomInput)
+    adapter = get_tool_input_adapter("mcp__custom__adapter")
+    assert adapter is not None
+    assert adapter({"value": "x"}) == CustomInput(value="x")
+    assert adapter({}) is None
+    assert get_tool_input_adapter("mcp__custom__adapter") is adapter
+
+    register_tool_input("mcp__custom__adapter", CustomInputV2)
+    replaced = get_tool_input_adapter("mcp__custom__adapter")
+    assert replaced is not None
+    assert replaced({"value": "3"}) == CustomInputV2(value=3)
+    assert get_tool_input_adapter("mcp__unknown") is None
@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import background, memo, rollup
+
+
+@pytest.fixture(autouse=True)
+def _cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(memo.ENV_DB, str(tmp_path / "memo.sqlite3"))
+
+
+def _transcript(path: Path, tool: str, file: str, error: str | None = None) -> Path:
+    tool_use = {"type": "tool_use", "id": "t1", "name": tool, "input": {"file_path": file}}
+    result = {"type": "tool_result", "tool_use_id": "t1", "content": error or "ok", "is_error": error is not None}
+    usage = {"output_tokens": 7}
+    # One record per content block, each repeating the message's usage.
+    text = {"type": "text", "text": "on it"}
+    records = [
+        {"type": "assistant", "message": {"id": "msg_1", "content": [text], "usage": usage}},
+        {"type": "assistant", "message": {"id": "msg_1", "content": [tool_use], "usage": usage}},
+        {"type": "user", "message": {"content": [result]}},
+    ]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records) + '{"type": "assis')
+    return path
+
+
+def test_summaries_merge_and_are_cached_per_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    paths = [
+        _transcript(tmp_path / "a.jsonl", "Edit", "x.py"),
+        _transcript(tmp_path / "b.jsonl", "Write", "y.py", error="Permission denied\nmore"),
+        _transcript(tmp_path / "c.jsonl", "Edit", "x.py"),
+        _transcript(tmp_path / "d.jsonl", "Read", "z.py"),
+    ]
+    monkeypatch.setattr(rollup, "PARALLEL_MIN_BYTES", 0)
+    summary = rollup.summarize_transcripts(paths, workers=2)
+    assert summary == rollup.TranscriptSummary(
+        transcripts=4,
+        records=12,
+        tools={"Edit": 2, "Write": 1, "Read": 1},
+        files_changed=["x.py", "y.py"],
+        errors=["Permission denied"],
+        output_tokens=28,
+    )
+
+    # Workers stored every partial result; a second rollup only reads the cache.
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(rollup.Transcript, "since", None)
+        assert rollup.summarize_transcripts(paths) == summary
+
+    _transcript(paths[3], "Bash", "")
+    assert rollup.summarize_transcripts(paths).tools == {"Edit": 2, "Write": 1, "Bash": 1}
+
+
+def test_subagent_stop_records_transcripts(tmp_path: Path, dispatch: Any) -> None:
+    rollup.enable_subagent_rollup()
+    agents = [_transcript(tmp_path / f"agent-{n}.jsonl", "Edit", f"{n}.py") for n in range(3)]
+    for n, path in [*enumerate(agents), (0, agents[0])]:
+        fields = {"agent_id": f"agent-{n}", "agent_type": "general-purpose", "agent_transcript_path": str(path)}
+        assert dispatch("SubagentStop", stop_hook_active=False, **fields) == (0, None, "")
+        for task in background.take_tasks():
+            task()
+
+    assert rollup.subagent_transcripts("sess_123") == [str(path) for path in agents]
+    assert all(rollup.summarize_transcript.cache_lookup(path) for path in agents)  # type: ignore[attr-defined]
+    summary = rollup.subagent_summary("sess_123")
+    assert summary.files_changed == ["0.py", "1.py", "2.py"]
+    assert summary.tools == {"Edit": 3}
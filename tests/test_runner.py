@@ -1,11 +1,17 @@
+import asyncio
 import io
 import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from cc_hooks.models import NotificationOutput, SessionEndOutput, SessionStartOutput
-from cc_hooks.runner import _execute
+from cc_hooks import runner
+from cc_hooks.models import NotificationOutput, PreToolUseOutput, SessionEndOutput, SessionStartOutput
+from cc_hooks.runner import _execute, hook, run
 
 
 def _set_stdio(monkeypatch: pytest.MonkeyPatch, payload: dict[str, Any]) -> tuple[io.StringIO, io.StringIO]:
@@ -105,3 +111,230 @@ def test_execute_error_returns_exit_2(monkeypatch: pytest.MonkeyPatch) -> None:
     assert "RuntimeError" in stderr.getvalue()
     assert "event=Notification" in stderr.getvalue()
     assert "handler=handler" in stderr.getvalue()
+
+
+def _pre_tool_use_payload(tool_name: str, tool_input: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "session_id": "s5",
+        "transcript_path": "/tmp/t.jsonl",
+        "cwd": "/tmp",
+        "permission_mode": "default",
+        "hook_event_name": "PreToolUse",
+        "tool_name": tool_name,
+        "tool_input": tool_input,
+        "tool_use_id": "toolu_5",
+    }
+
+
+def test_run_routes_on_event_and_tool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    @hook("PreToolUse", tool="Bash")
+    def bash_only(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.deny("bash")
+
+    @hook("PreToolUse")
+    def any_tool(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.ask("fallback")
+
+    for tool_name, expected in (("Bash", "deny"), ("Read", "ask")):
+        stdout, _ = _set_stdio(monkeypatch, _pre_tool_use_payload(tool_name, {"command": "ls"}))
+        with pytest.raises(SystemExit) as exc:
+            run()
+        assert exc.value.code == 0
+        assert json.loads(stdout.getvalue())["hookSpecificOutput"]["permissionDecision"] == expected
+
+
+def test_generic_handlers_run_alongside_tool_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    @hook("PreToolUse")
+    def secrets(input: Any) -> PreToolUseOutput | None:
+        return PreToolUseOutput.deny("secret") if "AKIA" in str(input.tool_input) else None
+
+    @hook("PreToolUse", tool="Bash")
+    def bash(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.allow()
+
+    assert runner._handlers_for("PreToolUse", "Bash") == [secrets, bash]
+    for command, expected in (("echo AKIAXXXX", "deny"), ("ls", "allow")):
+        stdout, _ = _set_stdio(monkeypatch, _pre_tool_use_payload("Bash", {"command": command}))
+        with pytest.raises(SystemExit) as exc:
+            run()
+        assert exc.value.code == 0
+        assert json.loads(stdout.getvalue())["hookSpecificOutput"]["permissionDecision"] == expected
+
+
+def test_run_without_matching_handler_is_silent(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    @hook("PreToolUse", tool="Bash")
+    def bash_only(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.deny("bash")
+
+    stdout, stderr = _set_stdio(monkeypatch, _pre_tool_use_payload("Read", {"file_path": "/tmp/a"}))
+    with pytest.raises(SystemExit) as exc:
+        run()
+
+    assert exc.value.code == 0
+    assert stdout.getvalue() == stderr.getvalue() == ""
+
+
+def test_execute_with_tool_filter_skips_other_tools(monkeypatch: pytest.MonkeyPatch) -> None:
+    def handler(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.deny("bash")
+
+    stdout, _ = _set_stdio(monkeypatch, _pre_tool_use_payload("Read", {"file_path": "/tmp/a"}))
+    with pytest.raises(SystemExit) as exc:
+        _execute(handler, "PreToolUse", tool="Bash")
+
+    assert exc.value.code == 0
+    assert stdout.getvalue() == ""
+
+
+def test_multi_event_script_dispatches_every_event() -> None:
+    script = Path(__file__).resolve().parent.parent / "examples" / "multi_event_dispatch.py"
+    cases = [
+        (_pre_tool_use_payload("Bash", {"command": "rm -rf /"}), "deny"),
+        (_pre_tool_use_payload("Write", {"file_path": "/repo/.env", "content": "x"}), "deny"),
+        (_pre_tool_use_payload("Read", {"file_path": "/repo/a.txt"}), None),
+    ]
+    for payload, decision in cases:
+        result = subprocess.run(
+            [sys.executable, str(script)], input=json.dumps(payload), capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+        if decision is None:
+            assert result.stdout == ""
+        else:
+            assert json.loads(result.stdout)["hookSpecificOutput"]["permissionDecision"] == decision
+
+    stop = {
+        **_pre_tool_use_payload("", {}),
+        "hook_event_name": "Stop",
+        "stop_hook_active": True,
+        "last_assistant_message": "TODO",
+    }
+    result = subprocess.run(
+        [sys.executable, str(script)], input=json.dumps(stop), capture_output=True, text=True, check=False
+    )
+    assert json.loads(result.stdout)["decision"] == "block"
+
+
+def test_main_script_handlers_defer_to_run_explicitly(tmp_path: Path) -> None:
+    payload = json.dumps(_pre_tool_use_payload("Bash", {"command": "ls"}))
+    scripts = {
+        # Executes on decoration: subprocess.run is not cc_hooks.run.
+        "legacy": "import subprocess\nimport cc_hooks\nfrom cc_hooks import hook\n{hooks}\nsubprocess.run(['true'])\n",
+        "imported": "from cc_hooks import hook, run\n{hooks}\nrun()\n",
+        "module": "import cc_hooks\nfrom cc_hooks import hook\n{hooks}\ncc_hooks.run()\n",
+    }
+    hooks = (
+        "@hook('PreToolUse'{defer})\ndef first(_):\n    return cc_hooks.PreToolUseOutput.ask('first')\n"
+        "@hook('PreToolUse'{defer})\ndef second(_):\n    return cc_hooks.PreToolUseOutput.deny('second')\n"
+    )
+    cases = [("legacy", "", "ask"), ("imported", "", "deny"), ("module", ", defer=True", "deny")]
+    for name, defer, decision in cases:
+        script = tmp_path / f"{name}.py"
+        script.write_text("import cc_hooks\n" + scripts[name].format(hooks=hooks.format(defer=defer)))
+        result = subprocess.run(
+            [sys.executable, str(script)], input=payload, capture_output=True, text=True, check=False
+        )
+        assert result.returncode == 0, result.stderr
+        assert json.loads(result.stdout)["hookSpecificOutput"]["permissionDecision"] == decision, name
+
+
+def test_execute_uses_binary_stdio(monkeypatch: pytest.MonkeyPatch) -> None:
+    payload = _pre_tool_use_payload("Write", {"file_path": "/tmp/ü.txt", "content": "é" * 100_000})
+    stdout = io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+    monkeypatch.setattr("sys.stdin", io.TextIOWrapper(io.BytesIO(json.dumps(payload).encode()), encoding="utf-8"))
+    monkeypatch.setattr("sys.stdout", stdout)
+
+    def handler(input: Any) -> PreToolUseOutput:
+        print("log line", end="")
+        return PreToolUseOutput.deny(f"no {input.tool_input['file_path']}")
+
+    with pytest.raises(SystemExit) as exc:
+        _execute(handler, "PreToolUse")
+
+    assert exc.value.code == 0
+    written = stdout.buffer.getvalue()  # type: ignore[attr-defined]
+    assert written.startswith(b"log line")
+    assert json.loads(written[len(b"log line") :])["hookSpecificOutput"]["permissionDecisionReason"] == "no /tmp/ü.txt"
+
+
+def test_outputs_encode_by_alias_without_none() -> None:
+    assert json.loads(runner._to_json(PreToolUseOutput.allow())) == PreToolUseOutput.allow().model_dump(
+        by_alias=True, exclude_none=True
+    )
+
+    changed = PreToolUseOutput.allow()
+    changed.system_message = "note"
+    assert json.loads(runner._to_json(changed))["systemMessage"] == "note"
+    assert json.loads(runner._to_json(PreToolUseOutput.deny("no"))) == {
+        "hookSpecificOutput": {
+            "hookEventName": "PreToolUse",
+            "permissionDecision": "deny",
+            "permissionDecisionReason": "no",
+        }
+    }
+
+
+def test_run_merges_concurrent_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    started = threading.Barrier(3, timeout=5)
+
+    @hook("PreToolUse")
+    def secrets(_: Any) -> PreToolUseOutput:
+        started.wait()
+        return PreToolUseOutput.deny("secret in command")
+
+    @hook("PreToolUse")
+    def paths(_: Any) -> None:
+        started.wait()
+
+    @hook("PreToolUse")
+    async def network(_: Any) -> PreToolUseOutput:
+        await asyncio.sleep(0)
+        return PreToolUseOutput.ask("network access")
+
+    @hook("PreToolUse")
+    def cost(_: Any) -> PreToolUseOutput:
+        started.wait()
+        return PreToolUseOutput.add_context("3 calls")
+
+    stdout, _ = _set_stdio(monkeypatch, _pre_tool_use_payload("Bash", {"command": "curl"}))
+    with pytest.raises(SystemExit) as exc:
+        run()
+
+    assert exc.value.code == 0
+    assert json.loads(stdout.getvalue())["hookSpecificOutput"] == {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "deny",
+        "permissionDecisionReason": "secret in command",
+        "additionalContext": "3 calls",
+    }
+
+
+def test_run_reports_first_failing_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    @hook("PreToolUse")
+    def fine(_: Any) -> PreToolUseOutput:
+        return PreToolUseOutput.allow()
+
+    @hook("PreToolUse")
+    def broken(_: Any) -> PreToolUseOutput:
+        raise RuntimeError("boom")
+
+    # Registering the same function again (a reloaded module) does not add a second copy.
+    hook("PreToolUse")(fine)
+    assert len(runner._HANDLERS[("PreToolUse", None)]) == 2
+
+    stdout, stderr = _set_stdio(monkeypatch, _pre_tool_use_payload("Bash", {"command": "ls"}))
+    with pytest.raises(SystemExit) as exc:
+        run()
+
+    assert exc.value.code == 2
+    assert stdout.getvalue() == ""
+    assert stderr.getvalue() == "RuntimeError in event=PreToolUse handler=broken: boom"
@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import SchemaValidator
+
+from cc_hooks import schema_cache
+from cc_hooks.models import PreToolUseInput
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Any:
+    path = schema_cache.enable_schema_cache(tmp_path / "schemas")
+    yield path
+    schema_cache.disable_schema_cache()
+
+
+def _make_model(**fields: Any) -> type[BaseModel]:
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__qualname__": "CachedToolInput",
+        "model_config": ConfigDict(extra="allow", populate_by_name=True, defer_build=True),
+        "__annotations__": {name: annotation for name, (annotation, _) in fields.items()},
+        **{name: default for name, (_, default) in fields.items()},
+    }
+    model = type("CachedToolInput", (BaseModel,), namespace)
+    # Cached schemas reference the model by import path, like a module-level class.
+    globals()["CachedToolInput"] = model
+    return model
+
+
+def test_prepare_model_writes_and_rehydrates_schema(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = _make_model(channel=(str, Field(alias="channelName")))
+    schema_cache.prepare_model(first)
+    assert len(list(cache_dir.glob(f"{__name__}.CachedToolInput-*.pickle"))) == 1
+
+    second = _make_model(channel=(str, Field(alias="channelName")))
+    monkeypatch.setattr(second, "model_rebuild", classmethod(lambda cls, **_: pytest.fail("rebuilt")))
+    schema_cache.prepare_model(second)
+
+    parsed = second(channelName="#general", extra_field=1)
+    assert parsed.channel == "#general"  # type: ignore[attr-defined]
+    assert parsed.model_dump(by_alias=True) == {"channelName": "#general", "extra_field": 1}
+
+
+def test_changed_model_definition_invalidates_entry(cache_dir: Path) -> None:
+    schema_cache.prepare_model(_make_model(channel=(str, Field(alias="channelName"))))
+    changed = _make_model(channel=(int, Field(alias="channelName")))
+    schema_cache.prepare_model(changed)
+
+    entries = list(cache_dir.glob(f"{__name__}.CachedToolInput-*.pickle"))
+    assert len(entries) == 1
+    assert changed(channelName="7").channel == 7  # type: ignore[attr-defined]
+
+
+def test_corrupt_entry_falls_back_to_build(cache_dir: Path) -> None:
+    schema_cache.prepare_model(_make_model(value=(str, ...)))
+    for entry in cache_dir.glob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+
+    model = _make_model(value=(str, ...))
+    schema_cache.prepare_model(model)
+    assert model(value="ok").value == "ok"  # type: ignore[attr-defined]
+
+
+def test_cache_shared_with_other_users_is_skipped(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    schema_cache.prepare_model(_make_model(value=(str, ...)))
+    cache_dir.chmod(0o777)
+    monkeypatch.setattr(schema_cache, "_store", lambda *_: None)
+    model = _make_model(value=(str, ...))
+    schema_cache.prepare_model(model)
+    assert not isinstance(model.__pydantic_validator__, SchemaValidator)
+
+    cache_dir.chmod(0o700)
+    monkeypatch.setattr(os, "getuid", lambda: os.geteuid() + 1)
+    model = _make_model(value=(str, ...))
+    schema_cache.prepare_model(model)
+    assert not isinstance(model.__pydantic_validator__, SchemaValidator)
+
+
+def test_tool_helper_prepares_tool_model(
+    cache_dir: Path, base_payload: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prepared: list[type[BaseModel]] = []
+    monkeypatch.setattr("cc_hooks.registry.prepare_model", prepared.append)
+    monkeypatch.setattr("cc_hooks.registry._compiled", {})
+
+    data = PreToolUseInput(**base_payload, tool_name="Bash", tool_input={"command": "ls"}, tool_use_id="t1")
+    bash = data.as_bash_input()
+
+    assert bash is not None
+    assert prepared == [type(bash)]
+
+
+def test_cache_disabled_by_default_is_noop() -> None:
+    assert schema_cache.schema_cache_dir() is None
+    schema_cache.prepare_model(_make_model(value=(str, ...)))
+    assert schema_cache.clear_schema_cache() == 0
@@ -0,0 +1,137 @@
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import runner
+from cc_hooks.models import StopInput, StopOutput
+from cc_hooks.runner import _dispatch, hook
+
+ROOT = Path(__file__).resolve().parent.parent
+DENY_BASH_RM = ROOT / "examples" / "deny_bash_rm.py"
+
+PAYLOAD = {
+    "session_id": "daemon_1",
+    "transcript_path": "/tmp/t.jsonl",
+    "cwd": "/tmp",
+    "permission_mode": "default",
+    "hook_event_name": "PreToolUse",
+    "tool_name": "Bash",
+    "tool_input": {"command": "rm -rf /tmp/demo"},
+    "tool_use_id": "toolu_daemon",
+}
+
+
+def _env(tmp_path: Path, **extra: str) -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": str(ROOT / "src"),
+        "CC_HOOKS_SOCKET_DIR": str(tmp_path / "sockets"),
+        "CC_HOOKS_DAEMON_IDLE_TIMEOUT": "3",
+        **extra,
+    }
+
+
+def _client(env: dict[str, str], *handlers: Path, payload: dict[str, Any] = PAYLOAD) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-m", "cc_hooks.client", *map(str, handlers)],
+        input=json.dumps(payload),
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+        check=False,
+    )
+
+
+def test_dispatch_routes_on_hook_event_name(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+
+    @hook("Stop")
+    def handle(input: StopInput) -> StopOutput:
+        return StopOutput.block(f"stop {input.session_id}")
+
+    payload = {**PAYLOAD, "hook_event_name": "Stop", "stop_hook_active": True}
+    code, stdout, stderr = _dispatch(json.dumps(payload))
+
+    assert code == 0
+    assert json.loads(stdout) == {"decision": "block", "reason": "stop daemon_1"}
+    assert stderr == ""
+
+
+def test_dispatch_without_handler_is_noop(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    code, stdout, _ = _dispatch(json.dumps(PAYLOAD))
+    assert (code, stdout) == (0, b"")
+
+
+def test_serve_builds_models_before_forking(tmp_path: Path) -> None:
+    probe = """\
+import sys
+from cc_hooks import server
+from cc_hooks.models import PreToolUseInput, PreToolUseOutput
+from cc_hooks.models.pre_tool_use import PreToolUseHookSpecific
+from cc_hooks.tools import BashInput, WriteInput
+
+def fake_server(path):
+    models = (PreToolUseInput, PreToolUseOutput, PreToolUseHookSpecific, BashInput, WriteInput)
+    print(all(model.__pydantic_complete__ for model in models))
+    raise SystemExit(0)
+
+print(PreToolUseInput.__pydantic_complete__)
+server.HookServer = fake_server
+server.serve([sys.argv[1]], sys.argv[2])
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", probe, str(DENY_BASH_RM), str(tmp_path / "hooks.sock")],
+        capture_output=True,
+        text=True,
+        env=_env(tmp_path),
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_client_matches_direct_script_output(tmp_path: Path) -> None:
+    direct = subprocess.run(
+        [sys.executable, str(DENY_BASH_RM)],
+        input=json.dumps(PAYLOAD),
+        capture_output=True,
+        text=True,
+        env=_env(tmp_path),
+        check=False,
+    )
+    env = _env(tmp_path)
+
+    first = _client(env, DENY_BASH_RM)
+    deadline = time.monotonic() + 10
+    while not list((tmp_path / "sockets").glob("*.sock")) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    second = _client(env, DENY_BASH_RM)
+
+    assert list((tmp_path / "sockets").glob("*.sock")), "daemon was not spawned"
+    for result in (first, second):
+        assert (result.returncode, result.stdout, result.stderr) == (direct.returncode, direct.stdout, direct.stderr)
+
+
+def test_client_relays_handler_error_exit_code(tmp_path: Path) -> None:
+    script = tmp_path / "failing_hook.py"
+    script.write_text(
+        "from cc_hooks import PreToolUseInput, hook\n\n"
+        "@hook('PreToolUse')\n"
+        "def explode(input: PreToolUseInput) -> None:\n"
+        "    print('partial output')\n"
+        "    raise RuntimeError('boom')\n",
+        encoding="utf-8",
+    )
+
+    result = _client(_env(tmp_path, CC_HOOKS_NO_DAEMON="1"), script)
+
+    assert result.returncode == 2
+    assert result.stdout == "partial output\n"
+    assert "RuntimeError in event=PreToolUse handler=explode: boom" in result.stderr
@@ -0,0 +1,161 @@
+import json
+import os
+import shlex
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import runner
+from cc_hooks.settings import (
+    collect_registrations,
+    default_command,
+    generate_hooks,
+    matcher_for,
+    merge_hooks,
+    spawn_report,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+MULTI = ROOT / "examples" / "multi_event_dispatch.py"
+
+
+def _payload(event: str, tool_name: str | None = None) -> dict[str, Any]:
+    payload: dict[str, Any] = {"hook_event_name": event}
+    if tool_name is not None:
+        payload["tool_name"] = tool_name
+    return payload
+
+
+def test_collect_registrations_reports_only_the_loaded_script() -> None:
+    before = dict(runner._HANDLERS)
+    registrations = collect_registrations(str(MULTI))
+
+    assert registrations == {"PreToolUse": {"Bash", "Write"}, "PostToolUse": {None}, "Stop": {None}}
+    assert set(before) <= set(runner._HANDLERS)
+
+
+def test_default_command_uses_the_current_interpreter() -> None:
+    python = shlex.quote(sys.executable)
+    assert default_command(str(MULTI)) == f"{python} {shlex.quote(str(MULTI))}"
+    assert default_command("hooks.module") == f"{python} -m hooks.module"
+
+
+def test_matcher_for_tool_events() -> None:
+    assert matcher_for("PreToolUse", {"Write", "Bash"}) == "Bash|Write"
+    assert matcher_for("PreToolUse", {"Bash", None}) is None
+    assert matcher_for("PostToolUse", {"mcp__slack.post"}) == r"mcp__slack\.post"
+    assert matcher_for("Stop", {None}) is None
+
+
+def test_generate_hooks_groups_by_event() -> None:
+    hooks = generate_hooks([("cmd-a", {"Stop": {None}, "PreToolUse": {"Bash"}}), ("cmd-b", {"PreToolUse": {None}})])
+
+    assert list(hooks) == ["PreToolUse", "Stop"]
+    assert hooks["PreToolUse"] == [
+        {"matcher": "Bash", "hooks": [{"type": "command", "command": "cmd-a"}]},
+        {"hooks": [{"type": "command", "command": "cmd-b"}]},
+    ]
+    assert hooks["Stop"] == [{"hooks": [{"type": "command", "command": "cmd-a"}]}]
+
+
+def test_merge_hooks_replaces_same_command_and_keeps_others() -> None:
+    existing = {
+        "model": "sonnet",
+        "hooks": {
+            "PreToolUse": [
+                {
+                    "matcher": "*",
+                    "hooks": [{"type": "command", "command": "cmd-a"}, {"type": "command", "command": "x"}],
+                }
+            ],
+            "Stop": [{"hooks": [{"type": "command", "command": "cmd-a"}]}],
+        },
+    }
+    generated = generate_hooks([("cmd-a", {"PreToolUse": {"Bash"}})])
+
+    merged = merge_hooks(existing, generated)
+
+    assert merged["model"] == "sonnet"
+    assert merged["hooks"] == {
+        "PreToolUse": [
+            {"matcher": "*", "hooks": [{"type": "command", "command": "x"}]},
+            {"matcher": "Bash", "hooks": [{"type": "command", "command": "cmd-a"}]},
+        ]
+    }
+
+
+def test_merge_hooks_replaces_commands_for_the_same_script(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "hook.py"
+    existing = {
+        "hooks": {
+            "PreToolUse": [
+                {
+                    "hooks": [
+                        {"type": "command", "command": "python hook.py"},
+                        {"type": "command", "command": "python3 -m my_hooks"},
+                        {"type": "command", "command": "python other.py"},
+                    ]
+                }
+            ],
+        },
+    }
+    generated = generate_hooks(
+        [
+            (default_command(str(script)), {"PreToolUse": {"Bash"}}),
+            (default_command("my_hooks"), {"Stop": {None}}),
+        ]
+    )
+
+    merged = merge_hooks(existing, generated)
+
+    assert merged["hooks"]["PreToolUse"] == [
+        {"hooks": [{"type": "command", "command": "python other.py"}]},
+        {"matcher": "Bash", "hooks": [{"type": "command", "command": default_command(str(script))}]},
+    ]
+    assert merged["hooks"]["Stop"] == [{"hooks": [{"type": "command", "command": default_command("my_hooks")}]}]
+
+
+def test_spawn_report_counts_avoided_spawns() -> None:
+    hooks = generate_hooks([("cmd-a", {"PreToolUse": {"Bash", "Write"}, "Stop": {None}})])
+    payloads = [
+        _payload("PreToolUse", "Bash"),
+        _payload("PreToolUse", "Read"),
+        _payload("PreToolUse", "Read"),
+        _payload("PreToolUse", "WriteFile"),
+        _payload("Stop"),
+        _payload("Notification"),
+    ]
+
+    report = spawn_report(hooks, payloads)
+
+    assert report == {
+        "payloads": 6,
+        "spawns_without_matchers": 5,
+        "spawns_with_matchers": 2,
+        "spawns_avoided": 3,
+        "avoided_by_target": {"PreToolUse:Read": 2, "PreToolUse:WriteFile": 1},
+    }
+
+
+def test_cli_prints_settings_and_report(tmp_path: Path) -> None:
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text("\n".join(json.dumps(p) for p in [_payload("PreToolUse", "Read"), _payload("Stop")]) + "\n")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "cc_hooks.settings", str(MULTI), "--command", "hook-cmd", "--corpus", str(corpus)],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(ROOT / "src")},
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    settings = json.loads(result.stdout)
+    assert settings["hooks"]["PreToolUse"] == [
+        {"matcher": "Bash|Write", "hooks": [{"type": "command", "command": "hook-cmd"}]}
+    ]
+    assert json.loads(result.stderr)["spawns_avoided"] == 1
@@ -0,0 +1,132 @@
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import background, lazy
+from cc_hooks.models import PostToolUseInput
+from cc_hooks.sink import EventSink
+
+
+def _records(*paths: Path) -> list[dict[str, Any]]:
+    lines: list[bytes] = []
+    for path in paths:
+        data = gzip.decompress(path.read_bytes()) if path.suffix == ".gz" else path.read_bytes()
+        lines += data.splitlines()
+    return [json.loads(line) for line in lines]
+
+
+def test_records_carry_input_fields_with_redaction(tmp_path: Path, base_payload: dict[str, str]) -> None:
+    payload = {**base_payload, "hook_event_name": "PostToolUse", "tool_name": "Write", "tool_use_id": "t1"}
+    payload["extra_field"] = 1
+    payload.update(tool_input={"content": "x" * 10_000}, tool_response={"token": "secret"})
+    parsed = PostToolUseInput.model_validate(payload)
+
+    config = lazy.LazyConfig(frozenset({"tool_input"}), 1024, 2**30, 80, None)
+    deferred = lazy.LazyPayload(json.dumps(payload).encode(), config).validate(PostToolUseInput)
+
+    with EventSink(tmp_path / "events.jsonl", redact=("tool_response",), max_field_bytes=1024) as sink:
+        sink.emit(parsed, duration_ms=12)
+        sink.emit(deferred)
+
+    first, second = _records(tmp_path / "events.jsonl")
+    assert first["tool_name"] == "Write" and first["extra_field"] == 1 and first["duration_ms"] == 12
+    assert first["tool_input"] == {"redacted": True, "bytes": 10_014}
+    assert first["tool_response"] == {"redacted": True, "bytes": 18}
+    assert second["tool_input"] == {"redacted": True, "bytes": 10_015}
+    assert lazy.LAZY_ATTR in vars(deferred) and "tool_input" not in deferred.__dict__
+    assert second.keys() - {"duration_ms"} == first.keys() - {"duration_ms"}
+
+
+def test_pretty_printed_lazy_fields_stay_on_one_line(tmp_path: Path, base_payload: dict[str, str]) -> None:
+    payload = {**base_payload, "hook_event_name": "PostToolUse", "tool_name": "Write", "tool_use_id": "t1"}
+    payload.update(tool_input={"content": "a\nb", "lines": [1, 2]}, tool_response={})
+    config = lazy.LazyConfig(frozenset({"tool_input"}), 0, 2**30, 80, None)
+    deferred = lazy.LazyPayload(json.dumps(payload, indent=2).encode(), config).validate(PostToolUseInput)
+
+    with EventSink(tmp_path / "events.jsonl") as sink:
+        sink.emit(deferred)
+
+    (record,) = _records(tmp_path / "events.jsonl")
+    assert record["tool_input"] == {"content": "a\nb", "lines": [1, 2]}
+
+
+def test_batched_records_are_written_on_flush(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = EventSink(path, batch=True)
+    for i in range(3):
+        sink.emit({"i": i})
+    assert not path.exists()
+    sink.close()
+    assert [record["i"] for record in _records(path)] == [0, 1, 2]
+
+
+def test_rotation_keeps_backups_and_compresses(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = EventSink(path, max_bytes=200, backups=2, compress=True)
+    for i in range(30):
+        sink.emit({"i": i})
+    sink.close()
+
+    segments = sorted(tmp_path.glob("events.jsonl.*.gz"))
+    assert len(segments) == 2
+    kept = [record["i"] for record in _records(*segments, path)]
+    assert kept == list(range(kept[0], 30))
+    assert all(segment.stat().st_size < 200 for segment in segments)
+
+
+def test_handler_defers_compression_and_files_are_private(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    background.begin("PostToolUse")
+    with EventSink(path, max_bytes=100, compress=True) as sink:
+        for i in range(10):
+            sink.emit({"i": i})
+
+    assert not list(tmp_path.glob("events.jsonl.*.gz"))
+    for task in background.take_tasks():
+        task()
+    segments = list(tmp_path.glob("events.jsonl.*.gz"))
+    assert segments and not [p for p in tmp_path.glob("events.jsonl.2*") if p.suffix != ".gz"]
+    assert {(p.stat().st_mode & 0o777) for p in [path, *segments]} == {0o600}
+
+
+def test_age_based_rotation(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    sink = EventSink(path, max_bytes=None, max_age=60)
+    sink.emit({"i": 0})
+    sink.emit({"i": 1})
+    lock = tmp_path / "events.jsonl.lock"
+    os.utime(lock, (lock.stat().st_mtime - 120,) * 2)
+    sink.emit({"i": 2})
+    sink.close()
+    assert [record["i"] for record in _records(path)] == [2]
+    assert [record["i"] for record in _records(*tmp_path.glob("events.jsonl.2*"))] == [0, 1]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+def test_concurrent_writers_never_interleave(tmp_path: Path) -> None:
+    path = tmp_path / "events.jsonl"
+    children = []
+    for writer in range(6):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                sink = EventSink(path, max_bytes=64 * 1024, backups=100, batch=writer % 2 == 0)
+                for i in range(400):
+                    sink.emit({"writer": writer, "i": i, "pad": "x" * (writer * 50)})
+                sink.close()
+            finally:
+                os._exit(0)
+        children.append(pid)
+    for pid in children:
+        assert os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+
+    segments = sorted(tmp_path.glob("events.jsonl.2*"))
+    assert segments, "no rotation happened"
+    records = _records(*segments, path)
+    assert len(records) == 6 * 400
+    for writer in range(6):
+        assert [r["i"] for r in records if r["writer"] == writer] == list(range(400))
@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import background, runner, state
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(runner, "_HANDLERS", {})
+    monkeypatch.setattr(state, "_path", tmp_path / "state.sqlite3")
+    return tmp_path / "state.sqlite3"
+
+
+def test_operations_are_namespaced_by_session(db: Path) -> None:
+    first, second = state.session_state("s1"), state.session_state("s2")
+    first.set("last_decision", {"tool": "Bash", "decision": "deny"})
+    assert first.increment("tool_calls") == 1
+    assert first.increment("tool_calls", 2) == 3
+    assert first.append("files", "a.py") == ["a.py"]
+    assert first.append("files", "b.py", max_items=1) == ["b.py"]
+
+    assert first.get("last_decision") == {"tool": "Bash", "decision": "deny"}
+    assert first.to_dict() == {
+        "last_decision": {"tool": "Bash", "decision": "deny"},
+        "tool_calls": 3,
+        "files": ["b.py"],
+    }
+    assert second.get("tool_calls", 0) == 0
+    first.delete("files")
+    assert "files" not in first.to_dict()
+
+
+def test_concurrent_increments_are_atomic(db: Path) -> None:
+    children = []
+    for _ in range(6):
+        pid = os.fork()
+        if pid == 0:
+            try:
+                session = state.session_state("s1")
+                for i in range(50):
+                    session.increment("tool_calls")
+                    session.append("seen", os.getpid(), max_items=1000)
+            finally:
+                os._exit(0)
+        children.append(pid)
+    for pid in children:
+        os.waitpid(pid, 0)
+
+    session = state.session_state("s1")
+    assert session.get("tool_calls") == 300
+    assert len(session.get("seen")) == 300
+
+
+def test_session_end_drops_its_state_and_expired_sessions(db: Path, base_payload: dict[str, Any]) -> None:
+    state.enable_session_state(db, ttl=60)
+    state.session_state("sess_123").set("count", 1)
+    state.session_state("other").set("count", 1)
+    state.session_state("abandoned").set("count", 1)
+    state._connect(db).execute("UPDATE state SET updated = ? WHERE session = 'abandoned'", (time.time() - 120,))
+
+    seen: list[Any] = []
+
+    @runner.hook("SessionEnd")
+    def report(input: Any) -> None:
+        seen.append(state.session_state(input).get("count"))
+
+    payload = {**base_payload, "hook_event_name": "SessionEnd", "reason": "exit"}
+    assert runner._dispatch(json.dumps(payload).encode()) == (0, b"", "")
+    assert seen == [1]
+    assert state.session_state("sess_123").get("count") == 1
+    for task in background.take_tasks():
+        task()
+
+    assert state.session_state("sess_123").to_dict() == {}
+    assert state.session_state("abandoned").to_dict() == {}
+    assert state.session_state("other").get("count") == 1
+
+
+def test_reads_are_fast(db: Path) -> None:
+    session = state.session_state("s1")
+    session.set("tool_calls", 1)
+    start = time.perf_counter()
+    for _ in range(1000):
+        session.get("tool_calls")
+    assert (time.perf_counter() - start) / 1000 < 0.001
+
+
+def test_concurrent_handlers_keep_their_transactions_apart(db: Path, dispatch: Any) -> None:
+    # Sync handlers of one event run on threads of the same process.
+    barrier = threading.Barrier(2)
+
+    def count(input: Any, key: str) -> None:
+        barrier.wait(timeout=5)
+        for _ in range(50):
+            state.session_state(input).update(key, lambda value: value + 1, 0)
+
+    @runner.hook("UserPromptSubmit")
+    def first(input: Any) -> None:
+        count(input, "first")
+
+    @runner.hook("UserPromptSubmit")
+    def second(input: Any) -> None:
+        count(input, "second")
+
+    for _ in range(10):
+        assert dispatch("UserPromptSubmit", prompt="go") == (0, None, "")
+    assert state.session_state("sess_123").to_dict() == {"first": 500, "second": 500}
@@ -0,0 +1,89 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cc_hooks import transcript
+from cc_hooks.models import StopInput, SubagentStopInput
+from cc_hooks.transcript import Transcript
+
+
+@pytest.fixture
+def index_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv(transcript.ENV_INDEX_DIR, str(tmp_path / "index"))
+    return tmp_path / "index"
+
+
+def _append(path: Path, *records: Any, partial: str = "") -> None:
+    with open(path, "a", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+        f.write(partial)
+
+
+def test_tail_and_streaming_skip_the_line_being_written(tmp_path: Path, index_dir: Path) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, *({"n": n} for n in range(5)), partial='{"n": 5, "text": "half')
+    log = Transcript(path)
+
+    assert log.tail(2) == [{"n": 3}, {"n": 4}]
+    assert log.tail(10) == [{"n": n} for n in range(5)]
+    assert [record["n"] for record in log] == [0, 1, 2, 3, 4]
+    assert [record["n"] for record in log.records(-2)] == [3, 4]
+    assert (len(log), log[1], log[-1]) == (5, {"n": 1}, {"n": 4})
+
+    _append(path, partial='written"}\n\n')
+    assert log.tail(1) == [{"n": 5, "text": "halfwritten"}]
+    assert len(log) == 7
+
+
+def test_index_is_persisted_and_extended_incrementally(
+    tmp_path: Path, index_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "t.jsonl"
+    _append(path, *({"n": n} for n in range(100)))
+    assert len(Transcript(path)) == 100
+
+    scanned: list[tuple[int, int]] = []
+    scan = transcript._scan
+
+    def recording_scan(data: Any, start: int, end: int, ends: Any) -> Any:
+        scanned.append((start, end))
+        return scan(data, start, end, ends)
+
+    monkeypatch.setattr(transcript, "_scan", recording_scan)
+    size = path.stat().st_size
+    _append(path, {"n": 100})
+    log = Transcript(path)
+    assert len(log) == 101 and log[-1] == {"n": 100}
+    assert scanned == [(size, path.stat().st_size)]
+
+    path.write_text(json.dumps({"n": "rewritten"}) + "\n")
+    assert list(Transcript(path)) == [{"n": "rewritten"}]
+
+
+def test_inputs_expose_their_transcripts(tmp_path: Path, index_dir: Path, base_payload: dict[str, Any]) -> None:
+    main, agent = tmp_path / "main.jsonl", tmp_path / "agent.jsonl"
+    _append(main, {"type": "user"}, {"type": "assistant"})
+    _append(agent, {"type": "assistant", "agent": True})
+
+    stop = StopInput.model_validate(
+        {**base_payload, "hook_event_name": "Stop", "transcript_path": str(main), "stop_hook_active": False}
+    )
+    assert stop.transcript().tail(1) == [{"type": "assistant"}]
+    assert stop.transcript() is stop.transcript()
+
+    subagent = SubagentStopInput.model_validate(
+        {
+            **base_payload,
+            "hook_event_name": "SubagentStop",
+            "transcript_path": str(main),
+            "stop_hook_active": False,
+            "agent_id": "a1",
+            "agent_type": "general-purpose",
+            "agent_transcript_path": str(agent),
+        }
+    )
+    assert list(subagent.agent_transcript()) == [{"type": "assistant", "agent": True}]
+    assert os.listdir(index_dir)